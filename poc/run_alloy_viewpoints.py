@@ -0,0 +1,52 @@
+import sys
+import argparse
+from pathlib import Path
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.infrastructure.alloy_runner import AlloyRunner, write_summary
+
+# Configuration
+MODELS_DIR = project_root / "poc" / "intermediates"
+SUMMARY_PATH = project_root / "poc" / "alloy_summary.json"
+CACHE_DIR = project_root / ".alloy_cache"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check generated Alloy models in parallel"
+    )
+    parser.add_argument("directory", nargs="?", default=str(MODELS_DIR))
+    parser.add_argument("--pattern", default="verify_*.als")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument(
+        "--timeout", type=float, default=120.0, help="seconds per model"
+    )
+    parser.add_argument("--jar", default=None, help="Alloy dist jar (or ALLOY_JAR)")
+    parser.add_argument("--summary", default=str(SUMMARY_PATH))
+    parser.add_argument("--no-cache", action="store_true")
+    args = parser.parse_args()
+
+    runner = AlloyRunner(
+        jar_path=args.jar,
+        max_workers=args.workers,
+        timeout_seconds=args.timeout,
+        cache_dir=None if args.no_cache else str(CACHE_DIR),
+    )
+    results = runner.run_directory(args.directory, args.pattern)
+    summary = write_summary(results, args.summary)
+
+    for result in results:
+        source = "cached" if result.cached else f"{result.elapsed_seconds:.1f} s"
+        print(f"  {Path(result.path).name}: {result.status.value} ({source})")
+        if result.message:
+            print(f"      {result.message.splitlines()[0]}")
+    totals = ", ".join(f"{k}={v}" for k, v in summary["totals"].items() if v)
+    print(f"\n{summary['total']} model(s): {totals}")
+    print(f"Summary written to {args.summary}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.domain.services import GraphAnalysisService
+from src.infrastructure.graph_loader import load_requirement_graph
+
+# Configuration
+DEFAULT_PATHS = [
+    project_root / "requirements" / "smart_lock_extracted.json",
+    project_root / "poc" / "intermediates" / "agv_structure.json",
+]
+
+
+def main():
+    paths = [Path(p) for p in sys.argv[1:]] or DEFAULT_PATHS
+    service = GraphAnalysisService()
+
+    for path in paths:
+        if not path.exists():
+            print(f"Error: {path} not found.")
+            continue
+
+        graph = load_requirement_graph(str(path))
+        started = time.perf_counter()
+        defects = service.analyze(graph)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        print(
+            f"\n{path.name}: {len(graph.nodes)} nodes, {len(graph.edges)} edges "
+            f"-> {len(defects)} structural defect(s) in {elapsed_ms:.1f} ms"
+        )
+        for defect in service.to_defects(defects):
+            print(
+                f"  [{defect.id}] {defect.category.value} ({defect.severity.value}): "
+                f"{defect.description}"
+            )
+
+
+if __name__ == "__main__":
+    main()
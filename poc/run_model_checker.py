@@ -0,0 +1,71 @@
+import sys
+import json
+import time
+from pathlib import Path
+
+# Add src to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.infrastructure.model_checker import (
+    ModelChecker,
+    default_properties,
+    properties_from_viewpoints,
+)
+from src.infrastructure.state_machine_model import model_from_dict
+
+# Configuration
+DEFAULT_PATHS = [
+    project_root
+    / "requirements"
+    / "samples"
+    / "02_missing_else_thermostat_extracted.json",
+    project_root / "requirements" / "samples" / "03_conflict_robot_extracted.json",
+    project_root / "requirements" / "smart_lock_extracted.json",
+    project_root / "poc" / "intermediates" / "agv_structure.json",
+]
+VIEWPOINTS_PATH = project_root / "poc" / "intermediates" / "generated_viewpoints.json"
+CACHE_DIR = project_root / ".model_checker_cache"
+
+
+def main():
+    paths = [Path(p) for p in sys.argv[1:]] or DEFAULT_PATHS
+    checker = ModelChecker(cache_dir=str(CACHE_DIR))
+    viewpoints = []
+    if VIEWPOINTS_PATH.exists():
+        with open(VIEWPOINTS_PATH, "r", encoding="utf-8") as f:
+            viewpoints = json.load(f).get("viewpoints", [])
+
+    for path in paths:
+        if not path.exists():
+            print(f"Error: {path} not found.")
+            continue
+
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        model = model_from_dict(data)
+        properties = default_properties(model) + properties_from_viewpoints(
+            viewpoints, model
+        )
+
+        started = time.perf_counter()
+        results = checker.check(data, properties)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        cached = sum(r.cached for r in results)
+        print(
+            f"\n{path.name}: {len(results)} properties ({cached} cached) "
+            f"checked in {elapsed_ms:.1f} ms"
+        )
+        for result in results:
+            if result.holds:
+                continue
+            print(f"  [{result.property_id}] {result.message}")
+            for step in result.trace:
+                print(f"      {step}")
+            if result.assignment:
+                print(f"      inputs: {result.assignment}")
+
+
+if __name__ == "__main__":
+    main()
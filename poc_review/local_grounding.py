@@ -0,0 +1,188 @@
+"""
+ローカル根拠確認 (Local Grounding)
+
+Step 2 (Grounding) の「指摘の対象箇所が要件定義書に実在するか」を
+LLMを使わずに判定する。
+
+  - 正規化: NFKC + 空白除去 + 小文字化（全角/半角・改行位置の揺れを吸収）
+  - 完全一致: 正規化済み全文に対する部分文字列検索
+  - あいまい一致: 文字 n-gram 索引で候補位置を絞り込み、difflib で類似度を計算
+
+スコアが閾値以上の候補はローカルで根拠確認済みとし、
+閾値未満の候補だけを LLM に回す。
+"""
+
+import re
+import unicodedata
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, Any, List, Tuple
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.+)$")
+
+# 引用符・括弧の表記揺れ（LLMが付け外ししやすいもの）は照合対象から外す
+_IGNORED_CHARS = set("「」『』“”‘’\"'`*")
+
+
+def normalize_with_offsets(text: str) -> Tuple[str, List[int]]:
+    """
+    照合用に正規化した文字列と、正規化後の各文字が元テキストの何文字目に
+    由来するかの対応表を返す
+    """
+    chars: List[str] = []
+    offsets: List[int] = []
+    for i, ch in enumerate(text):
+        for c in unicodedata.normalize("NFKC", ch).lower():
+            if c.isspace() or c in _IGNORED_CHARS:
+                continue
+            chars.append(c)
+            offsets.append(i)
+    return "".join(chars), offsets
+
+
+def normalize(text: str) -> str:
+    return normalize_with_offsets(text)[0]
+
+
+class LocalGroundingIndex:
+    """
+    要件定義書全文の文字 n-gram 索引
+
+    日本語は単語境界が空白で区切られないため、形態素解析ではなく
+    文字 n-gram (既定は bigram) で索引を作る。
+    """
+
+    # 出現位置がこれより多い n-gram（「する」「ます」等）は候補の絞り込みに使わない
+    MAX_POSTINGS = 500
+    # あいまい一致で詳細比較する候補位置の数
+    MAX_CANDIDATES = 8
+
+    def __init__(self, document: str, ngram: int = 2):
+        self.document = document
+        self.ngram = ngram
+        self.text, self.offsets = normalize_with_offsets(document)
+
+        self.postings: Dict[str, List[int]] = defaultdict(list)
+        for i in range(len(self.text) - ngram + 1):
+            self.postings[self.text[i : i + ngram]].append(i)
+
+        # 位置 → 行番号・見出しの対応
+        self.line_starts: List[int] = []
+        self.headings: List[Tuple[int, str]] = []
+        line_start = 0
+        for line_no, line in enumerate(document.split("\n"), start=1):
+            self.line_starts.append(line_start)
+            line_start += len(line) + 1
+            match = _HEADING.match(line)
+            if match:
+                self.headings.append((line_no, match.group(2).strip()))
+
+    def match(self, query: str) -> Dict[str, Any]:
+        """
+        query に最もよく一致する箇所を探す
+
+        Returns:
+            {"score": 0.0-1.0, "quote": 原文の該当行, "location": "見出し (L行番号)",
+             "method": "exact" | "fuzzy" | "none"}
+        """
+        q = normalize(query)
+        if not q:
+            return self._no_match()
+
+        pos = self.text.find(q)
+        if pos >= 0:
+            return self._result(1.0, pos, pos + len(q), "exact")
+
+        best = (0.0, 0, 0)
+        for start in self._candidate_starts(q):
+            score, span_start, span_end = self._align(q, start)
+            if score > best[0]:
+                best = (score, span_start, span_end)
+
+        score, span_start, span_end = best
+        if score <= 0.0:
+            return self._no_match()
+        return self._result(score, span_start, span_end, "fuzzy")
+
+    def _candidate_starts(self, q: str) -> List[int]:
+        """n-gram の投票で、query の開始位置としてありそうな位置を選ぶ"""
+        n = self.ngram
+        grams = [(j, q[j : j + n]) for j in range(max(1, len(q) - n + 1))]
+        usable = [
+            (j, g)
+            for j, g in grams
+            if 0 < len(self.postings.get(g, ())) <= self.MAX_POSTINGS
+        ]
+        if not usable:
+            usable = [(j, g) for j, g in grams if g in self.postings]
+
+        # 開始位置を少し粗く丸めて投票し、多少の挿入・削除に耐えるようにする
+        bucket = max(1, len(q) // 8)
+        votes: Counter = Counter()
+        for j, g in usable:
+            for p in self.postings[g]:
+                votes[max(0, p - j) // bucket] += 1
+
+        return [b * bucket for b, _ in votes.most_common(self.MAX_CANDIDATES)]
+
+    def _align(self, q: str, start: int) -> Tuple[float, int, int]:
+        """候補位置の周辺と query を比較し、(類似度, 一致範囲の開始, 終了) を返す"""
+        slack = max(8, len(q) // 4)
+        lo = max(0, start - slack)
+        hi = min(len(self.text), start + len(q) + slack)
+        region = self.text[lo:hi]
+
+        blocks = [
+            b
+            for b in SequenceMatcher(
+                None, q, region, autojunk=False
+            ).get_matching_blocks()
+            if b.size
+        ]
+        if not blocks:
+            return 0.0, lo, lo
+        span_start = lo + blocks[0].b
+        span_end = lo + blocks[-1].b + blocks[-1].size
+        matched = sum(b.size for b in blocks)
+        score = 2.0 * matched / (len(q) + (span_end - span_start))
+        return score, span_start, span_end
+
+    def _result(
+        self, score: float, norm_start: int, norm_end: int, method: str
+    ) -> Dict[str, Any]:
+        start = self.offsets[norm_start]
+        end = self.offsets[max(norm_start, norm_end - 1)] + 1
+
+        # 引用は一致範囲を含む行全体（原文のまま）とする
+        first_line = bisect_right(self.line_starts, start)
+        last_line = bisect_right(self.line_starts, end - 1)
+        quote_start = self.line_starts[first_line - 1]
+        quote_end = (
+            self.line_starts[last_line] - 1
+            if last_line < len(self.line_starts)
+            else len(self.document)
+        )
+        return {
+            "score": round(score, 3),
+            "quote": self.document[quote_start:quote_end].strip(),
+            "location": self._location(first_line, last_line),
+            "method": method,
+        }
+
+    def _location(self, first_line: int, last_line: int) -> str:
+        lines = (
+            f"L{first_line}"
+            if first_line == last_line
+            else f"L{first_line}-{last_line}"
+        )
+        heading = None
+        for line_no, title in self.headings:
+            if line_no > first_line:
+                break
+            heading = title
+        return f"{heading} ({lines})" if heading else lines
+
+    @staticmethod
+    def _no_match() -> Dict[str, Any]:
+        return {"score": 0.0, "quote": "", "location": "", "method": "none"}
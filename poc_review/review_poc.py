@@ -3,8 +3,8 @@
 
 設計書: poc/review_poc_design.md
 処理フロー:
-  1. Section-wise Split: ドキュメントをセクション分割
-  2. 各観点について:
+  1. Section-wise Split: ドキュメントを推定トークン数でセクション分割
+  2. 観点 × セクションごとに（チェーン単位で並列実行）:
      - Step 1 (Scan): セクション単位で候補抽出
      - Step 2 (Grounding): 全文で引用確認
      - Step 3 (Falsification): 全文で反証
@@ -12,18 +12,22 @@
 """
 
 import sys
-import sys
+import argparse
+import threading
 from datetime import datetime
-import re
 import json
 from pathlib import Path
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Callable, Optional
 
 # プロジェクトルートをパスに追加
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.infrastructure.llm_gateway import LLMGatewayImpl
+from src.infrastructure.llm_gateway import LLMGatewayImpl, PARSE_ERROR_SUMMARY
+from src.infrastructure.section_chunker import SectionChunker
+from poc_review.local_grounding import LocalGroundingIndex
+from poc_review.run_store import RunStore, content_hash
 
 
 def safe_print(text: str) -> None:
@@ -46,9 +50,30 @@ class RequirementReviewer:
         "5_unstated_side_effects",
     ]
 
-    def __init__(self):
+    def __init__(
+        self,
+        batch_size: int = 8,
+        local_grounding_threshold: float = 0.85,
+        workers: int = 8,
+        run_store: Optional[RunStore] = None,
+        section_tokens: int = 6000,
+        section_overlap_tokens: int = 200,
+    ):
         self.llm = LLMGatewayImpl()
         self.prompts_dir = Path(__file__).parent / "prompts"
+        # Step 2/3 で1回のLLM呼び出しにまとめる候補数 (1 以下で候補ごとに呼び出す)
+        self.batch_size = batch_size
+        # ローカル照合のスコアがこの値以上ならLLMを呼ばずに根拠確認済みとする (1 超で無効)
+        self.local_grounding_threshold = local_grounding_threshold
+        self._grounding_index = None
+        # 観点 × セクションのチェーンを並列実行するワーカー数
+        self.workers = workers
+        # 設定されていれば各ステップの結果を保存し、再実行時に再利用する
+        self.run_store = run_store
+        # LLMの失敗による代替値を返したかをスレッドごとに記録（代替値を含む結果は保存しない）
+        self._llm_state = threading.local()
+        # Step 1 に渡すセクションの推定トークン数の上限と、前セクション末尾の重複量
+        self.chunker = SectionChunker(section_tokens, section_overlap_tokens)
 
     def load_prompt(self, filename: str) -> str:
         """プロンプトファイルを読み込む"""
@@ -60,73 +85,6 @@ class RequirementReviewer:
         path = self.prompts_dir / "viewpoints" / f"{viewpoint}.md"
         return path.read_text(encoding="utf-8")
 
-    def split_by_heading(
-        self, text: str, level: int = 2, chunk_size: int = 300
-    ) -> List[Dict[str, str]]:
-        """Markdownをセクション分割し、指定行数になるべく近づけるように結合"""
-        pattern = r"^(#{" + str(level) + r"})\s+(.+)$"
-        raw_sections = []
-        current_title = "Introduction"
-        current_content = []
-
-        # まず最小単位（見出し）で分割
-        for line in text.split("\n"):
-            match = re.match(pattern, line)
-            if match:
-                if current_content:
-                    raw_sections.append(
-                        {"title": current_title, "content": "\n".join(current_content)}
-                    )
-                current_title = match.group(2)
-                current_content = [line]
-            else:
-                current_content.append(line)
-
-        if current_content:
-            raw_sections.append(
-                {"title": current_title, "content": "\n".join(current_content)}
-            )
-
-        # 指定サイズになるまで結合
-        merged_sections = []
-        current_chunk_content = []
-        current_chunk_titles = []
-        current_chunk_len = 0
-
-        for section in raw_sections:
-            section_len = len(section["content"].split("\n"))
-
-            # 最初のセクション、または追加してもサイズ超過しない場合は追加
-            if current_chunk_len == 0 or (
-                current_chunk_len + section_len <= chunk_size * 1.2
-            ):  # 20%のバッファを許容
-                current_chunk_content.append(section["content"])
-                current_chunk_titles.append(section["title"])
-                current_chunk_len += section_len
-            else:
-                # サイズ超過する場合は現在のチャンクを確定
-                merged_sections.append(
-                    {
-                        "title": " + ".join(current_chunk_titles),
-                        "content": "\n\n".join(current_chunk_content),
-                    }
-                )
-                # 新しいチャンクを開始
-                current_chunk_content = [section["content"]]
-                current_chunk_titles = [section["title"]]
-                current_chunk_len = section_len
-
-        # 残りのチャンクを追加
-        if current_chunk_content:
-            merged_sections.append(
-                {
-                    "title": " + ".join(current_chunk_titles),
-                    "content": "\n\n".join(current_chunk_content),
-                }
-            )
-
-        return merged_sections
-
     def step1_scan(self, section_text: str, viewpoint: str) -> List[Dict[str, Any]]:
         """Step 1: 構造抽出と初期レビュー"""
         prompt_template = self.load_prompt("step1_scan.md")
@@ -142,7 +100,7 @@ class RequirementReviewer:
         result = self._call_llm(prompt, temperature=0.0)
         if isinstance(result, list):
             return result
-        return []
+        return self._placeholder([])
 
     def step2_grounding(
         self, full_document: str, candidate: Dict[str, Any]
@@ -158,9 +116,11 @@ class RequirementReviewer:
         prompt = prompt.replace("{full_document}", full_document)
 
         result = self._call_llm(prompt)
-        if isinstance(result, dict):
+        if isinstance(result, dict) and "is_grounded" in result:
             return result
-        return {"id": candidate.get("id"), "is_grounded": False, "quote": ""}
+        return self._placeholder(
+            {"id": candidate.get("id"), "is_grounded": False, "quote": ""}
+        )
 
     def step3_falsification(
         self, full_document: str, candidate: Dict[str, Any], quote: str
@@ -171,19 +131,139 @@ class RequirementReviewer:
         prompt = prompt_template.replace(
             "{target_text}", candidate.get("target_text", "")
         )
-        prompt = prompt_template.replace("{reason}", candidate.get("reason", ""))
+        prompt = prompt.replace("{reason}", candidate.get("reason", ""))
         prompt = prompt.replace("{quote}", quote)
         prompt = prompt.replace("{id}", candidate.get("id", ""))
         prompt = prompt.replace("{full_document}", full_document)
 
         result = self._call_llm(prompt)
-        if isinstance(result, dict):
+        if isinstance(result, dict) and "is_valid" in result:
             return result
-        return {
-            "id": candidate.get("id"),
-            "is_valid": True,
-            "final_reason": candidate.get("reason", ""),
-        }
+        return self._placeholder(
+            {
+                "id": candidate.get("id"),
+                "is_valid": True,
+                "final_reason": candidate.get("reason", ""),
+            }
+        )
+
+    def step2_grounding_local(
+        self, full_document: str, candidates: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Step 2: 根拠確認（ローカル照合で確定できない候補のみLLMで確認）"""
+        if (
+            self._grounding_index is None
+            or self._grounding_index.document is not full_document
+        ):
+            self._grounding_index = LocalGroundingIndex(full_document)
+
+        results: List[Any] = []
+        pending = []
+        for candidate in candidates:
+            match = self._grounding_index.match(candidate.get("target_text", ""))
+            if match["score"] >= self.local_grounding_threshold:
+                results.append(
+                    {
+                        "id": candidate.get("id"),
+                        "is_grounded": True,
+                        "source": "local",
+                        "quote": match["quote"],
+                        "location": match["location"],
+                        "note": f"ローカル照合 ({match['method']}, score={match['score']})",
+                    }
+                )
+            else:
+                results.append(None)
+                pending.append(candidate)
+
+        if pending:
+            llm_results = iter(self.step2_grounding_batch(full_document, pending))
+            results = [r if r is not None else next(llm_results) for r in results]
+        return results
+
+    def step2_grounding_batch(
+        self, full_document: str, candidates: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Step 2: 根拠確認（複数候補を1回の呼び出しでまとめて確認）"""
+        return self._run_batched(
+            "step2_grounding_batch.md",
+            full_document,
+            candidates,
+            to_payload=lambda c: {
+                "target_text": c.get("target_text", ""),
+                "reason": c.get("reason", ""),
+            },
+            required_key="is_grounded",
+            fallback=lambda c: self.step2_grounding(full_document, c),
+        )
+
+    def step3_falsification_batch(
+        self, full_document: str, candidates: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Step 3: 反証（複数候補を1回の呼び出しでまとめて検証）"""
+        return self._run_batched(
+            "step3_falsification_batch.md",
+            full_document,
+            candidates,
+            to_payload=lambda c: {
+                "target_text": c.get("target_text", ""),
+                "reason": c.get("reason", ""),
+                "quote": c.get("quote", ""),
+            },
+            required_key="is_valid",
+            fallback=lambda c: self.step3_falsification(
+                full_document, c, c.get("quote", "")
+            ),
+        )
+
+    def _run_batched(
+        self,
+        prompt_file: str,
+        full_document: str,
+        candidates: List[Dict[str, Any]],
+        to_payload: Callable[[Dict[str, Any]], Dict[str, Any]],
+        required_key: str,
+        fallback: Callable[[Dict[str, Any]], Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """候補を batch_size 件ずつまとめて判定し、候補と同じ順序で結果を返す。
+
+        候補IDはセクション間で重複しうるため、バッチ内では連番の key で対応付ける。
+        結果を解析できなかった候補は1件ずつの呼び出しにフォールバックする。
+        """
+        if self.batch_size <= 1:
+            return [fallback(c) for c in candidates]
+
+        prompt_template = self.load_prompt(prompt_file)
+        results = []
+        for start in range(0, len(candidates), self.batch_size):
+            batch = candidates[start : start + self.batch_size]
+            payload = [
+                {"key": f"c{i + 1}", **to_payload(c)} for i, c in enumerate(batch)
+            ]
+            prompt = prompt_template.replace(
+                "{candidates}", json.dumps(payload, ensure_ascii=False, indent=2)
+            )
+            prompt = prompt.replace("{full_document}", full_document)
+
+            response = self._call_llm(prompt)
+            by_key = {}
+            if isinstance(response, list):
+                for item in response:
+                    if isinstance(item, dict) and required_key in item:
+                        by_key[str(item.get("key"))] = item
+
+            for i, candidate in enumerate(batch):
+                item = by_key.get(f"c{i + 1}")
+                if item is None:
+                    print(
+                        f"  [WARN] {candidate.get('id')}: バッチ結果を解析できないため個別に再判定"
+                    )
+                    results.append(fallback(candidate))
+                    continue
+                result = {k: v for k, v in item.items() if k != "key"}
+                result["id"] = candidate.get("id")
+                results.append(result)
+        return results
 
     def cross_reference_check(self, defects: List[Dict[str, Any]]) -> Dict[str, Any]:
         """欠陥間の相互参照分析"""
@@ -199,72 +279,101 @@ class RequirementReviewer:
         prompt = prompt_template.replace("{defect_list}", defect_list)
 
         result = self._call_llm(prompt)
-        if isinstance(result, dict):
+        if isinstance(result, dict) and "groups" in result:
             return result
-        return {
-            "groups": [],
-            "standalone_defects": [d["id"] for d in defects],
-            "summary": "分析できませんでした。",
-        }
+        return self._placeholder(
+            {
+                "groups": [],
+                "standalone_defects": [d["id"] for d in defects],
+                "summary": "分析できませんでした。",
+            }
+        )
 
-    def review_viewpoint(
-        self, full_document: str, sections: List[Dict[str, str]], viewpoint: str
+    def review_section(
+        self, full_document: str, section: Dict[str, str], viewpoint: str
     ) -> List[Dict[str, Any]]:
-        """1つの観点についてレビューを実行"""
-        print(f"\n{'='*60}")
-        print(f"観点: {viewpoint}")
-        print(f"{'='*60}")
-
-        all_candidates = []
-
-        # Step 1: セクション単位でスキャン
-        print("\n[Step 1: Scan]")
-        for section in sections:
-            print(f"  - セクション: {section['title']}")
-            candidates = self.step1_scan(section["content"], viewpoint)
-            for c in candidates:
-                c["section"] = section["title"]
-            all_candidates.extend(candidates)
-
-        suspected = [c for c in all_candidates if c.get("status") == "Suspected"]
-        print(f"  → 候補数: {len(suspected)}")
-
+        """1つの観点 × 1セクションについて Scan → Grounding → Falsification を実行"""
+        tag = f"[{viewpoint} / {section['title'][:30]}]"
+
+        info = {"viewpoint": viewpoint, "section": section["title"]}
+
+        # Step 1: Scan
+        candidates = self._checkpointed(
+            "scan",
+            [
+                self.load_prompt("step1_scan.md"),
+                self.load_viewpoint(viewpoint),
+                section["content"],
+            ],
+            lambda: self.step1_scan(section["content"], viewpoint),
+            **info,
+        )
+        for c in candidates:
+            c["section"] = section["title"]
+        suspected = [c for c in candidates if c.get("status") == "Suspected"]
+        safe_print(f"  {tag} Scan: 候補数 {len(suspected)}")
         if not suspected:
             return []
 
         # Step 2: Grounding
-        print("\n[Step 2: Grounding]")
         grounded = []
-        for candidate in suspected:
-            result = self.step2_grounding(full_document, candidate)
+        grounding_results = self._checkpointed(
+            "grounding",
+            [
+                self.load_prompt("step2_grounding.md"),
+                self.load_prompt("step2_grounding_batch.md"),
+                content_hash(full_document),
+                suspected,
+                self.local_grounding_threshold,
+            ],
+            lambda: self.step2_grounding_local(full_document, suspected),
+            **info,
+        )
+        for candidate, result in zip(suspected, grounding_results):
             if result.get("is_grounded"):
                 candidate["quote"] = result.get("quote", "")
+                if result.get("location"):
+                    candidate["location"] = result["location"]
                 grounded.append(candidate)
-                print(f"  [OK] {candidate['id']}: 根拠確認OK")
+                note = f" ({result['note']})" if result.get("source") == "local" else ""
+                safe_print(f"  {tag} [OK] {candidate['id']}: 根拠確認OK{note}")
             else:
-                print(f"  [NG] {candidate['id']}: 根拠なし (破棄)")
-
+                safe_print(f"  {tag} [NG] {candidate['id']}: 根拠なし (破棄)")
         if not grounded:
             return []
 
         # Step 3: Falsification
-        print("\n[Step 3: Falsification]")
         confirmed = []
-        for candidate in grounded:
-            result = self.step3_falsification(
-                full_document, candidate, candidate.get("quote", "")
-            )
+        falsification_results = self._checkpointed(
+            "falsification",
+            [
+                self.load_prompt("step3_falsification.md"),
+                self.load_prompt("step3_falsification_batch.md"),
+                content_hash(full_document),
+                grounded,
+            ],
+            lambda: self.step3_falsification_batch(full_document, grounded),
+            **info,
+        )
+        for candidate, result in zip(grounded, falsification_results):
             if result.get("is_valid"):
                 candidate["final_reason"] = result.get(
                     "final_reason", candidate.get("reason", "")
                 )
+                candidate["viewpoint"] = viewpoint
                 confirmed.append(candidate)
-                print(f"  [OK] {candidate['id']}: 欠陥確定")
+                safe_print(f"  {tag} [OK] {candidate['id']}: 欠陥確定")
             else:
-                print(f"  [NG] {candidate['id']}: 反証により無効化")
+                safe_print(f"  {tag} [NG] {candidate['id']}: 反証により無効化")
 
         return confirmed
 
+    def review_viewpoint(
+        self, full_document: str, sections: List[Dict[str, str]], viewpoint: str
+    ) -> List[Dict[str, Any]]:
+        """1つの観点についてレビューを実行"""
+        return self._run_pipeline(full_document, sections, [viewpoint])
+
     def review_document(self, document_path: str) -> Dict[str, Any]:
         """ドキュメント全体をレビュー"""
         print(f"\n{'#'*60}")
@@ -275,40 +384,134 @@ class RequirementReviewer:
         # ドキュメント読み込み
         full_document = Path(document_path).read_text(encoding="utf-8")
 
+        if self.run_store is not None:
+            self.run_store.start(document_path, content_hash(full_document))
+            state = "再開" if self.run_store.resumed else "新規"
+            print(f"# 実行ID: {self.run_store.run_id} ({state})")
+            print(f"# 保存先: {self.run_store.run_dir}")
+
         # セクション分割
-        sections = self.split_by_heading(full_document, level=2)
+        sections = [c.to_dict() for c in self.chunker.split(full_document)]
         print(f"\nセクション数: {len(sections)}")
         for s in sections:
-            print(f"  - {s['title']}")
+            print(f"  - [{s['id']}] {s['title']} ({s['tokens']} tokens)")
 
-        # 各観点でレビュー
-        all_defects = []
-        for viewpoint in self.VIEWPOINTS:
-            defects = self.review_viewpoint(full_document, sections, viewpoint)
-            for d in defects:
-                d["viewpoint"] = viewpoint
-            all_defects.extend(defects)
+        # 全観点 × 全セクションを並列にレビュー
+        print(f"\n{'='*60}")
+        print(
+            f"Review: {len(self.VIEWPOINTS)} 観点 × {len(sections)} セクション "
+            f"(workers={self.workers})"
+        )
+        print(f"{'='*60}")
+        all_defects = self._run_pipeline(full_document, sections, self.VIEWPOINTS)
 
         # Cross-Reference Check
         print(f"\n{'='*60}")
         print("Cross-Reference Check")
         print(f"{'='*60}")
-        cross_ref = self.cross_reference_check(all_defects)
+        cross_ref = self._checkpointed(
+            "cross_reference",
+            [self.load_prompt("step4_cross_reference.md"), all_defects],
+            lambda: self.cross_reference_check(all_defects),
+        )
 
-        return {
+        result = {
             "total_defects": len(all_defects),
             "defects": all_defects,
             "cross_reference": cross_ref,
         }
+        if self.run_store is not None:
+            self.run_store.save("result", "review", result)
+            print(
+                f"\nチェックポイント: 再利用 {self.run_store.hits} 件 / "
+                f"新規保存 {self.run_store.saved} 件"
+            )
+        return result
+
+    def _run_pipeline(
+        self,
+        full_document: str,
+        sections: List[Dict[str, str]],
+        viewpoints: List[str],
+    ) -> List[Dict[str, Any]]:
+        """
+        観点 × セクションごとの Scan → Grounding → Falsification を独立した
+        チェーンとしてワーカーで並列実行し、結果を観点・セクション順に並べて返す。
+        ステップ間の待ち合わせがないため、全体の所要時間は最も遅いチェーンで決まる。
+        """
+        # 索引はチェーン間で共有するため、並列実行の前に作っておく
+        self._grounding_index = LocalGroundingIndex(full_document)
+
+        chains = [(vp, section) for vp in viewpoints for section in sections]
+        pool = ThreadPoolExecutor(max_workers=max(1, self.workers))
+        futures = [
+            pool.submit(self.review_section, full_document, section, vp)
+            for vp, section in chains
+        ]
+        # futures は投入順なので、完了順に関わらず結果は観点・セクション順になる
+        results = []
+        try:
+            for (vp, section), future in zip(chains, futures):
+                try:
+                    results.extend(future.result())
+                except Exception as e:
+                    safe_print(f"  [ERROR] [{vp} / {section['title'][:30]}] {e}")
+        except KeyboardInterrupt:
+            # 未着手のチェーンは破棄する（完了済みのステップは保存済み）
+            pool.shutdown(wait=False, cancel_futures=True)
+            if self.run_store is not None:
+                print(
+                    f"\n中断しました。--run-id {self.run_store.run_id} で再開できます"
+                )
+            raise
+        pool.shutdown()
+        return results
+
+    def _checkpointed(
+        self,
+        step: str,
+        key_parts: List[Any],
+        compute: Callable[[], Any],
+        **info: Any,
+    ) -> Any:
+        """
+        run_store が設定されていれば、入力 (key_parts) が同じ保存済みの結果を
+        再利用する。新しく計算した結果は、LLMの失敗による代替値を含まない場合のみ保存する。
+        """
+        if self.run_store is None:
+            return compute()
+
+        key = content_hash(step, *key_parts)
+        saved = self.run_store.load(step, key)
+        if saved is not None:
+            return saved
+
+        self._llm_state.failed = False
+        result = compute()
+        if not self._llm_state.failed:
+            self.run_store.save(step, key, result, **info)
+        return result
+
+    def _placeholder(self, value: Any) -> Any:
+        """
+        LLMの結果が得られなかったときの代替値を返す。代替値を含む結果は
+        チェックポイントに保存せず、再開時に再実行する
+        """
+        self._llm_state.failed = True
+        return value
 
     def _call_llm(self, prompt: str, temperature: float = None) -> Any:
-        """LLMを呼び出してJSON結果を取得"""
+        """LLMを呼び出してJSON結果を取得（失敗・解析不能の場合は None）"""
         try:
             response_text = self.llm._call_llm_generic(prompt, temperature=temperature)
-            return self.llm._extract_json_block(response_text)
         except Exception as e:
             print(f"  [ERROR] LLM呼び出しエラー: {e}")
-            return {}
+            return None
+        result = self.llm._extract_json_block(response_text)
+        if isinstance(result, dict) and result.get("summary") == PARSE_ERROR_SUMMARY:
+            print("  [ERROR] LLMの応答をJSONとして解析できません")
+            return None
+        return result
 
 
 class ReviewReporter:
@@ -372,6 +575,8 @@ class ReviewReporter:
                     f"\n#### [{item.get('id', 'NoID')}] {item.get('target_text', '')[:30]}..."
                 )
                 lines.append(f"- **理由**: {item.get('reason')}")
+                if item.get("location"):
+                    lines.append(f"- **箇所**: {item.get('location')}")
                 if item.get("final_reason"):
                     lines.append(f"- **詳細分析**: {item.get('final_reason')}")
                 lines.append(
@@ -385,10 +590,54 @@ class ReviewReporter:
 
 def main():
     """メイン関数"""
+    parser = argparse.ArgumentParser(description="要件定義書レビュー PoC")
+    parser.add_argument(
+        "result_json", nargs="?", help="既存の結果JSONからレポートのみ生成する"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=8,
+        help="Step 2/3 で1回のLLM呼び出しにまとめる候補数 (1 で候補ごとに呼び出す)",
+    )
+    parser.add_argument(
+        "--local-grounding-threshold",
+        type=float,
+        default=0.85,
+        help="Step 2 でLLMを呼ばずに根拠確認済みとするローカル照合スコア (1 超で無効)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="観点 × セクションのレビューを並列実行するワーカー数 (1 で逐次実行)",
+    )
+    parser.add_argument(
+        "--run-id",
+        help="途中結果を保存する実行ID。既存の実行IDを指定すると完了済みのステップを再利用して再開する",
+    )
+    parser.add_argument(
+        "--runs-dir",
+        default=str(project_root / "poc_review" / "runs"),
+        help="実行ごとの途中結果を保存するディレクトリ",
+    )
+    parser.add_argument(
+        "--section-tokens",
+        type=int,
+        default=6000,
+        help="Step 1 で1回に渡すセクションの推定トークン数の上限",
+    )
+    parser.add_argument(
+        "--section-overlap-tokens",
+        type=int,
+        default=200,
+        help="各セクションの先頭に含める前セクション末尾の推定トークン数",
+    )
+    args = parser.parse_args()
 
     # 引数でJSONファイルが指定された場合はレポート生成のみ実行
-    if len(sys.argv) > 1:
-        json_path = Path(sys.argv[1])
+    if args.result_json:
+        json_path = Path(args.result_json)
         if json_path.exists() and json_path.suffix == ".json":
             print(f"JSONファイルからレポートを生成します: {json_path}")
             try:
@@ -402,7 +651,14 @@ def main():
                 print(f"エラー: レポート生成に失敗しました。 {e}")
                 return
 
-    reviewer = RequirementReviewer()
+    reviewer = RequirementReviewer(
+        batch_size=args.batch_size,
+        local_grounding_threshold=args.local_grounding_threshold,
+        workers=args.workers,
+        run_store=RunStore(Path(args.runs_dir), args.run_id),
+        section_tokens=args.section_tokens,
+        section_overlap_tokens=args.section_overlap_tokens,
+    )
 
     # サンプル要件定義書をレビュー
     sample_path = project_root / "requirements" / "agv_system_with_defects.md"
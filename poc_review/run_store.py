@@ -0,0 +1,101 @@
+"""
+レビュー実行のチェックポイント保存 (Run Store)
+
+各ステップ（観点 × セクションごとの Scan / Grounding / Falsification と
+Cross-Reference）の結果を完了した時点で実行ディレクトリに保存し、
+同じ実行IDで再実行したときに完了済みのステップを読み込んでスキップする。
+
+各結果は入力（プロンプトテンプレート・文書・前段の結果など）のハッシュを
+キーとして保存するため、文書やプロンプトが変わったステップは自動的に
+再実行される。
+"""
+
+import os
+import json
+import hashlib
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+
+def content_hash(*parts: Any) -> str:
+    """文字列・JSON化可能な値の組からハッシュを作る"""
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class RunStore:
+    """1回のレビュー実行のチェックポイントを保存するディレクトリ"""
+
+    def __init__(self, runs_dir: Path, run_id: Optional[str] = None):
+        self.run_id = run_id or datetime.now().strftime("%Y%m%d-%H%M%S")
+        self.run_dir = Path(runs_dir) / self.run_id
+        self.resumed = (self.run_dir / "manifest.json").exists()
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.saved = 0
+        self._lock = threading.Lock()
+
+    def start(self, document_path: str, document_hash: str) -> None:
+        """実行情報を記録する（再開時は文書の変更を検出して知らせる）"""
+        manifest_path = self.run_dir / "manifest.json"
+        if self.resumed:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            if manifest.get("document_hash") != document_hash:
+                print(
+                    "  [WARN] 前回の実行から文書が変更されています。"
+                    "影響を受けるステップは再実行します"
+                )
+        else:
+            manifest = {"run_id": self.run_id, "created_at": datetime.now().isoformat()}
+        manifest.update(
+            {
+                "document_path": document_path,
+                "document_hash": document_hash,
+                "updated_at": datetime.now().isoformat(),
+            }
+        )
+        self._write(manifest_path, manifest)
+
+    def load(self, step: str, key: str) -> Optional[Any]:
+        """保存済みの結果を返す。未実行、または入力が変わった場合は None"""
+        path = self._path(step, key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            # 未保存、または壊れたファイル（JSON・UTF-8として読めない）
+            return None
+        if not isinstance(entry, dict) or "result" not in entry:
+            return None
+        with self._lock:
+            self.hits += 1
+        return entry["result"]
+
+    def save(self, step: str, key: str, result: Any, **info: Any) -> None:
+        """ステップの結果を保存する。info は確認用にそのまま書き出す"""
+        entry = {
+            "step": step,
+            "key": key,
+            **info,
+            "saved_at": datetime.now().isoformat(),
+            "result": result,
+        }
+        self._write(self._path(step, key), entry)
+        with self._lock:
+            self.saved += 1
+
+    def _path(self, step: str, key: str) -> Path:
+        return self.run_dir / step / f"{key}.json"
+
+    @staticmethod
+    def _write(path: Path, data: Any) -> None:
+        # 途中で中断されても壊れたファイルが残らないように一時ファイル経由で置き換える
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(
+            f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        tmp_path.write_text(
+            json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+        os.replace(tmp_path, path)
@@ -0,0 +1,26 @@
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.getcwd())))
+
+from src.infrastructure.sqlite_repository import SqliteProjectRepository
+
+
+def main():
+    root_dir = sys.argv[1] if len(sys.argv) > 1 else os.getcwd()
+    db_path = (
+        sys.argv[2] if len(sys.argv) > 2 else os.path.join(root_dir, "projects.db")
+    )
+
+    print(f"Importing {os.path.join(root_dir, 'projects')} into {db_path}...")
+    repo = SqliteProjectRepository(db_path)
+    counts = repo.import_directory(root_dir)
+    print(
+        f"Imported {counts['projects']} project(s) and {counts['results']} "
+        f"result(s); {counts['skipped']} already present."
+    )
+
+
+if __name__ == "__main__":
+    main()
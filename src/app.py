@@ -5,12 +5,17 @@ import sys
 import tkinter as tk
 from tkinter import filedialog
 import shutil
+import time
 
 # Perform path magic to ensure imports work when running from command line
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from src.application.interfaces import AnalysisProgressCallback
-from src.infrastructure.repositories import FileProjectRepository
+from src.infrastructure.repositories import (
+    CachedProjectRepository,
+    FileProjectRepository,
+)
+from src.infrastructure.sqlite_repository import SqliteProjectRepository
 from src.infrastructure.llm_gateway import LLMGatewayImpl
 from src.infrastructure.file_converter import FileConverter
 from src.application.use_cases import (
@@ -29,9 +34,16 @@ st.set_page_config(layout="wide", page_title="Requirements Verification AI")
 # --- Dependency Injection ---
 @st.cache_resource
 def get_controller():
-    repo = FileProjectRepository(root_dir=os.getcwd())
+    if os.getenv("PROJECT_STORE", "files").lower() == "sqlite":
+        repo = SqliteProjectRepository(
+            os.getenv("PROJECT_DB", os.path.join(os.getcwd(), "projects.db"))
+        )
+    else:
+        repo = CachedProjectRepository(FileProjectRepository(root_dir=os.getcwd()))
     llm = LLMGatewayImpl()
-    file_provider = FileConverter()
+    file_provider = FileConverter(
+        cache_dir=os.path.join(os.getcwd(), ".conversion_cache")
+    )
 
     manage_uc = ManageProjectUseCase(repo)
     verify_uc = VerifyRequirementsUseCase(repo, llm, file_provider)
@@ -48,9 +60,12 @@ presenter = ResultPresenter()
 
 # --- Callbacks ---
 class UIProgressCallback(AnalysisProgressCallback):
-    def __init__(self, log_container):
+    def __init__(self, log_container, stream_container=None):
         self.log_container = log_container
+        self.stream_container = stream_container
         self.logs = []
+        self.stream_text = ""
+        self._last_stream_render = 0.0
 
     def on_progress(self, step: str, percentage: int):
         pass
@@ -61,6 +76,16 @@ class UIProgressCallback(AnalysisProgressCallback):
             "Execution Logs", value="\n".join(self.logs), height=300
         )
 
+    def on_token(self, text: str):
+        if self.stream_container is None:
+            return
+        self.stream_text += text
+        # Re-rendering on every token is expensive; throttle updates
+        now = time.monotonic()
+        if now - self._last_stream_render >= 0.3:
+            self._last_stream_render = now
+            self.stream_container.code(self.stream_text[-3000:], language="json")
+
 
 # --- Helper Functions ---
 def ensure_project_structure(project_id):
@@ -337,7 +362,8 @@ with col_right:
 
                 progress_container = st.empty()
                 log_container = st.empty()
-                callback = UIProgressCallback(log_container)
+                stream_container = st.empty()
+                callback = UIProgressCallback(log_container, stream_container)
 
                 with st.spinner("Verifying..."):
                     try:
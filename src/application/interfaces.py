@@ -1,11 +1,31 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from src.domain.models import Project, ProjectId, VerificationResult
+from typing import Any, Iterator, List, Optional
+from src.domain.models import (
+    Project,
+    ProjectId,
+    VerificationResult,
+    Defect,
+    SourceUnit,
+    TextChunk,
+)
+
+
+class ConcurrentModificationError(RuntimeError):
+    """
+    Raised by ProjectRepository.save when the stored project was changed by
+    someone else since it was loaded. Reload it and apply the change again.
+    """
 
 
 class ProjectRepository(ABC):
     @abstractmethod
     def save(self, project: Project) -> None:
+        """
+        Store the project if the stored copy still has `project.version`, or
+        if it does not exist and `project.version` is 0 (a new project), then
+        increment `project.version`. Raises ConcurrentModificationError
+        otherwise, including for a stale copy of a deleted project.
+        """
         pass
 
     @abstractmethod
@@ -24,6 +44,21 @@ class ProjectRepository(ABC):
     def delete(self, project_id: ProjectId) -> None:
         pass
 
+    def list_project_ids(self) -> List[ProjectId]:
+        """
+        IDs of all stored projects. Override when this is cheaper than
+        loading every project.
+        """
+        return [project.id for project in self.list_projects()]
+
+    def stamp(self, project_id: ProjectId) -> Optional[Any]:
+        """
+        A cheap value that changes whenever the stored project changes
+        (e.g. file mtime and size), used to revalidate cached projects.
+        None if the project does not exist or the repository cannot tell.
+        """
+        return None
+
 
 class AnalysisProgressCallback(ABC):
     @abstractmethod
@@ -34,8 +69,44 @@ class AnalysisProgressCallback(ABC):
     def on_log(self, message: str) -> None:
         pass
 
+    def on_token(self, text: str) -> None:
+        """
+        Called with each chunk of streamed LLM output. Optional.
+        """
+        pass
+
+    def on_defect(self, defect: Defect) -> None:
+        """
+        Called as soon as a single defect has been parsed from the stream. Optional.
+        """
+        pass
+
 
 class FileContentProvider(ABC):
     @abstractmethod
     def read_text(self, file_path: str) -> str:
         pass
+
+    def flush(self) -> None:
+        """
+        Called after a batch of reads to persist any buffered state
+        (e.g. cache indexes). Optional.
+        """
+        pass
+
+    def iter_chunks(
+        self, file_path: str, chunk_chars: int = 64 * 1024
+    ) -> Iterator[TextChunk]:
+        """
+        Streaming variant of read_text: yields pieces of roughly
+        `chunk_chars` characters whose texts concatenate to read_text().
+        The default implementation converts the whole file first.
+        """
+        text = self.read_text(file_path)
+        yield TextChunk(
+            file_path=file_path,
+            text=text,
+            unit=SourceUnit.BYTE,
+            start=0,
+            end=len(text.encode("utf-8")),
+        )
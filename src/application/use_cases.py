@@ -1,8 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Dict, Any, Tuple
 import uuid
 import os
 
+from pydantic import ValidationError
+
 from src.domain.models import (
     Project,
     ProjectId,
@@ -17,8 +20,16 @@ from src.application.interfaces import (
     ProjectRepository,
     AnalysisProgressCallback,
     FileContentProvider,
+    ConcurrentModificationError,
 )
 
+# Limits for the files of one verification run, checked before any file is read
+DEFAULT_MAX_FILE_BYTES = 50 * 1024 * 1024
+DEFAULT_MAX_TOTAL_BYTES = 200 * 1024 * 1024
+
+# Read-modify-write attempts before a concurrent update is reported
+MAX_SAVE_ATTEMPTS = 5
+
 
 class ManageProjectUseCase:
     def __init__(self, repository: ProjectRepository):
@@ -41,12 +52,17 @@ class ManageProjectUseCase:
         return self.repository.list_projects()
 
     def add_file(self, project_id: ProjectId, file_path: str) -> Project:
-        project = self.repository.find_by_id(project_id)
-        if not project:
-            raise ValueError("Project not found")
-        project.add_file(file_path)
-        self.repository.save(project)
-        return project
+        for attempt in range(MAX_SAVE_ATTEMPTS):
+            project = self.repository.find_by_id(project_id)
+            if not project:
+                raise ValueError("Project not found")
+            project.add_file(file_path)
+            try:
+                self.repository.save(project)
+                return project
+            except ConcurrentModificationError:
+                if attempt == MAX_SAVE_ATTEMPTS - 1:
+                    raise
 
     def delete_project(self, project_id: ProjectId) -> None:
         self.repository.delete(project_id)
@@ -58,10 +74,17 @@ class VerifyRequirementsUseCase:
         project_repo: ProjectRepository,
         llm_gateway: LLMGateway,
         file_provider: FileContentProvider,
+        max_workers: Optional[int] = None,
+        max_file_bytes: Optional[int] = DEFAULT_MAX_FILE_BYTES,
+        max_total_bytes: Optional[int] = DEFAULT_MAX_TOTAL_BYTES,
     ):
         self.project_repo = project_repo
         self.llm_gateway = llm_gateway
         self.file_provider = file_provider
+        self.max_workers = max_workers or os.cpu_count() or 1
+        # None disables the corresponding limit
+        self.max_file_bytes = max_file_bytes
+        self.max_total_bytes = max_total_bytes
 
     def execute(
         self, project_id: ProjectId, callback: Optional[AnalysisProgressCallback] = None
@@ -77,23 +100,7 @@ class VerifyRequirementsUseCase:
         if callback:
             callback.on_progress("Loading Requirements...", 20)
 
-        full_text = ""
-        file_names = []
-        for file_path in project.input_files:
-            file_name = os.path.basename(file_path)
-            file_names.append(file_name)
-            if callback:
-                callback.on_log(f"Reading {file_name}...")
-
-            try:
-                content = self.file_provider.read_text(file_path)
-                full_text += f"\n\n# Document: {file_name}\n"
-                full_text += content
-            except Exception as e:
-                msg = f"Error reading {file_name}: {e}"
-                if callback:
-                    callback.on_log(msg)
-                print(msg)
+        full_text, file_names = self._load_files(project.input_files, callback)
 
         if not full_text:
             raise ValueError("No content found in project files.")
@@ -101,9 +108,37 @@ class VerifyRequirementsUseCase:
         # 2. Call LLM Verification
         if callback:
             callback.on_progress("Verifying with LLM...", 50)
-            callback.on_log("Sending request to LLM (this may take a minute)...")
+            estimate = self.llm_gateway.estimate_verification(full_text)
+            if estimate:
+                cost = estimate.get("estimated_cost_usd")
+                cost_str = f"~${cost:.4f}" if cost is not None else "unknown cost"
+                callback.on_log(
+                    f"Estimated {estimate['input_tokens']:,} input tokens "
+                    f"in {estimate['chunks']} chunk(s), {cost_str}"
+                )
+            callback.on_log("Sending request to LLM (streaming results)...")
+
+            def on_defect(defect_data: Dict[str, Any]) -> None:
+                try:
+                    defect = self._to_defect(defect_data)
+                except ValidationError as e:
+                    # Skip the live event only; the final result is validated below
+                    callback.on_log(
+                        f"Skipping invalid defect {defect_data.get('id', 'N/A')}: "
+                        f"{e.error_count()} validation error(s)"
+                    )
+                    return
+                callback.on_defect(defect)
+                callback.on_log(
+                    f"Found [{defect.id}] {defect.category.value} "
+                    f"({defect.severity.value}) at {defect.location}"
+                )
 
-        llm_result = self.llm_gateway.verify_requirements(full_text)
+            llm_result = self.llm_gateway.verify_requirements_stream(
+                full_text, on_token=callback.on_token, on_defect=on_defect
+            )
+        else:
+            llm_result = self.llm_gateway.verify_requirements(full_text)
 
         # 3. Process Result
         if callback:
@@ -112,20 +147,7 @@ class VerifyRequirementsUseCase:
         summary = llm_result.get("summary", "No summary provided.")
         defects_data = llm_result.get("defects", [])
 
-        defects = []
-        for d in defects_data:
-            defects.append(
-                Defect(
-                    id=d.get("id", "N/A"),
-                    category=d.get(
-                        "category", DefectCategory.AMBIGUOUS_TERMS
-                    ),  # Default fallback? or strict?
-                    severity=d.get("severity", Severity.MINOR),
-                    location=d.get("location", "Unknown"),
-                    description=d.get("description", ""),
-                    recommendation=d.get("recommendation", ""),
-                )
-            )
+        defects = [self._to_defect(d) for d in defects_data]
 
         # 4. Generate Markdown Report
         report_md = self._generate_report_markdown(summary, defects, file_names)
@@ -146,6 +168,94 @@ class VerifyRequirementsUseCase:
 
         return result
 
+    def _load_files(
+        self, file_paths: List[str], callback: Optional[AnalysisProgressCallback]
+    ) -> Tuple[str, List[str]]:
+        """
+        Read all files on a worker pool and concatenate them in input order.
+        Unreadable files are logged and skipped.
+        """
+        file_names = [os.path.basename(p) for p in file_paths]
+        self._check_sizes(file_paths)
+        if not file_paths:
+            return "", file_names
+
+        parts = []
+        total_bytes = 0
+        workers = min(self.max_workers, len(file_paths))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(self._read_file, p) for p in file_paths]
+            try:
+                # Callbacks are only invoked from this thread
+                for file_name, future in zip(file_names, futures):
+                    if callback:
+                        callback.on_log(f"Reading {file_name}...")
+                    try:
+                        content, size = future.result()
+                    except Exception as e:
+                        msg = f"Error reading {file_name}: {e}"
+                        if callback:
+                            callback.on_log(msg)
+                        print(msg)
+                        continue
+
+                    # Converted text can outgrow its source (e.g. spreadsheets)
+                    total_bytes += size
+                    if (
+                        self.max_total_bytes is not None
+                        and total_bytes > self.max_total_bytes
+                    ):
+                        raise ValueError(
+                            f"Project text exceeds the limit of "
+                            f"{_format_size(self.max_total_bytes)} "
+                            f"after reading {file_name}."
+                        )
+                    parts.append(f"\n\n# Document: {file_name}\n")
+                    parts.append(content)
+            finally:
+                for future in futures:
+                    future.cancel()
+        self.file_provider.flush()
+        return "".join(parts), file_names
+
+    def _read_file(self, path: str) -> Tuple[str, int]:
+        """
+        Converted text and its UTF-8 size, measured on the worker thread.
+        """
+        content = self.file_provider.read_text(path)
+        return content, len(content.encode("utf-8"))
+
+    def _check_sizes(self, file_paths: List[str]) -> None:
+        total = 0
+        for path in file_paths:
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                continue  # Reported when the file is read
+            if self.max_file_bytes is not None and size > self.max_file_bytes:
+                raise ValueError(
+                    f"{os.path.basename(path)} is {_format_size(size)}, over the "
+                    f"per-file limit of {_format_size(self.max_file_bytes)}."
+                )
+            total += size
+        if self.max_total_bytes is not None and total > self.max_total_bytes:
+            raise ValueError(
+                f"Project files total {_format_size(total)}, over the "
+                f"limit of {_format_size(self.max_total_bytes)}."
+            )
+
+    def _to_defect(self, d: Dict[str, Any]) -> Defect:
+        return Defect(
+            id=d.get("id", "N/A"),
+            category=d.get(
+                "category", DefectCategory.AMBIGUOUS_TERMS
+            ),  # Default fallback? or strict?
+            severity=d.get("severity", Severity.MINOR),
+            location=d.get("location", "Unknown"),
+            description=d.get("description", ""),
+            recommendation=d.get("recommendation", ""),
+        )
+
     def _generate_report_markdown(
         self, summary: str, defects: List[Defect], file_names: List[str]
     ) -> str:
@@ -189,6 +299,10 @@ class VerifyRequirementsUseCase:
         return report
 
 
+def _format_size(size: int) -> str:
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
 class BreakdownUseCase:
     def __init__(self, service):
         self.service = service
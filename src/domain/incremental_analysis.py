@@ -0,0 +1,700 @@
+from collections import Counter, deque
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.domain.models import (
+    DefectDiff,
+    DefectType,
+    EdgeType,
+    GraphDefect,
+    GraphDelta,
+    NodeId,
+    NodeType,
+    RequirementEdge,
+    RequirementGraph,
+    RequirementNode,
+)
+from src.domain.services import (
+    cycle_defect,
+    dead_end_defect,
+    first_closed_cycle,
+    node_label,
+    orphan_defect,
+    strongly_connected_components,
+)
+
+# Flow edge types -> whether the edge is a dependency
+_FLOW = {EdgeType.TRANSITION: False, EdgeType.DEPENDS_ON: True}
+
+# Per-component counters: flow edges leaving it, terminator members and
+# DEPENDS_ON edges inside it
+_EXITS, _TERMINATORS, _DEPENDENCIES = range(3)
+
+Rank = Tuple[int, ...]
+
+
+class IncrementalGraphAnalyzer:
+    """
+    Keeps the results of GraphAnalysisService up to date while a graph is
+    edited through GraphDelta objects, e.g. after re-extracting one section.
+
+    Dead ends are local to the edited nodes. Reachability is repaired from
+    the endpoints of changed edges, and strongly connected components are
+    kept in a topological order of the condensation (Pearce-Kelly): an added
+    edge only searches the components ranked between its endpoints, and a
+    removed edge only re-runs Tarjan on the component it belonged to.
+    Deltas larger than `max_delta_ratio` of the graph are applied by
+    re-running the full analysis instead.
+
+    The analyzer owns `graph` and applies every delta to it in place.
+    """
+
+    def __init__(self, graph: RequirementGraph, max_delta_ratio: float = 0.05):
+        self.graph = graph
+        self.max_delta_ratio = max_delta_ratio
+        self._next_component = 0
+        self._rebuild()
+
+    def defects(self) -> List[GraphDefect]:
+        """
+        Current defects: dead ends and orphans in node order, then cycles in
+        topological order, as GraphAnalysisService.analyze reports them.
+        """
+        ordered: Dict[DefectType, List[Tuple[object, GraphDefect]]] = {
+            DefectType.DEAD_END: [],
+            DefectType.ORPHAN: [],
+            DefectType.CYCLE: [],
+        }
+        for (defect_type, ref), defect in self._defects.items():
+            order = (
+                self._rank[ref]
+                if defect_type is DefectType.CYCLE
+                else self._position[ref]
+            )
+            ordered[defect_type].append((order, defect))
+        return [
+            defect
+            for entries in ordered.values()
+            for _, defect in sorted(entries, key=lambda entry: entry[0])
+        ]
+
+    def apply(self, delta: GraphDelta) -> DefectDiff:
+        """
+        Apply `delta` to the graph and return the defects it added and resolved.
+        Raises ValueError, leaving the graph untouched, if the delta removes
+        an edge that does not exist or adds an edge to an unknown node.
+        """
+        graph = self.graph
+        if delta.size() > self.max_delta_ratio * (
+            len(graph.nodes) + len(graph.edges)
+        ) or any(node.id in self._dangling for node in delta.added_nodes):
+            before = dict(self._defects)
+            self._update_graph(delta)
+            self._rebuild()
+            for key in self._defects:
+                before.setdefault(key, None)
+            return self._diff(before, recomputed=True)
+
+        self._before = {}
+        removed_nodes, dropped_edges, replaced = self._update_graph(delta)
+        comp_of = self._comp_of
+        reachable = self._reachable
+        touched: Set[str] = set()
+        fresh: Set[int] = set()  # Components created by this delta
+        changes: List[Tuple[str, str, bool, int]] = []
+        lost_reach: List[str] = []
+        split: Set[int] = set()
+        shrunk: Set[int] = set()
+
+        for edge in dropped_edges:
+            dependency = _FLOW.get(edge.type)
+            source, target = edge.source_id, edge.target_id
+            if dependency is None or source not in self._out or target not in self._out:
+                continue
+            self._unlink(source, target, dependency)
+            touched.update((source, target))
+            changes.append((source, target, dependency, -1))
+            if source in reachable and target in reachable:
+                lost_reach.append(target)
+            if comp_of[source] == comp_of[target]:
+                split.add(comp_of[source])
+
+        for node_id in removed_nodes:
+            self._set((DefectType.DEAD_END, node_id), None)
+            self._set((DefectType.ORPHAN, node_id), None)
+            component = comp_of.pop(node_id)
+            self._members[component].discard(node_id)
+            split.add(component)
+            shrunk.add(component)
+            reachable.discard(node_id)
+            self._implicit_roots.discard(node_id)
+            del self._out[node_id], self._in[node_id]
+            del self._in_degree[node_id], self._position[node_id]
+            touched.add(node_id)
+
+        added_nodes = []
+        for node in delta.added_nodes:
+            touched.add(node.id)
+            if node.id in self._out:
+                continue
+            self._add_node(node.id)
+            fresh.add(comp_of[node.id])
+            added_nodes.append(node.id)
+
+        for component in split:
+            if component in self._members:
+                self._split(component, component in shrunk, fresh)
+
+        for edge in delta.added_edges:
+            dependency = _FLOW.get(edge.type)
+            if dependency is None:
+                continue
+            source, target = edge.source_id, edge.target_id
+            self._link(source, target, dependency)
+            touched.update((source, target))
+            changes.append((source, target, dependency, 1))
+            self._order(source, target, fresh)
+
+        for node_id in touched:
+            if node_id in self._out:
+                self._update_implicit_root(node_id)
+        old_roots = self._roots
+        self._roots = self._current_roots()
+        reach_changed = self._update_reachable(
+            lost_reach,
+            old_roots,
+            chain((edge.target_id for edge in delta.added_edges), added_nodes),
+        )
+
+        self._update_stats(fresh, changes, replaced)
+        invalid = set(touched)
+        for component in fresh:
+            invalid |= self._members[component]
+        old_loops = self._main_loops
+        self._main_loops = self._find_main_loops(invalid)
+
+        checked = (touched | reach_changed) & self._out.keys()
+        for node_id in checked:
+            self._check_node(node_id)
+        relabeled = {comp_of[n] for n in replaced if n in comp_of}
+        components = (
+            fresh
+            | relabeled
+            | {comp_of[n] for n in checked}
+            | ((old_loops ^ self._main_loops) & self._members.keys())
+        )
+        for component in components:
+            self._check_component(component, force=component in relabeled)
+        return self._diff(self._before, recomputed=False)
+
+    # Graph updates
+
+    def _update_graph(
+        self, delta: GraphDelta
+    ) -> Tuple[Set[NodeId], List[RequirementEdge], Dict[NodeId, RequirementNode]]:
+        """
+        Apply `delta` to the graph. Removing a node also removes its edges.
+        Returns the removed node IDs, the removed edges and the previous
+        version of every replaced node.
+        """
+        graph = self.graph
+        removed = {n for n in delta.removed_node_ids if n in graph.nodes}
+        added = {node.id for node in delta.added_nodes}
+        for edge in delta.added_edges:
+            for node_id in (edge.source_id, edge.target_id):
+                if node_id not in added and (
+                    node_id not in graph.nodes or node_id in removed
+                ):
+                    raise ValueError(
+                        f"Edge {edge.source_id} -> {edge.target_id} "
+                        f"references unknown node '{node_id}'"
+                    )
+
+        dropped: List[RequirementEdge] = []
+        if removed or delta.removed_edges:
+            pending = Counter(_edge_key(edge) for edge in delta.removed_edges)
+            kept = []
+            for edge in graph.edges:
+                key = _edge_key(edge)
+                if pending[key]:
+                    pending[key] -= 1
+                    dropped.append(edge)
+                elif edge.source_id in removed or edge.target_id in removed:
+                    dropped.append(edge)
+                else:
+                    kept.append(edge)
+            for (source, target, *_), count in pending.items():
+                if count:
+                    raise ValueError(f"Edge {source} -> {target} is not in the graph")
+            graph.edges = kept
+
+        for node_id in removed:
+            del graph.nodes[node_id]
+            self._terminators.discard(node_id)
+        replaced: Dict[NodeId, RequirementNode] = {}
+        for node in delta.added_nodes:
+            if node.id in graph.nodes:
+                replaced.setdefault(node.id, graph.nodes[node.id])
+            graph.add_node(node)
+            if node.type == NodeType.TERMINATOR:
+                self._terminators.add(node.id)
+            else:
+                self._terminators.discard(node.id)
+        for edge in delta.added_edges:
+            graph.add_edge(edge)
+        if delta.initial_node_ids is not None:
+            graph.initial_node_ids = list(delta.initial_node_ids)
+        return removed, dropped, replaced
+
+    def _add_node(self, node_id: str) -> None:
+        self._position[node_id] = self._next_position
+        self._next_position += 1
+        self._out[node_id] = []
+        self._in[node_id] = []
+        self._in_degree[node_id] = 0
+        # Unconnected nodes go last in the topological order
+        self._new_component({node_id}, (self._next_rank,))
+        self._next_rank += 1
+
+    def _link(self, source: str, target: str, dependency: bool) -> None:
+        self._out[source].append((target, dependency))
+        self._in[target].append(source)
+        if source != target:
+            self._in_degree[target] += 1
+
+    def _unlink(self, source: str, target: str, dependency: bool) -> None:
+        self._out[source].remove((target, dependency))
+        self._in[target].remove(source)
+        if source != target:
+            self._in_degree[target] -= 1
+
+    # Full build
+
+    def _rebuild(self) -> None:
+        graph = self.graph
+        ids = list(graph.nodes)
+        self._position = {node_id: i for i, node_id in enumerate(ids)}
+        self._next_position = len(ids)
+        self._out: Dict[str, List[Tuple[str, bool]]] = {n: [] for n in ids}
+        self._in: Dict[str, List[str]] = {n: [] for n in ids}
+        self._in_degree = dict.fromkeys(ids, 0)
+        self._terminators: Set[str] = {
+            n for n in ids if graph.nodes[n].type == NodeType.TERMINATOR
+        }
+        # IDs that existing edges refer to without the node being defined;
+        # adding one of them brings those edges to life, so it is rebuilt
+        self._dangling: Set[str] = set()
+        for edge in graph.edges:
+            dependency = _FLOW.get(edge.type)
+            if dependency is None:
+                continue
+            source, target = edge.source_id, edge.target_id
+            if source not in self._out or target not in self._out:
+                self._dangling.update(n for n in (source, target) if n not in self._out)
+                continue
+            self._link(source, target, dependency)
+
+        self._implicit_roots: Set[str] = set()
+        for node_id in ids:
+            self._update_implicit_root(node_id)
+        self._roots = self._current_roots()
+        self._reachable: Set[str] = set()
+        self._update_reachable([], [], [])
+
+        position = self._position
+        components = strongly_connected_components(
+            [[position[t] for t, _ in self._out[n]] for n in ids]
+        )
+        self._comp_of: Dict[str, int] = {}
+        self._members: Dict[int, Set[str]] = {}
+        self._rank: Dict[int, Rank] = {}
+        self._stats: Dict[int, List[int]] = {}
+        # Component -> flow edges (source, target) leaving it
+        self._exits: Dict[int, Counter] = {}
+        self._status: Dict[int, Tuple[bool, bool]] = {}
+        # Tarjan returns components in reverse topological order
+        count = len(components)
+        for c, component in enumerate(components):
+            self._new_component({ids[v] for v in component}, (count - 1 - c,))
+        self._next_rank = count
+        for component in self._members:
+            self._stats[component] = self._count_stats(component)
+
+        # Root -> (main loop component, components the search reached)
+        self._loop_cache: Dict[str, Tuple[Optional[int], Set[int]]] = {}
+        self._main_loops = self._find_main_loops(set())
+
+        self._defects: Dict[Tuple[DefectType, object], GraphDefect] = {}
+        self._before: Dict[Tuple[DefectType, object], Optional[GraphDefect]] = {}
+        for node_id in ids:
+            self._check_node(node_id)
+        for component in list(self._members):
+            self._check_component(component)
+        self._before = {}
+
+    # Roots and reachability
+
+    def _update_implicit_root(self, node_id: str) -> None:
+        if self._in_degree[node_id] == 0 and any(
+            t != node_id for t, _ in self._out[node_id]
+        ):
+            self._implicit_roots.add(node_id)
+        else:
+            self._implicit_roots.discard(node_id)
+
+    def _current_roots(self) -> List[str]:
+        """
+        Same entry points as GraphIndex.roots.
+        """
+        initial = [n for n in self.graph.initial_node_ids if n in self._out]
+        if initial:
+            return list(dict.fromkeys(initial))
+        if self._implicit_roots:
+            return sorted(self._implicit_roots, key=self._position.__getitem__)
+        return [next(iter(self.graph.nodes))] if self.graph.nodes else []
+
+    def _update_reachable(
+        self,
+        lost: Iterable[str],
+        old_roots: Iterable[str],
+        candidates: Iterable[str],
+    ) -> Set[str]:
+        """
+        Repair the reachable set after edges were changed. `lost` are targets
+        of removed edges between reachable nodes and `candidates` targets of
+        added edges and new nodes. Returns the nodes whose status changed.
+
+        Only nodes downstream of a lost edge or root can lose reachability,
+        so those are unmarked and re-reached from their surviving predecessors.
+        """
+        out, reachable = self._out, self._reachable
+        roots = set(self._roots)
+        stack = [
+            n
+            for n in chain(lost, (r for r in old_roots if r not in roots))
+            if n in reachable
+        ]
+        suspect = set(stack)
+        while stack:
+            for w, _ in out[stack.pop()]:
+                if w in reachable and w not in suspect:
+                    suspect.add(w)
+                    stack.append(w)
+        reachable -= suspect
+
+        reached = []
+        queue = deque()
+        for node_id in chain(suspect, candidates, roots):
+            if node_id in reachable or node_id not in out:
+                continue
+            if node_id not in roots and not any(
+                p in reachable for p in self._in[node_id]
+            ):
+                continue
+            reachable.add(node_id)
+            reached.append(node_id)
+            queue.append(node_id)
+            while queue:
+                for w, _ in out[queue.popleft()]:
+                    if w not in reachable:
+                        reachable.add(w)
+                        reached.append(w)
+                        queue.append(w)
+        return {n for n in suspect if n not in reachable} | {
+            n for n in reached if n not in suspect
+        }
+
+    # Strongly connected components
+
+    def _new_component(self, members: Set[str], rank: Rank) -> int:
+        component = self._next_component
+        self._next_component += 1
+        self._members[component] = members
+        self._rank[component] = rank
+        for node_id in members:
+            self._comp_of[node_id] = component
+        return component
+
+    def _drop_component(self, component: int) -> None:
+        self._set((DefectType.CYCLE, component), None)
+        del self._members[component], self._rank[component]
+        self._stats.pop(component, None)
+        self._exits.pop(component, None)
+        self._status.pop(component, None)
+
+    def _split(self, component: int, shrunk: bool, fresh: Set[int]) -> None:
+        """
+        Re-run Tarjan on a component that lost an internal edge or a node.
+        The pieces take ranks between the old one and its successor.
+        """
+        members = self._members[component]
+        ordered = list(members)
+        local = {node_id: i for i, node_id in enumerate(ordered)}
+        pieces = strongly_connected_components(
+            [[local[w] for w, _ in self._out[v] if w in local] for v in ordered]
+        )
+        if len(pieces) == 1 and not shrunk:
+            return
+        rank = self._rank[component]
+        self._drop_component(component)
+        fresh.discard(component)
+        count = len(pieces)
+        for c, piece in enumerate(pieces):
+            fresh.add(
+                self._new_component(
+                    {ordered[v] for v in piece}, rank + (count - 1 - c,)
+                )
+            )
+
+    def _order(self, source: str, target: str, fresh: Set[int]) -> None:
+        """
+        Restore the topological order after linking `source` -> `target`,
+        merging the components on any cycle the edge closed.
+        """
+        rank = self._rank
+        upper = self._comp_of[source]
+        lower = self._comp_of[target]
+        if upper == lower or rank[upper] < rank[lower]:
+            return
+        bounds = (rank[lower], rank[upper])
+        forward = self._closure(lower, bounds, forward=True)
+        backward = self._closure(upper, bounds, forward=False)
+        pool = sorted(rank[c] for c in forward | backward)
+        by_rank = rank.__getitem__
+
+        if upper not in forward:
+            order = sorted(backward, key=by_rank) + sorted(forward, key=by_rank)
+            ranks = pool
+        else:
+            merged = forward & backward
+            before = sorted(backward - merged, key=by_rank)
+            after = sorted(forward - merged, key=by_rank)
+            largest = max(merged, key=lambda c: len(self._members[c]))
+            members = self._members[largest]
+            for c in merged:
+                if c != largest:
+                    members |= self._members[c]
+                self._drop_component(c)
+                fresh.discard(c)
+            component = self._new_component(members, pool[len(before)])
+            fresh.add(component)
+            order = before + [component] + after
+            # Components downstream of the cycle keep the highest ranks
+            ranks = pool[: len(before) + 1] + pool[len(pool) - len(after) :]
+        for c, r in zip(order, ranks):
+            rank[c] = r
+
+    def _closure(
+        self, start: int, bounds: Tuple[Rank, Rank], forward: bool
+    ) -> Set[int]:
+        """
+        Components reachable from (or reaching) `start` within a rank range.
+        """
+        comp_of, rank = self._comp_of, self._rank
+        lower, upper = bounds
+        seen = {start}
+        stack = [start]
+        while stack:
+            for v in self._members[stack.pop()]:
+                neighbours = (w for w, _ in self._out[v]) if forward else self._in[v]
+                for w in neighbours:
+                    c = comp_of[w]
+                    if c not in seen and lower <= rank[c] <= upper:
+                        seen.add(c)
+                        stack.append(c)
+        return seen
+
+    def _count_stats(self, component: int) -> List[int]:
+        """
+        Count the component's stats and collect its exit edges.
+        """
+        comp_of, nodes = self._comp_of, self.graph.nodes
+        stats = [0, 0, 0]
+        exits = self._exits[component] = Counter()
+        for v in self._members[component]:
+            if nodes[v].type == NodeType.TERMINATOR:
+                stats[_TERMINATORS] += 1
+            for w, dependency in self._out[v]:
+                if comp_of[w] != component:
+                    stats[_EXITS] += 1
+                    exits[(v, w)] += 1
+                elif dependency:
+                    stats[_DEPENDENCIES] += 1
+        return stats
+
+    def _update_stats(
+        self,
+        fresh: Set[int],
+        changes: List[Tuple[str, str, bool, int]],
+        replaced: Dict[NodeId, RequirementNode],
+    ) -> None:
+        """
+        Recount new components; adjust the others by the changed edges.
+        """
+        comp_of, nodes = self._comp_of, self.graph.nodes
+        for component in fresh:
+            self._stats[component] = self._count_stats(component)
+        for source, target, dependency, sign in changes:
+            component = comp_of.get(source)
+            if component is None or component in fresh:
+                continue
+            if comp_of.get(target) != component:
+                self._stats[component][_EXITS] += sign
+                exits = self._exits[component]
+                exits[(source, target)] += sign
+                if not exits[(source, target)]:
+                    del exits[(source, target)]
+            elif dependency:
+                self._stats[component][_DEPENDENCIES] += sign
+        for node_id, old in replaced.items():
+            component = comp_of.get(node_id)
+            if component is None or component in fresh:
+                continue
+            self._stats[component][_TERMINATORS] += (
+                nodes[node_id].type == NodeType.TERMINATOR
+            ) - (old.type == NodeType.TERMINATOR)
+
+    def _find_main_loops(self, invalid: Set[str]) -> Set[int]:
+        """
+        The first closed cycle reached from each root, as in
+        GraphAnalysisService; none while the graph has a terminator. A cached
+        search is reused unless a component it reached has changed.
+        """
+        comp_of, members = self._comp_of, self._members
+        changed = {comp_of[n] for n in invalid if n in comp_of}
+        loops = set()
+        cache = {}
+        for root in self._roots:
+            entry = self._loop_cache.get(root)
+            if (
+                entry is None
+                or not entry[1].isdisjoint(changed)
+                or any(c not in members for c in entry[1])
+            ):
+                reached: Set[int] = set()
+                entry = (
+                    first_closed_cycle(
+                        comp_of[root],
+                        self._is_closed_cycle,
+                        self._successors,
+                        reached,
+                    ),
+                    reached,
+                )
+            cache[root] = entry
+            if entry[0] is not None:
+                loops.add(entry[0])
+        self._loop_cache = cache
+        return set() if self._terminators else loops
+
+    def _is_closed_cycle(self, component: int) -> bool:
+        return len(self._members[component]) > 1 and self._stats[component][_EXITS] == 0
+
+    def _successors(self, component: int) -> List[int]:
+        position, comp_of = self._position, self._comp_of
+        edges = sorted(
+            self._exits[component],
+            key=lambda edge: (position[edge[0]], position[edge[1]]),
+        )
+        return [comp_of[w] for _, w in edges]
+
+    # Defects
+
+    def _check_node(self, node_id: str) -> None:
+        node = self.graph.nodes[node_id]
+        label = node_label(node)
+        dead_end = None
+        # Isolated nodes are reported as orphans instead
+        if (
+            not self._out[node_id]
+            and self._in_degree[node_id]
+            and node.type != NodeType.TERMINATOR
+        ):
+            dead_end = dead_end_defect(
+                node_id, label, bool(node.metadata.get("undefined"))
+            )
+        self._set((DefectType.DEAD_END, node_id), dead_end)
+        self._set(
+            (DefectType.ORPHAN, node_id),
+            None if node_id in self._reachable else orphan_defect(node_id, label),
+        )
+
+    def _check_component(self, component: int, force: bool = False) -> None:
+        members = self._members[component]
+        stats = self._stats[component]
+        is_dependency = stats[_DEPENDENCIES] > 0
+        first = next(iter(members))
+        is_cycle = len(members) > 1 or any(w == first for w, _ in self._out[first])
+        is_trap = (
+            is_cycle
+            and stats[_EXITS] == 0
+            and stats[_TERMINATORS] == 0
+            and first in self._reachable
+            and component not in self._main_loops
+        )
+        status = (is_dependency, is_trap)
+        if not force and self._status.get(component) == status:
+            return
+        self._status[component] = status
+        defect = None
+        if is_dependency or is_trap:
+            ordered = sorted(members, key=self._position.__getitem__)
+            nodes = self.graph.nodes
+            defect = cycle_defect(
+                ordered, [node_label(nodes[v]) for v in ordered[:10]], is_trap
+            )
+        self._set((DefectType.CYCLE, component), defect)
+
+    def _set(self, key: Tuple[DefectType, object], defect: Optional[GraphDefect]):
+        if key not in self._before:
+            self._before[key] = self._defects.get(key)
+        if defect is None:
+            self._defects.pop(key, None)
+        else:
+            self._defects[key] = defect
+
+    def _diff(
+        self,
+        before: Dict[Tuple[DefectType, object], Optional[GraphDefect]],
+        recomputed: bool,
+    ) -> DefectDiff:
+        added, resolved = [], []
+        for key, old in before.items():
+            new = self._defects.get(key)
+            if old is not None:
+                resolved.append(old)
+            if new is not None:
+                added.append(new)
+        # A defect that was re-created unchanged (e.g. a cycle whose
+        # component was rebuilt) is neither added nor resolved
+        unchanged = Counter(map(_signature, added)) & Counter(map(_signature, resolved))
+        return DefectDiff(
+            added=_without(added, unchanged.copy()),
+            resolved=_without(resolved, unchanged),
+            recomputed=recomputed,
+        )
+
+
+def _edge_key(edge: RequirementEdge) -> tuple:
+    return (edge.source_id, edge.target_id, edge.type, edge.label, edge.condition)
+
+
+def _signature(defect: GraphDefect) -> tuple:
+    return (
+        defect.type,
+        defect.severity,
+        tuple(defect.related_node_ids),
+        defect.description,
+        defect.suggestion,
+    )
+
+
+def _without(defects: List[GraphDefect], counts: Counter) -> List[GraphDefect]:
+    result = []
+    for defect in defects:
+        signature = _signature(defect)
+        if counts[signature]:
+            counts[signature] -= 1
+        else:
+            result.append(defect)
+    return result
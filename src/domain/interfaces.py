@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Callable, Optional
 
 
 class LLMGateway(ABC):
@@ -17,3 +17,58 @@ class LLMGateway(ABC):
         Call LLM with a system prompt and a user prompt.
         """
         pass
+
+    def estimate_verification(self, text: str) -> Dict[str, Any]:
+        """
+        Estimate the cost of verify_requirements before sending anything.
+        Expected keys: input_tokens, output_tokens, chunks, estimated_cost_usd.
+        Gateways that cannot estimate return an empty dict.
+        """
+        return {}
+
+    def verify_requirements_stream(
+        self,
+        text: str,
+        on_token: Optional[Callable[[str], None]] = None,
+        on_defect: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Streaming variant of verify_requirements.
+        `on_token` receives raw output chunks and `on_defect` each defect dict as
+        soon as it is complete. Returns the same dictionary as verify_requirements.
+        The default implementation does not stream and reports defects at the end.
+        """
+        result = self.verify_requirements(text)
+        if on_defect:
+            for defect in result.get("defects", []):
+                on_defect(defect)
+        return result
+
+
+class AsyncLLMGateway(ABC):
+    """
+    Asyncio counterpart of LLMGateway.
+    Lets callers issue many independent requests concurrently (e.g. with asyncio.gather).
+    """
+
+    @abstractmethod
+    async def verify_requirements(self, text: str) -> Dict[str, Any]:
+        """
+        Verify requirements and return a dictionary compatible with VerificationResult.
+        Expected keys: summary, defects (list of dicts)
+        """
+        pass
+
+    @abstractmethod
+    async def call_llm_with_system(self, system_prompt: str, user_prompt: str) -> str:
+        """
+        Call LLM with a system prompt and a user prompt.
+        """
+        pass
+
+    @abstractmethod
+    async def call_llm_text(self, prompt: str, temperature: float = None) -> str:
+        """
+        Call LLM with a single user prompt.
+        """
+        pass
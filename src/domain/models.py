@@ -5,6 +5,7 @@ from pydantic import BaseModel, Field
 
 # Value Objects
 ProjectId = NewType("ProjectId", str)
+NodeId = NewType("NodeId", str)
 
 
 # Enums
@@ -25,6 +26,29 @@ class Severity(str, Enum):
     MINOR = "Minor"
 
 
+class NodeType(str, Enum):
+    ACTOR = "Actor"
+    ACTION = "Action"
+    STATE = "State"
+    CONDITION = "Condition"
+    TERMINATOR = "Terminator"  # Intentional end node, never a dead end
+
+
+class EdgeType(str, Enum):
+    DEPENDS_ON = "DependsOn"
+    TRANSITION = "Transition"
+    CONTRADICTS = "Contradicts"
+    REFINES = "Refines"
+
+
+class DefectType(str, Enum):
+    DEAD_END = "Dead End"
+    ORPHAN = "Orphan"
+    CYCLE = "Cycle"
+    MISSING_ELSE = "Missing Else"
+    CONFLICT = "Conflict"
+
+
 # Entities
 
 
@@ -39,6 +63,8 @@ class Project(BaseModel):
     created_at: datetime
     config: ProjectConfig
     input_files: List[str] = Field(default_factory=list)
+    # Incremented by the repository on every save (optimistic concurrency)
+    version: int = 0
 
     def add_file(self, path: str) -> None:
         if path not in self.input_files:
@@ -61,6 +87,28 @@ class Defect(BaseModel):
     recommendation: str
 
 
+class SourceUnit(str, Enum):
+    PAGE = "page"
+    ROW = "row"
+    PARAGRAPH = "paragraph"
+    BYTE = "byte"
+
+
+class TextChunk(BaseModel):
+    """
+    A piece of converted document text and where it came from:
+    `start`..`end` (inclusive, 1-based except for byte offsets, which are
+    0-based and end-exclusive) counted in `unit`, within `sheet` if set.
+    """
+
+    file_path: str
+    text: str
+    unit: SourceUnit
+    start: int
+    end: int
+    sheet: Optional[str] = None
+
+
 class VerificationResult(BaseModel):
     project_id: ProjectId
     timestamp: datetime
@@ -70,3 +118,148 @@ class VerificationResult(BaseModel):
 
     class Config:
         arbitrary_types_allowed = True
+
+
+# Requirement Graph
+
+
+class RequirementNode(BaseModel):
+    id: NodeId
+    content: str
+    type: NodeType
+    source_file: Optional[str] = None
+    line_number: Optional[int] = None
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
+
+class RequirementEdge(BaseModel):
+    source_id: NodeId
+    target_id: NodeId
+    type: EdgeType
+    label: Optional[str] = None  # e.g. the trigger/event of a transition
+    condition: Optional[str] = None
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
+
+class RequirementGraph(BaseModel):
+    nodes: Dict[NodeId, RequirementNode] = Field(default_factory=dict)
+    edges: List[RequirementEdge] = Field(default_factory=list)
+    # Entry points for reachability; when empty, nodes without incoming edges are used
+    initial_node_ids: List[NodeId] = Field(default_factory=list)
+
+    def add_node(self, node: RequirementNode) -> None:
+        self.nodes[node.id] = node
+
+    def add_edge(self, edge: RequirementEdge) -> None:
+        self.edges.append(edge)
+
+
+class GraphDefect(BaseModel):
+    type: DefectType
+    severity: Severity
+    related_node_ids: List[str]
+    description: str
+    suggestion: str
+
+
+class GraphDelta(BaseModel):
+    """
+    Changes to apply to a RequirementGraph, e.g. from re-extracting one section.
+    A node in `added_nodes` whose ID already exists replaces that node.
+    """
+
+    added_nodes: List[RequirementNode] = Field(default_factory=list)
+    removed_node_ids: List[NodeId] = Field(default_factory=list)
+    added_edges: List[RequirementEdge] = Field(default_factory=list)
+    removed_edges: List[RequirementEdge] = Field(default_factory=list)
+    # Replaces the graph's initial nodes when set
+    initial_node_ids: Optional[List[NodeId]] = None
+
+    def size(self) -> int:
+        return (
+            len(self.added_nodes)
+            + len(self.removed_node_ids)
+            + len(self.added_edges)
+            + len(self.removed_edges)
+        )
+
+
+class DefectDiff(BaseModel):
+    added: List[GraphDefect] = Field(default_factory=list)
+    resolved: List[GraphDefect] = Field(default_factory=list)
+    # True when the delta was large enough to re-run the full analysis
+    recomputed: bool = False
+
+
+# Model Checking
+
+
+class PropertyKind(str, Enum):
+    CONFLICTING_OUTPUTS = "Conflicting Outputs"
+    MISSING_ELSE = "Missing Else"
+    TIMING_BOUND = "Timing Bound"
+    REACHABILITY = "Reachability"
+
+
+class ModelProperty(BaseModel):
+    """
+    A property to check on an extracted state machine. Which fields are used
+    depends on `kind`:
+
+    - CONFLICTING_OUTPUTS: `conflict_group`
+    - MISSING_ELSE: `machine`, `state` and `event`
+    - TIMING_BOUND: `machine`, `state` -> `target` within `deadline_ms`
+    - REACHABILITY: `machine`, `state` -> `target` (any other state if unset)
+    """
+
+    id: str
+    kind: PropertyKind
+    machine: Optional[str] = None
+    state: Optional[str] = None
+    event: Optional[str] = None
+    target: Optional[str] = None
+    conflict_group: Optional[str] = None
+    deadline_ms: Optional[float] = None
+    description: str = ""
+
+
+class PropertyResult(BaseModel):
+    property_id: str
+    kind: PropertyKind
+    holds: bool
+    message: str
+    # Counterexample: the steps leading to the violation
+    trace: List[str] = Field(default_factory=list)
+    # Guard variable values that witness the violation
+    assignment: Dict[str, Any] = Field(default_factory=dict)
+    cached: bool = False
+
+
+# Alloy Verification
+
+
+class AlloyStatus(str, Enum):
+    PASSED = "PASSED"
+    VIOLATION_FOUND = "VIOLATION_FOUND"
+    TIMEOUT = "TIMEOUT"
+    ERROR = "ERROR"
+
+
+class AlloyCommandResult(BaseModel):
+    name: str
+    type: str  # "check" or "run"
+    # Whether the solver found an instance; None if the command failed
+    satisfiable: Optional[bool] = None
+    # Counterexample (check) or instance (run) as written by the solver
+    solution: Optional[Dict[str, Any]] = None
+    message: str = ""
+
+
+class AlloyModelResult(BaseModel):
+    path: str
+    model_hash: str
+    status: AlloyStatus
+    commands: List[AlloyCommandResult] = Field(default_factory=list)
+    message: str = ""
+    elapsed_seconds: float = 0.0
+    cached: bool = False
@@ -0,0 +1,429 @@
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+from src.domain.models import (
+    Defect,
+    DefectCategory,
+    DefectType,
+    EdgeType,
+    GraphDefect,
+    NodeType,
+    RequirementGraph,
+    RequirementNode,
+    Severity,
+)
+
+DEFECT_CATEGORIES = {
+    DefectType.DEAD_END: DefectCategory.DEAD_ENDS,
+    DefectType.ORPHAN: DefectCategory.ORPHAN_STATES,
+    DefectType.CYCLE: DefectCategory.CYCLES,
+    DefectType.MISSING_ELSE: DefectCategory.MISSING_ELSE,
+    DefectType.CONFLICT: DefectCategory.CONFLICTING_OUTPUTS,
+}
+
+
+class GraphIndex:
+    """
+    Integer-indexed view of a graph's flow edges that the checks run on.
+
+    Subclasses set `ids`, `succ` (successor sequence per node), `in_degree`
+    (not counting self-loops), `dependency_pairs` (DEPENDS_ON edges) and
+    `initial`, and implement the per-node lookups. Derived results shared by
+    several checks are computed once.
+    """
+
+    ids: Sequence[str]
+    succ: Sequence[Sequence[int]]
+    in_degree: Sequence[int]
+    dependency_pairs: Sequence[Tuple[int, int]]
+    initial: Sequence[int]
+
+    def __init__(self):
+        self._roots: Optional[List[int]] = None
+        self._reachable: Optional[List[bool]] = None
+
+    def node_count(self) -> int:
+        return len(self.in_degree)
+
+    def is_terminator(self, i: int) -> bool:
+        raise NotImplementedError
+
+    def is_undefined(self, i: int) -> bool:
+        """
+        True for nodes that are referenced by an edge but never defined.
+        """
+        return False
+
+    def label(self, i: int) -> str:
+        return f"'{self.ids[i]}'"
+
+    def roots(self) -> List[int]:
+        """
+        Entry points: the graph's initial nodes, or else every node that has
+        outgoing but no incoming edges (or the first node if there is none).
+        """
+        if self._roots is None:
+            if self.initial:
+                roots = list(self.initial)
+            else:
+                roots = [
+                    i
+                    for i, targets in enumerate(self.succ)
+                    if self.in_degree[i] == 0 and any(t != i for t in targets)
+                ]
+                roots = roots or ([0] if self.node_count() else [])
+            self._roots = roots
+        return self._roots
+
+    def reachable(self) -> List[bool]:
+        if self._reachable is None:
+            self._reachable = _reachable(self.succ, self.roots())
+        return self._reachable
+
+
+class ModelGraphIndex(GraphIndex):
+    """
+    GraphIndex over a RequirementGraph; adjacency lists avoid dict lookups
+    per edge so the checks run in O(V + E).
+    """
+
+    def __init__(self, graph: RequirementGraph):
+        super().__init__()
+        self.graph = graph
+        self.ids = list(graph.nodes)
+        index: Dict[str, int] = {node_id: i for i, node_id in enumerate(self.ids)}
+        succ: List[List[int]] = [[] for _ in self.ids]
+        in_degree = [0] * len(self.ids)
+        dependency_pairs: List[Tuple[int, int]] = []
+
+        # Only flow edges count; CONTRADICTS and REFINES relate nodes without
+        # implying that one follows the other
+        transition = EdgeType.TRANSITION
+        depends_on = EdgeType.DEPENDS_ON
+        for edge in graph.edges:
+            edge_type = edge.type
+            if edge_type is not transition and edge_type is not depends_on:
+                continue
+            source = index.get(edge.source_id)
+            target = index.get(edge.target_id)
+            if source is None or target is None:
+                continue
+            succ[source].append(target)
+            if source != target:
+                in_degree[target] += 1
+            if edge_type is depends_on:
+                dependency_pairs.append((source, target))
+
+        self.index = index
+        self.succ = succ
+        self.in_degree = in_degree
+        self.dependency_pairs = dependency_pairs
+        self.initial = [
+            index[node_id] for node_id in graph.initial_node_ids if node_id in index
+        ]
+
+    def is_terminator(self, i: int) -> bool:
+        return self.graph.nodes[self.ids[i]].type == NodeType.TERMINATOR
+
+    def is_undefined(self, i: int) -> bool:
+        return bool(self.graph.nodes[self.ids[i]].metadata.get("undefined"))
+
+    def label(self, i: int) -> str:
+        return node_label(self.graph.nodes[self.ids[i]])
+
+
+def node_label(node: RequirementNode) -> str:
+    if node.content and node.content != node.id:
+        return f"'{node.id}' ({node.content})"
+    return f"'{node.id}'"
+
+
+def _reachable(succ: Sequence[Sequence[int]], roots: List[int]) -> List[bool]:
+    seen = [False] * len(succ)
+    queue = deque()
+    for root in roots:
+        if not seen[root]:
+            seen[root] = True
+            queue.append(root)
+    while queue:
+        v = queue.popleft()
+        for w in succ[v]:
+            if not seen[w]:
+                seen[w] = True
+                queue.append(w)
+    return seen
+
+
+def strongly_connected_components(
+    succ: Sequence[Sequence[int]],
+) -> List[List[int]]:
+    """
+    Tarjan's algorithm with an explicit stack (no recursion limit on deep graphs).
+    Components are returned in reverse topological order.
+    """
+    n = len(succ)
+    index = [-1] * n
+    low = [0] * n
+    next_edge = [0] * n
+    on_stack = [False] * n
+    stack: List[int] = []
+    components: List[List[int]] = []
+    counter = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [root]
+
+        while work:
+            v = work[-1]
+            edges = succ[v]
+            i = next_edge[v]
+            if i < len(edges):
+                next_edge[v] = i + 1
+                w = edges[i]
+                if index[w] == -1:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = True
+                    work.append(w)
+                elif on_stack[w] and index[w] < low[v]:
+                    low[v] = index[w]
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1]
+                if low[v] < low[parent]:
+                    low[parent] = low[v]
+            if low[v] == index[v]:
+                component = []
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = False
+                    component.append(w)
+                    if w == v:
+                        break
+                components.append(component)
+
+    return components
+
+
+def first_closed_cycle(
+    start: int,
+    is_closed_cycle: Callable[[int], bool],
+    successors: Callable[[int], Iterable[int]],
+    seen: Optional[Set[int]] = None,
+) -> Optional[int]:
+    """
+    Breadth-first search over the condensation from component `start` for
+    the first closed cycle. `successors` lists the components an exit edge
+    leads to, ordered by (source, target) node position; every component
+    reached is added to `seen`.
+    """
+    seen = set() if seen is None else seen
+    seen.add(start)
+    queue = deque([start])
+    while queue:
+        c = queue.popleft()
+        if is_closed_cycle(c):
+            return c
+        for d in successors(c):
+            if d not in seen:
+                seen.add(d)
+                queue.append(d)
+    return None
+
+
+AnyGraph = Union[RequirementGraph, GraphIndex]
+
+
+class GraphAnalysisService:
+    """
+    Structural checks on a requirement graph, or on any GraphIndex such as a
+    compact CSR graph. Every check is linear in the number of nodes and edges.
+    """
+
+    def analyze(self, graph: AnyGraph) -> List[GraphDefect]:
+        index = self._as_index(graph)
+        return self._dead_ends(index) + self._orphans(index) + self._cycles(index)
+
+    def detect_dead_ends(self, graph: AnyGraph) -> List[GraphDefect]:
+        return self._dead_ends(self._as_index(graph))
+
+    def detect_orphans(self, graph: AnyGraph) -> List[GraphDefect]:
+        return self._orphans(self._as_index(graph))
+
+    def detect_cycles(self, graph: AnyGraph) -> List[GraphDefect]:
+        return self._cycles(self._as_index(graph))
+
+    def to_defects(self, graph_defects: List[GraphDefect]) -> List[Defect]:
+        """
+        Convert graph defects into the report's Defect model.
+        """
+        return [
+            Defect(
+                id=f"GRAPH-{i:03d}",
+                category=DEFECT_CATEGORIES[d.type],
+                severity=d.severity,
+                location=", ".join(d.related_node_ids),
+                description=d.description,
+                recommendation=d.suggestion,
+            )
+            for i, d in enumerate(graph_defects, 1)
+        ]
+
+    @staticmethod
+    def _as_index(graph: AnyGraph) -> GraphIndex:
+        return graph if isinstance(graph, GraphIndex) else ModelGraphIndex(graph)
+
+    def _dead_ends(self, index: GraphIndex) -> List[GraphDefect]:
+        defects = []
+        succ, in_degree = index.succ, index.in_degree
+        for i in range(index.node_count()):
+            # Isolated nodes are reported as orphans instead
+            if len(succ[i]) or in_degree[i] == 0 or index.is_terminator(i):
+                continue
+            defects.append(
+                dead_end_defect(index.ids[i], index.label(i), index.is_undefined(i))
+            )
+        return defects
+
+    def _orphans(self, index: GraphIndex) -> List[GraphDefect]:
+        reachable = index.reachable()
+        defects = []
+        for i in range(index.node_count()):
+            if reachable[i]:
+                continue
+            defects.append(orphan_defect(index.ids[i], index.label(i)))
+        return defects
+
+    def _cycles(self, index: GraphIndex) -> List[GraphDefect]:
+        """
+        Report dependency cycles (any cycle through DEPENDS_ON edges) and
+        traps: reachable cycles, including a state that only loops back to
+        itself, that can never be left and contain no terminator. A graph
+        without terminators models a reactive system, whose main loop is
+        not a trap.
+        """
+        roots = index.roots()
+        reachable = index.reachable()
+        succ = index.succ
+        components = strongly_connected_components(succ)
+        component_of = [0] * index.node_count()
+        for c, component in enumerate(components):
+            for v in component:
+                component_of[v] = c
+
+        dependency_cycles = {
+            component_of[s]
+            for s, t in index.dependency_pairs
+            if component_of[s] == component_of[t]
+        }
+
+        # Closed components: no flow edge leaves them
+        closed = [False] * len(components)
+        has_terminator = False
+        for c, component in enumerate(components):
+            if any(index.is_terminator(v) for v in component):
+                has_terminator = True
+                continue
+            v = component[0]
+            is_cycle = len(component) > 1 or v in succ[v]
+            if is_cycle and reachable[v]:
+                closed[c] = all(
+                    component_of[w] == c for v in component for w in succ[v]
+                )
+        # The main loop of a reactive system is the first closed cycle reached
+        # from each initial node, past any boot or retry loops on the way.
+        # A system that can terminate has no endless main loop, so there every
+        # closed cycle, even one containing an initial node, is a trap.
+        main_loops = set()
+        if not has_terminator:
+            exits: List[List[Tuple[int, int]]] = [[] for _ in components]
+            for v in range(index.node_count()):
+                for w in succ[v]:
+                    if component_of[w] != component_of[v]:
+                        exits[component_of[v]].append((v, w))
+            for root in roots:
+                loop = first_closed_cycle(
+                    component_of[root],
+                    lambda c: len(components[c]) > 1 and closed[c],
+                    lambda c: [component_of[w] for _, w in sorted(exits[c])],
+                )
+                if loop is not None:
+                    main_loops.add(loop)
+
+        defects = []
+        # Reverse so components come out in topological (reading) order
+        for c in range(len(components) - 1, -1, -1):
+            is_dependency = c in dependency_cycles
+            is_trap = closed[c] and c not in main_loops
+            if not (is_dependency or is_trap):
+                continue
+
+            component = sorted(components[c])
+            defects.append(
+                cycle_defect(
+                    [index.ids[v] for v in component],
+                    [index.label(v) for v in component[:10]],
+                    is_trap,
+                )
+            )
+        return defects
+
+
+def dead_end_defect(node_id: str, label: str, undefined: bool) -> GraphDefect:
+    detail = " It is referenced but never defined." if undefined else ""
+    return GraphDefect(
+        type=DefectType.DEAD_END,
+        severity=Severity.MAJOR,
+        related_node_ids=[node_id],
+        description=f"{label} has no outgoing transition.{detail}",
+        suggestion=(
+            "Define how the system leaves this state, "
+            "or mark it as an intentional terminal state."
+        ),
+    )
+
+
+def orphan_defect(node_id: str, label: str) -> GraphDefect:
+    return GraphDefect(
+        type=DefectType.ORPHAN,
+        severity=Severity.MAJOR,
+        related_node_ids=[node_id],
+        description=f"{label} cannot be reached from any initial state.",
+        suggestion=(
+            "Add the transition that enters this state, "
+            "or remove it if it is obsolete."
+        ),
+    )
+
+
+def cycle_defect(node_ids: List[str], labels: List[str], is_trap: bool) -> GraphDefect:
+    """
+    `node_ids` lists the whole component; `labels` the first members to name.
+    """
+    names = " -> ".join(labels[:10])
+    if len(node_ids) > 10:
+        names += f" ... ({len(node_ids)} nodes)"
+    if is_trap:
+        return GraphDefect(
+            type=DefectType.CYCLE,
+            severity=Severity.CRITICAL,
+            related_node_ids=node_ids,
+            description=f"Cycle with no exit: {names}.",
+            suggestion="Add a transition that leaves this cycle.",
+        )
+    return GraphDefect(
+        type=DefectType.CYCLE,
+        severity=Severity.MAJOR,
+        related_node_ids=node_ids,
+        description=f"Circular dependency: {names}.",
+        suggestion="Break the cycle by removing or reversing a dependency.",
+    )
@@ -0,0 +1,237 @@
+import os
+import re
+import glob
+import json
+import time
+import hashlib
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from src.domain.models import AlloyCommandResult, AlloyModelResult, AlloyStatus
+from src.infrastructure.content_store import ContentStore
+
+DEFAULT_ALLOY_JAR = os.path.join("alloy", "app", "org.alloytools.alloy.dist.jar")
+
+# "00. check NoDeadlock    0    UNSAT" or "00. check NoDeadlock !Syntax error ..."
+_COMMAND_LINE = re.compile(
+    r"^\s*\d+\.\s+(?P<type>check|run)\s+(?P<name>\S+)\s*(?P<rest>.*)$"
+)
+
+
+class AlloyRunner:
+    """
+    Runs generated Alloy models (e.g. poc/intermediates/verify_VP_*.als)
+    through the Alloy CLI, up to `max_workers` solver processes at a time.
+
+    Each model runs in its own JVM with a timeout. Verdicts and
+    counterexamples are cached by the SHA-256 of the model text (which
+    includes each command's scope) together with the solver command line
+    and the size and mtime of its executables and jar, so a re-run only
+    solves the models that changed and a solver upgrade invalidates
+    everything.
+    """
+
+    def __init__(
+        self,
+        jar_path: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        timeout_seconds: float = 120.0,
+        cache_dir: Optional[str] = None,
+        command: Optional[List[str]] = None,
+    ):
+        jar_path = jar_path or os.getenv("ALLOY_JAR", DEFAULT_ALLOY_JAR)
+        # The solver command line without the "exec" arguments
+        self.command = command or ["java", "-jar", jar_path]
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.timeout_seconds = timeout_seconds
+        self.cache = ContentStore(cache_dir) if cache_dir else None
+        self.solver_identity = _solver_identity(self.command)
+
+    @staticmethod
+    def model_hash(source: str) -> str:
+        return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+    def run_directory(
+        self, directory: str, pattern: str = "*.als"
+    ) -> List[AlloyModelResult]:
+        paths = sorted(glob.glob(os.path.join(directory, pattern)))
+        return self.run(paths)
+
+    def run(self, paths: List[str]) -> List[AlloyModelResult]:
+        """
+        Check every model; results are returned in the order of `paths`.
+        """
+        if not paths:
+            return []
+        # The solvers are separate processes, so threads only wait on them
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(paths))) as pool:
+            return list(pool.map(self.run_model, paths))
+
+    def run_model(self, path: str) -> AlloyModelResult:
+        with open(path, "r", encoding="utf-8") as f:
+            model_hash = self.model_hash(f.read())
+
+        cache_key = ContentStore.key_for(self.solver_identity, model_hash)
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                result = AlloyModelResult.model_validate_json(cached)
+                return result.model_copy(update={"path": path, "cached": True})
+
+        started = time.perf_counter()
+        result, deterministic = self._solve(path, model_hash)
+        result.elapsed_seconds = time.perf_counter() - started
+        # Timeouts and launcher failures may pass on the next run
+        if deterministic and self.cache is not None:
+            self.cache.put(cache_key, result.model_dump_json())
+        return result
+
+    def _solve(self, path: str, model_hash: str):
+        with tempfile.TemporaryDirectory(prefix="alloy_") as output_dir:
+            args = self.command + [
+                "exec",
+                "--force",
+                "--type",
+                "json",
+                "--output",
+                output_dir,
+                path,
+            ]
+            try:
+                completed = subprocess.run(
+                    args,
+                    capture_output=True,
+                    text=True,
+                    encoding="utf-8",
+                    errors="replace",
+                    timeout=self.timeout_seconds,
+                )
+            except subprocess.TimeoutExpired:
+                return (
+                    AlloyModelResult(
+                        path=path,
+                        model_hash=model_hash,
+                        status=AlloyStatus.TIMEOUT,
+                        message=f"No verdict within {self.timeout_seconds:g} s",
+                    ),
+                    False,
+                )
+            except OSError as e:
+                return (
+                    AlloyModelResult(
+                        path=path,
+                        model_hash=model_hash,
+                        status=AlloyStatus.ERROR,
+                        message=f"Alloy CLI could not be started: {e}",
+                    ),
+                    False,
+                )
+
+            commands = _parse_commands(completed.stdout, output_dir)
+
+        if not commands:
+            output = (completed.stderr or completed.stdout).strip()
+            return (
+                AlloyModelResult(
+                    path=path,
+                    model_hash=model_hash,
+                    status=AlloyStatus.ERROR,
+                    message=f"Alloy CLI execution failed: {output[-2000:]}",
+                ),
+                completed.returncode == 0,
+            )
+        return (
+            AlloyModelResult(
+                path=path,
+                model_hash=model_hash,
+                status=_status(commands),
+                commands=commands,
+                message="; ".join(c.message for c in commands if c.message),
+            ),
+            True,
+        )
+
+
+def _solver_identity(command: List[str]) -> List[List]:
+    """
+    The command line plus (path, size, mtime) of every argument that names
+    an executable or a file, e.g. the java binary and the Alloy jar.
+    """
+    identity: List[List] = [list(command)]
+    for arg in command:
+        path = arg if os.path.isfile(arg) else shutil.which(arg)
+        if not path:
+            continue
+        path = os.path.realpath(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        identity.append([path, st.st_size, st.st_mtime_ns])
+    return identity
+
+
+def _parse_commands(stdout: str, output_dir: str) -> List[AlloyCommandResult]:
+    commands = []
+    for line in stdout.splitlines():
+        match = _COMMAND_LINE.match(line)
+        if not match:
+            continue
+        rest = match["rest"].strip()
+        verdict = re.search(r"\b(UNSAT|SAT)\b", rest)
+        command = AlloyCommandResult(name=match["name"], type=match["type"])
+        if rest.startswith("!") or not verdict:
+            command.message = rest.lstrip("!").strip()
+        else:
+            command.satisfiable = verdict.group(1) == "SAT"
+            if command.satisfiable:
+                command.solution = _read_solution(output_dir, command.name)
+        commands.append(command)
+    return commands
+
+
+def _read_solution(output_dir: str, name: str) -> Optional[Dict]:
+    # The CLI writes one JSON file per solution next to receipt.json
+    for path in sorted(
+        glob.glob(os.path.join(output_dir, f"{glob.escape(name)}*.json"))
+    ):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            continue
+    return None
+
+
+def _status(commands: List[AlloyCommandResult]) -> AlloyStatus:
+    if any(c.satisfiable is None for c in commands):
+        return AlloyStatus.ERROR
+    # A check is violated by a counterexample, a run by having no instance
+    violated = any(c.satisfiable == (c.type == "check") for c in commands)
+    return AlloyStatus.VIOLATION_FOUND if violated else AlloyStatus.PASSED
+
+
+def write_summary(results: List[AlloyModelResult], path: str) -> Dict:
+    """
+    Write a machine-readable summary of a run and return it.
+    """
+    totals = {status.value: 0 for status in AlloyStatus}
+    for result in results:
+        totals[result.status.value] += 1
+    summary = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "total": len(results),
+        "totals": totals,
+        "cached": sum(r.cached for r in results),
+        "results": [r.model_dump(mode="json") for r in results],
+    }
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+    return summary
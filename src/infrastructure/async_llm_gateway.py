@@ -0,0 +1,218 @@
+import os
+import asyncio
+import time
+import random
+import weakref
+from typing import Dict, Any, Callable, Awaitable, Optional
+
+from google import genai
+from openai import AsyncOpenAI
+
+from src.domain.interfaces import AsyncLLMGateway
+from src.infrastructure.llm_gateway import BaseLLMGateway
+from src.infrastructure.rate_limiter import classify_error
+from src.infrastructure.token_estimator import estimate_tokens
+from src.infrastructure.single_flight import AsyncSingleFlight
+
+
+class AsyncLLMGatewayImpl(BaseLLMGateway, AsyncLLMGateway):
+    """
+    Asyncio-native gateway backed by the async OpenAI and google-genai clients.
+    At most `max_concurrency` provider requests are in flight at once
+    (LLM_MAX_CONCURRENCY, default 8); everything else waits on the semaphore.
+    """
+
+    def __init__(self, max_concurrency: Optional[int] = None):
+        super().__init__()
+
+        if self.provider == "google":
+            self.client = genai.Client(api_key=self.google_api_key).aio
+        elif self.provider == "replay":
+            self.client = None
+        else:
+            self.client = AsyncOpenAI(
+                api_key=self.openai_api_key, base_url=self.openai_base_url
+            )
+
+        if max_concurrency is None:
+            max_concurrency = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+        self.max_concurrency = max(1, max_concurrency)
+        # One semaphore per event loop, so the gateway can be reused across
+        # asyncio.run() calls
+        self._semaphores = weakref.WeakKeyDictionary()
+        # Keeps its in-flight calls per event loop as well
+        self.single_flight = AsyncSingleFlight()
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def verify_requirements(
+        self, text: str, use_cache: bool = True
+    ) -> Dict[str, Any]:
+        chunks = self._plan_verification(text)
+        responses = await asyncio.gather(
+            *[
+                self._complete(
+                    None,
+                    self._build_verification_prompt(chunk),
+                    None,
+                    use_cache,
+                    expect_json=True,
+                )
+                for chunk in chunks
+            ]
+        )
+        results = [self._extract_json_block(r) for r in responses]
+        if len(results) == 1:
+            return results[0]
+
+        local, merge_prompt = self._prepare_merge(results)
+        if merge_prompt is None:
+            return local
+        try:
+            merge_response = await self._complete(
+                None, merge_prompt, None, use_cache, expect_json=True
+            )
+        except Exception as e:
+            print(f"Merge pass failed, using local merge: {e}")
+            return local
+        return self._finish_merge(merge_response, local)
+
+    async def call_llm_with_system(
+        self, system_prompt: str, user_prompt: str, use_cache: bool = True
+    ) -> str:
+        return await self._complete(system_prompt, user_prompt, None, use_cache)
+
+    async def call_llm_text(
+        self, prompt: str, temperature: float = None, use_cache: bool = True
+    ) -> str:
+        return await self._complete(None, prompt, temperature, use_cache)
+
+    async def _complete(
+        self,
+        system_prompt: Optional[str],
+        user_prompt: str,
+        temperature: Optional[float],
+        use_cache: bool = True,
+        expect_json: bool = False,
+    ) -> str:
+        key = self._request_key(system_prompt, user_prompt, temperature)
+        use_cache = use_cache and self.cache is not None
+        if use_cache:
+            # The cache reads and writes files; keep that off the event loop
+            cached = await asyncio.to_thread(self._cached_response, key, use_cache)
+            if cached is not None:
+                return cached
+
+        async def call_upstream() -> str:
+            response = await self._retry_with_backoff(
+                lambda: self._call_provider(system_prompt, user_prompt, temperature),
+                estimated_tokens=self._estimate_request_tokens(
+                    system_prompt, user_prompt
+                ),
+            )
+            if use_cache:
+                await asyncio.to_thread(
+                    self._store_response, key, response, use_cache, expect_json
+                )
+            return response
+
+        # Identical requests already in flight share one upstream call
+        response, _ = await self.single_flight.do(key, call_upstream)
+        return response
+
+    async def _retry_with_backoff(
+        self,
+        func: Callable[[], Awaitable[str]],
+        estimated_tokens: int = 0,
+        max_retries: int = 5,
+        initial_delay: float = 2.0,
+    ) -> str:
+        """
+        Awaits `func` under the shared rate limiter, with exponential backoff
+        on retryable errors. Fatal errors are raised immediately. The semaphore
+        is released while sleeping so other requests can proceed.
+        """
+        delay = initial_delay
+        for attempt in range(max_retries):
+            self.limiter_wait_seconds += await self.rate_limiter.acquire_async(
+                self.rate_limit_key, estimated_tokens
+            )
+            try:
+                async with self._semaphore():
+                    response = await func()
+                self.rate_limiter.consume(
+                    self.rate_limit_key, estimate_tokens(response or "")
+                )
+                return response
+            except Exception as e:
+                is_retryable, retry_after = classify_error(e)
+                if not is_retryable:
+                    print(f"Request failed with non-retryable error: {e}")
+                    raise e
+
+                if attempt == max_retries - 1:
+                    print(f"Max retries reached. Last error: {e}")
+                    raise e
+
+                print(f"Request failed (Attempt {attempt+1}/{max_retries}): {e}")
+                if retry_after is not None:
+                    print(f"Provider asked to retry after {retry_after:.2f} seconds...")
+                    self.rate_limiter.penalize(self.rate_limit_key, retry_after)
+                else:
+                    print(f"Retrying in {delay:.2f} seconds...")
+                    await asyncio.sleep(delay)
+                    # Exponential backoff with jitter
+                    delay = delay * 2 + random.uniform(0, 1)
+        return ""
+
+    async def _call_provider(
+        self,
+        system_prompt: Optional[str],
+        user_prompt: str,
+        temperature: Optional[float],
+    ) -> str:
+        # Cassettes are files, so they are read and written off the event loop
+        if self.provider == "replay":
+            response, latency = await asyncio.to_thread(
+                self._load_replay, system_prompt, user_prompt, temperature
+            )
+            await asyncio.sleep(latency)
+            return response
+
+        started_at = time.monotonic()
+        response = await self._call_remote(system_prompt, user_prompt, temperature)
+        if self.recorder is not None:
+            await asyncio.to_thread(
+                self._record,
+                system_prompt,
+                user_prompt,
+                temperature,
+                response,
+                started_at,
+            )
+        return response
+
+    async def _call_remote(
+        self,
+        system_prompt: Optional[str],
+        user_prompt: str,
+        temperature: Optional[float],
+    ) -> str:
+        if self.provider == "google":
+            response = await self.client.models.generate_content(
+                model=self.model_name,
+                contents=self._google_contents(system_prompt, user_prompt),
+                config=self._google_config(temperature),
+            )
+            return response.text
+        else:
+            response = await self.client.chat.completions.create(
+                **self._openai_kwargs(system_prompt, user_prompt, temperature)
+            )
+            return response.choices[0].message.content
@@ -0,0 +1,488 @@
+import sys
+import json
+import mmap
+import struct
+from array import array
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+from src.domain.models import (
+    EdgeType,
+    NodeId,
+    NodeType,
+    RequirementEdge,
+    RequirementGraph,
+    RequirementNode,
+)
+from src.domain.services import GraphIndex
+from src.infrastructure.graph_loader import GraphBuilder, parse_structure
+
+MAGIC = b"RQCG0001"
+_ALIGN = 8
+
+NODE_TYPES = list(NodeType)
+EDGE_TYPES = list(EdgeType)
+_TERMINATOR = NODE_TYPES.index(NodeType.TERMINATOR)
+_DEPENDS_ON = EDGE_TYPES.index(EdgeType.DEPENDS_ON)
+_FLOW_TYPES = {EDGE_TYPES.index(EdgeType.TRANSITION), _DEPENDS_ON}
+
+# Node flags
+FLAG_UNDEFINED = 1
+
+# Every numeric section of the binary file: name -> array typecode
+_SECTIONS = {
+    "node_types": "b",
+    "node_flags": "b",
+    "node_content": "q",
+    "in_degree": "q",
+    "initial": "q",
+    "fwd_offsets": "q",
+    "fwd_targets": "q",
+    "edge_types": "b",
+    "edge_labels": "q",
+    "edge_conditions": "q",
+    "rev_offsets": "q",
+    "rev_sources": "q",
+    "rev_edges": "q",
+    "id_offsets": "q",
+    "text_offsets": "q",
+}
+_BLOBS = ("id_blob", "text_blob")
+
+
+class StringTable:
+    """
+    Strings packed into one UTF-8 blob with an offset array.
+    Decoded strings are interned, so equal IDs share one object.
+    """
+
+    def __init__(self, blob: Sequence[int], offsets: Sequence[int]):
+        self.blob = blob
+        self.offsets = offsets
+
+    @classmethod
+    def from_strings(cls, strings: List[str]) -> "StringTable":
+        blob = bytearray()
+        offsets = array("q", [0])
+        for s in strings:
+            blob += s.encode("utf-8")
+            offsets.append(len(blob))
+        return cls(bytes(blob), offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        data = bytes(self.blob[self.offsets[i] : self.offsets[i + 1]])
+        return sys.intern(data.decode("utf-8"))
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
+class _Adjacency:
+    """
+    succ[v] view over CSR arrays: a slice of `targets` per node.
+    """
+
+    def __init__(self, offsets: Sequence[int], targets: Sequence[int]):
+        self.offsets = offsets
+        self.targets = targets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, v: int) -> Sequence[int]:
+        return self.targets[self.offsets[v] : self.offsets[v + 1]]
+
+    def __iter__(self):
+        return (self[v] for v in range(len(self)))
+
+
+class CompactGraph(GraphIndex):
+    """
+    Requirement graph in compressed sparse row (CSR) form.
+
+    Node IDs are interned into a string table and referenced by integer
+    index. Forward edges are `fwd_targets[fwd_offsets[v]:fwd_offsets[v+1]]`,
+    reverse edges likewise through `rev_offsets`/`rev_sources` (with
+    `rev_edges` pointing back at the forward edge). Edge types, labels and
+    conditions are parallel arrays. Node and edge metadata dicts are not kept.
+
+    save() writes every array into one file; load() maps it back with mmap so
+    several processes can share one large model without re-parsing. Only flow
+    edges (TRANSITION, DEPENDS_ON) are stored, as those are all the structural
+    checks need.
+    """
+
+    def __init__(self, sections: Dict[str, Sequence[int]], source=None):
+        super().__init__()
+        for name in _SECTIONS:
+            setattr(self, name, sections[name])
+        self.ids = StringTable(sections["id_blob"], sections["id_offsets"])
+        self.texts = StringTable(sections["text_blob"], sections["text_offsets"])
+        self.succ = _Adjacency(self.fwd_offsets, self.fwd_targets)
+        self.pred = _Adjacency(self.rev_offsets, self.rev_sources)
+        self._sections = sections
+        self._source = source  # open mmap backing the arrays, if any
+        self._index: Optional[Dict[str, int]] = None
+        self._dependency_pairs: Optional[List[Tuple[int, int]]] = None
+
+    # --- GraphIndex -------------------------------------------------------
+
+    @property
+    def dependency_pairs(self) -> List[Tuple[int, int]]:
+        if self._dependency_pairs is not None:
+            return self._dependency_pairs
+        pairs = []
+        edge_types, targets = self.edge_types, self.fwd_targets
+        for v in range(self.node_count()):
+            for e in range(self.fwd_offsets[v], self.fwd_offsets[v + 1]):
+                if edge_types[e] == _DEPENDS_ON:
+                    pairs.append((v, targets[e]))
+        self._dependency_pairs = pairs
+        return pairs
+
+    def is_terminator(self, i: int) -> bool:
+        return self.node_types[i] == _TERMINATOR
+
+    def is_undefined(self, i: int) -> bool:
+        return bool(self.node_flags[i] & FLAG_UNDEFINED)
+
+    def label(self, i: int) -> str:
+        node_id = self.ids[i]
+        content = self._text(self.node_content[i])
+        if content and content != node_id:
+            return f"'{node_id}' ({content})"
+        return f"'{node_id}'"
+
+    # --- Lookups -----------------------------------------------------------
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.fwd_targets)
+
+    def node_index(self, node_id: str) -> int:
+        if self._index is None:
+            self._index = {node: i for i, node in enumerate(self.ids)}
+        return self._index[node_id]
+
+    def _text(self, i: int) -> Optional[str]:
+        return None if i < 0 else self.texts[i]
+
+    # --- Conversion --------------------------------------------------------
+
+    @classmethod
+    def from_dict(
+        cls, data: Dict[str, Any], source_file: Optional[str] = None
+    ) -> "CompactGraph":
+        """
+        Parse an extraction JSON (either supported format) directly into CSR
+        arrays, without building pydantic objects.
+        """
+        builder = CompactGraphBuilder(source_file)
+        parse_structure(data, builder)
+        return builder.build()
+
+    @classmethod
+    def from_json_file(cls, path: str) -> "CompactGraph":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f), source_file=path)
+
+    @classmethod
+    def from_requirement_graph(cls, graph: RequirementGraph) -> "CompactGraph":
+        builder = CompactGraphBuilder()
+        for node in graph.nodes.values():
+            builder.add_node(node.id, node.content, node.type, node.metadata)
+        for edge in graph.edges:
+            builder.add_edge(
+                edge.source_id, edge.target_id, edge.type, edge.label, edge.condition
+            )
+        builder.set_initial(graph.initial_node_ids)
+        return builder.build()
+
+    def to_requirement_graph(self) -> RequirementGraph:
+        graph = RequirementGraph()
+        for i in range(self.node_count()):
+            node_id = NodeId(self.ids[i])
+            graph.add_node(
+                RequirementNode(
+                    id=node_id,
+                    content=self._text(self.node_content[i]) or node_id,
+                    type=NODE_TYPES[self.node_types[i]],
+                    metadata={"undefined": True} if self.is_undefined(i) else {},
+                )
+            )
+        for v in range(self.node_count()):
+            for e in range(self.fwd_offsets[v], self.fwd_offsets[v + 1]):
+                graph.add_edge(
+                    RequirementEdge(
+                        source_id=NodeId(self.ids[v]),
+                        target_id=NodeId(self.ids[self.fwd_targets[e]]),
+                        type=EDGE_TYPES[self.edge_types[e]],
+                        label=self._text(self.edge_labels[e]),
+                        condition=self._text(self.edge_conditions[e]),
+                    )
+                )
+        graph.initial_node_ids = [NodeId(self.ids[i]) for i in self.initial]
+        return graph
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Export in the state_transition JSON format. Undefined nodes are left
+        out of `states` so that loading the result marks them undefined again,
+        and edges other than transitions keep their type in "type". Display
+        names are not part of that format and are dropped, as are the entity
+        and output/constraint IDs of the entities format, which a CompactGraph
+        does not store.
+        """
+        n = self.node_count()
+        transitions = []
+        for v in range(n):
+            for e in range(self.fwd_offsets[v], self.fwd_offsets[v + 1]):
+                transition = {"src": self.ids[v], "tgt": self.ids[self.fwd_targets[e]]}
+                if self.edge_types[e] == _DEPENDS_ON:
+                    transition["type"] = EdgeType.DEPENDS_ON.value
+                label = self._text(self.edge_labels[e])
+                condition = self._text(self.edge_conditions[e])
+                if label is not None:
+                    transition["event"] = label
+                if condition is not None:
+                    transition["condition"] = condition
+                transitions.append(transition)
+        return {
+            "state_transition": {
+                "states": [self.ids[i] for i in range(n) if not self.is_undefined(i)],
+                "initial_states": [self.ids[i] for i in self.initial],
+                "final_states": [
+                    self.ids[i] for i in range(n) if self.is_terminator(i)
+                ],
+                "transitions": transitions,
+            }
+        }
+
+    # --- Binary persistence ------------------------------------------------
+
+    def save(self, path: str) -> None:
+        names = list(_SECTIONS) + list(_BLOBS)
+        header: Dict[str, Any] = {"byteorder": sys.byteorder, "sections": {}}
+        payloads = []
+        offset = 0
+        for name in names:
+            data = self._sections[name]
+            raw = bytes(data) if name in _BLOBS else _as_array(name, data).tobytes()
+            header["sections"][name] = [offset, len(raw)]
+            payloads.append(raw)
+            offset += _padded(len(raw))
+
+        header_bytes = json.dumps(header).encode("utf-8")
+        prefix_len = _padded(len(MAGIC) + 8 + len(header_bytes))
+        with open(path, "wb") as f:
+            f.write(MAGIC)
+            f.write(struct.pack("<Q", len(header_bytes)))
+            f.write(header_bytes)
+            f.write(b"\0" * (prefix_len - len(MAGIC) - 8 - len(header_bytes)))
+            for raw in payloads:
+                f.write(raw)
+                f.write(b"\0" * (_padded(len(raw)) - len(raw)))
+
+    @classmethod
+    def load(cls, path: str, use_mmap: bool = True) -> "CompactGraph":
+        """
+        Open a graph written by save(). With use_mmap the arrays are
+        zero-copy views of the mapped file; call close() when done.
+        """
+        with open(path, "rb") as f:
+            if use_mmap:
+                source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                source = f.read()
+        buffer = memoryview(source)
+
+        if bytes(buffer[: len(MAGIC)]) != MAGIC:
+            raise ValueError(f"{path} is not a compact requirement graph")
+        (header_len,) = struct.unpack_from("<Q", buffer, len(MAGIC))
+        start = len(MAGIC) + 8
+        header = json.loads(bytes(buffer[start : start + header_len]))
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError(
+                f"{path} was written on a {header['byteorder']}-endian host"
+            )
+        base = _padded(start + header_len)
+
+        sections: Dict[str, Sequence[int]] = {}
+        for name, (offset, length) in header["sections"].items():
+            view = buffer[base + offset : base + offset + length]
+            sections[name] = view if name in _BLOBS else view.cast(_SECTIONS[name])
+        return cls(sections, source=source if use_mmap else None)
+
+    def close(self) -> None:
+        """
+        Release the mapped file. The graph must not be used afterwards.
+        """
+        if self._source is None:
+            return
+        for name in list(self._sections):
+            view = self._sections[name]
+            if isinstance(view, memoryview):
+                view.release()
+        self._source.close()
+        self._source = None
+
+    def __enter__(self) -> "CompactGraph":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class CompactGraphBuilder(GraphBuilder):
+    """
+    GraphBuilder that collects edges in flat arrays and packs them into CSR.
+    """
+
+    def __init__(self, source_file: Optional[str] = None):
+        self.source_file = source_file
+        self.ids: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.texts: List[str] = []
+        self.text_index: Dict[str, int] = {}
+        self.node_types = array("b")
+        self.node_flags = array("b")
+        self.node_content = array("q")
+        self.sources = array("q")
+        self.targets = array("q")
+        self.edge_types = array("b")
+        self.edge_labels = array("q")
+        self.edge_conditions = array("q")
+        self.pending: List[Tuple[str, str, int, int, int]] = []
+        self.initial: List[str] = []
+
+    def has_node(self, node_id: str) -> bool:
+        return node_id in self.index
+
+    def add_node(
+        self,
+        node_id: str,
+        content: str,
+        node_type: NodeType,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        if node_id in self.index:
+            return
+        self.index[node_id] = len(self.ids)
+        self.ids.append(sys.intern(node_id))
+        self.node_types.append(NODE_TYPES.index(node_type))
+        undefined = bool(metadata and metadata.get("undefined"))
+        self.node_flags.append(FLAG_UNDEFINED if undefined else 0)
+        self.node_content.append(self._intern(content if content != node_id else None))
+
+    def add_edge(
+        self,
+        source_id: str,
+        target_id: str,
+        edge_type: EdgeType,
+        label: Optional[str] = None,
+        condition: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        type_code = EDGE_TYPES.index(edge_type)
+        if type_code not in _FLOW_TYPES:
+            return
+        self.pending.append(
+            (
+                source_id,
+                target_id,
+                type_code,
+                self._intern(label),
+                self._intern(condition),
+            )
+        )
+
+    def set_initial(self, node_ids: List[str]) -> None:
+        self.initial = list(node_ids)
+
+    def _intern(self, text: Optional[str]) -> int:
+        if text is None:
+            return -1
+        i = self.text_index.get(text)
+        if i is None:
+            i = self.text_index[text] = len(self.texts)
+            self.texts.append(text)
+        return i
+
+    def build(self) -> CompactGraph:
+        for source_id, target_id, type_code, label, condition in self.pending:
+            for node_id in (source_id, target_id):
+                if node_id not in self.index:
+                    self.add_node(node_id, node_id, NodeType.STATE, {"undefined": True})
+            self.sources.append(self.index[source_id])
+            self.targets.append(self.index[target_id])
+            self.edge_types.append(type_code)
+            self.edge_labels.append(label)
+            self.edge_conditions.append(condition)
+
+        n = len(self.ids)
+        m = len(self.sources)
+        fwd_offsets, fwd_order = _csr(self.sources, n)
+        rev_offsets, rev_order = _csr(self.targets, n)
+
+        in_degree = array("q", [0]) * n
+        for source, target in zip(self.sources, self.targets):
+            if source != target:
+                in_degree[target] += 1
+
+        id_table = StringTable.from_strings(self.ids)
+        text_table = StringTable.from_strings(self.texts)
+        # Reverse edges point at positions in the forward (CSR-ordered) arrays
+        fwd_position = array("q", [0]) * m
+        for position, e in enumerate(fwd_order):
+            fwd_position[e] = position
+
+        sections = {
+            "node_types": self.node_types,
+            "node_flags": self.node_flags,
+            "node_content": self.node_content,
+            "in_degree": in_degree,
+            "initial": array(
+                "q", [self.index[i] for i in self.initial if i in self.index]
+            ),
+            "fwd_offsets": fwd_offsets,
+            "fwd_targets": array("q", (self.targets[e] for e in fwd_order)),
+            "edge_types": array("b", (self.edge_types[e] for e in fwd_order)),
+            "edge_labels": array("q", (self.edge_labels[e] for e in fwd_order)),
+            "edge_conditions": array("q", (self.edge_conditions[e] for e in fwd_order)),
+            "rev_offsets": rev_offsets,
+            "rev_sources": array("q", (self.sources[e] for e in rev_order)),
+            "rev_edges": array("q", (fwd_position[e] for e in rev_order)),
+            "id_offsets": id_table.offsets,
+            "text_offsets": text_table.offsets,
+            "id_blob": id_table.blob,
+            "text_blob": text_table.blob,
+        }
+        return CompactGraph(sections)
+
+
+def _csr(keys: Sequence[int], n: int) -> Tuple[array, array]:
+    """
+    Counting sort of edge indices by `keys`: returns (offsets, order) where
+    the edges of node v are order[offsets[v]:offsets[v + 1]], in input order.
+    """
+    offsets = array("q", [0]) * (n + 1)
+    for k in keys:
+        offsets[k + 1] += 1
+    for v in range(n):
+        offsets[v + 1] += offsets[v]
+    cursor = array("q", offsets[:n])
+    order = array("q", [0]) * len(keys)
+    for e, k in enumerate(keys):
+        order[cursor[k]] = e
+        cursor[k] += 1
+    return offsets, order
+
+
+def _as_array(name: str, data: Sequence[int]) -> array:
+    return data if isinstance(data, array) else array(_SECTIONS[name], data)
+
+
+def _padded(size: int) -> int:
+    return (size + _ALIGN - 1) // _ALIGN * _ALIGN
@@ -0,0 +1,149 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from typing import Dict, Any, Optional
+
+
+class ContentStore:
+    """
+    On-disk, content-addressed store of strings with LRU eviction.
+
+    Each entry is a small JSON file named after its key, normally a SHA-256
+    from key_for(). The file mtime is bumped on every hit, so it doubles as
+    the LRU access time and survives process restarts. `max_age_seconds=None`
+    keeps entries until they are evicted by size.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_bytes: int = 256 * 1024 * 1024,
+        max_age_seconds: Optional[float] = None,
+    ):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        # key -> [size_in_bytes, last_access]
+        self._index: Dict[str, list] = {}
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._load_index()
+
+    @staticmethod
+    def key_for(*parts: Any) -> str:
+        """
+        SHA-256 of the JSON-serializable `parts`.
+        """
+        payload = json.dumps(list(parts), ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._entry_path(key)
+        with self._lock:
+            entry = self._read_entry(path)
+            if entry is None or self._is_expired(entry):
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            now = time.time()
+            try:
+                os.utime(path, (now, now))
+            except OSError:
+                pass
+            if key in self._index:
+                self._index[key][1] = now
+            # LLM cache entries written before the store was extracted
+            return entry["value"] if "value" in entry else entry.get("response")
+
+    def put(self, key: str, value: str) -> None:
+        path = self._entry_path(key)
+        data = json.dumps(
+            {"key": key, "created_at": time.time(), "value": value},
+            ensure_ascii=False,
+        ).encode("utf-8")
+
+        with self._lock:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+            if key in self._index:
+                self._total_bytes -= self._index[key][0]
+            self._index[key] = [len(data), time.time()]
+            self._total_bytes += len(data)
+            self._evict_if_needed()
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._index.keys()):
+                self._remove(key)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._index),
+                "bytes": self._total_bytes,
+                "evictions": self.evictions,
+            }
+
+    def _entry_path(self, key: str) -> str:
+        # Shard by prefix to keep directories small
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def _read_entry(self, path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _is_expired(self, entry: Dict[str, Any]) -> bool:
+        if self.max_age_seconds is None:
+            return False
+        return time.time() - entry.get("created_at", 0) > self.max_age_seconds
+
+    def _load_index(self) -> None:
+        for shard in os.scandir(self.cache_dir):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if not entry.name.endswith(".json"):
+                    continue
+                st = entry.stat()
+                key = entry.name[: -len(".json")]
+                self._index[key] = [st.st_size, st.st_mtime]
+                self._total_bytes += st.st_size
+
+    def _remove(self, key: str) -> None:
+        try:
+            os.remove(self._entry_path(key))
+        except OSError:
+            pass
+        size, _ = self._index.pop(key, (0, 0))
+        self._total_bytes -= size
+
+    def _evict_if_needed(self) -> None:
+        if self._total_bytes <= self.max_bytes:
+            return
+        # Least recently used first
+        for key, _ in sorted(self._index.items(), key=lambda kv: kv[1][1]):
+            if self._total_bytes <= self.max_bytes:
+                break
+            self._remove(key)
+            self.evictions += 1
@@ -1,18 +1,87 @@
 import os
+import json
+import mmap
+import atexit
+import hashlib
+import threading
+import weakref
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import date, datetime, time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
 import pandas as pd
+from openpyxl import load_workbook
 from pypdf import PdfReader
 from docx import Document
 
 from src.application.interfaces import FileContentProvider
+from src.domain.models import SourceUnit, TextChunk
+from src.infrastructure.content_store import ContentStore
+
+# Bump whenever the text produced for a format changes, so cached
+# conversions from older versions are no longer used
+CONVERTER_VERSION = 3
+
+# Formats worth caching; plain text is cheaper to read than to look up
+CACHED_EXTENSIONS = {".pdf", ".docx", ".doc", ".xlsx", ".xls"}
+
+# Start of each PDF page in converted text, so defects can cite pages
+PAGE_MARKER = "[p. {number}]"
 
 
 class FileConverter(FileContentProvider):
+    """
+    Converts requirement documents to plain text.
+
+    With `cache_dir`, converted text is cached by the SHA-256 of the file
+    content and CONVERTER_VERSION, with least-recently-used eviction above
+    `max_cache_bytes`. Files whose size and mtime are unchanged are not even
+    re-hashed. New hashes are written to the stat index by flush(), which
+    runs after each batch of reads and at exit.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_cache_bytes: int = 512 * 1024 * 1024,
+        max_workers: Optional[int] = None,
+    ):
+        # Processes used to extract the pages of one PDF
+        self.max_workers = max_workers or os.cpu_count() or 1
+        # One PDF extraction pool for every file this converter reads, so
+        # concurrent reads share max_workers processes; started on first use
+        self._pdf_pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        self.cache = None
+        self._stat_index: Dict[str, list] = {}
+        self._index_dirty = False
+        self._index_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        if cache_dir:
+            self.cache = ContentStore(
+                os.path.join(cache_dir, "text"), max_bytes=max_cache_bytes
+            )
+            self._index_path = os.path.join(cache_dir, "stat_index.json")
+            self._stat_index = self._load_stat_index()
+        atexit.register(_close_at_exit, weakref.ref(self))
+
     def read_text(self, file_path: str) -> str:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
 
         ext = os.path.splitext(file_path)[1].lower()
+        if self.cache is None or ext not in CACHED_EXTENSIONS:
+            return self._convert(file_path, ext)
+
+        key = self._cache_key(file_path, ext)
+        text = self.cache.get(key)
+        if text is None:
+            text = self._convert(file_path, ext)
+            self.cache.put(key, text)
+        return text
 
+    def _convert(self, file_path: str, ext: str) -> str:
         if ext == ".pdf":
             return self._read_pdf(file_path)
         elif ext in [".docx", ".doc"]:
@@ -24,12 +93,135 @@ class FileConverter(FileContentProvider):
             with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
                 return f.read()
 
+    def iter_chunks(
+        self, file_path: str, chunk_chars: int = 64 * 1024
+    ) -> Iterator[TextChunk]:
+        """
+        Convert a file piece by piece. PDF chunks are whole pages, Excel
+        chunks whole rows of one sheet and DOCX chunks whole paragraphs;
+        plain text is memory-mapped and split at line ends.
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext == ".pdf":
+            pieces = (
+                (None, number, PAGE_MARKER.format(number=number) + f"\n{text}\n")
+                for number, text in self.iter_pages(file_path)
+            )
+            yield from _group(file_path, SourceUnit.PAGE, pieces, chunk_chars)
+        elif ext in [".docx", ".doc"]:
+            # python-docx parses the document XML up front; only the text
+            # is produced incrementally
+            paragraphs = Document(file_path).paragraphs
+            pieces = (
+                (None, number, ("\n" if number > 1 else "") + paragraph.text)
+                for number, paragraph in enumerate(paragraphs, 1)
+            )
+            yield from _group(file_path, SourceUnit.PARAGRAPH, pieces, chunk_chars)
+        elif ext in [".xlsx", ".xls"]:
+            yield from _group(
+                file_path, SourceUnit.ROW, iter_excel_rows(file_path), chunk_chars
+            )
+        else:
+            yield from _iter_text_chunks(file_path, chunk_chars)
+
+    def _cache_key(self, file_path: str, ext: str) -> str:
+        payload = json.dumps([CONVERTER_VERSION, ext, self._content_hash(file_path)])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _content_hash(self, file_path: str) -> str:
+        path = os.path.abspath(file_path)
+        st = os.stat(path)
+        signature = [st.st_size, st.st_mtime_ns]
+        with self._index_lock:
+            entry = self._stat_index.get(path)
+            if entry is not None and entry[:2] == signature:
+                return entry[2]
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        content_hash = digest.hexdigest()
+
+        with self._index_lock:
+            self._stat_index[path] = signature + [content_hash]
+            self._index_dirty = True
+        return content_hash
+
+    def flush(self) -> None:
+        """
+        Write new stat index entries to disk, once for all files read since
+        the last flush.
+        """
+        if self.cache is None:
+            return
+        with self._flush_lock:
+            with self._index_lock:
+                if not self._index_dirty:
+                    return
+                snapshot = dict(self._stat_index)
+                self._index_dirty = False
+            tmp_path = f"{self._index_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+            os.replace(tmp_path, self._index_path)
+
+    def _load_stat_index(self) -> Dict[str, list]:
+        try:
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        # Entries of deleted files are dropped once, when the index is loaded
+        index = {p: e for p, e in data.items() if os.path.exists(p)}
+        self._index_dirty = len(index) != len(data)
+        return index
+
+    def iter_pages(
+        self,
+        file_path: str,
+        first_page: int = 1,
+        last_page: Optional[int] = None,
+    ) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (page number, text) for the pages of a PDF in order, starting
+        as soon as the first pages are extracted. Page numbers are 1-based
+        and the range is inclusive.
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+        executor = self._executor() if self.max_workers > 1 else None
+        return iter_pdf_pages(
+            file_path, first_page, last_page, self.max_workers, executor=executor
+        )
+
+    def _executor(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pdf_pool is None:
+                self._pdf_pool = _process_pool(self.max_workers)
+            return self._pdf_pool
+
+    def close(self) -> None:
+        """
+        Write the stat index and stop the PDF extraction processes.
+        """
+        self.flush()
+        with self._pool_lock:
+            pool, self._pdf_pool = self._pdf_pool, None
+        if pool is not None:
+            pool.shutdown()
+
     def _read_pdf(self, path: str) -> str:
-        reader = PdfReader(path)
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text() + "\n"
-        return text
+        parts = []
+        for number, text in self.iter_pages(path):
+            parts.append(PAGE_MARKER.format(number=number) + "\n")
+            parts.append(text + "\n")
+        return "".join(parts)
 
     def _read_docx(self, path: str) -> str:
         doc = Document(path)
@@ -37,11 +229,267 @@ class FileConverter(FileContentProvider):
         return text
 
     def _read_excel(self, path: str) -> str:
-        # Read all sheets, convert to markdown tables
-        sheets = pd.read_excel(path, sheet_name=None)
-        text = ""
-        for sheet_name, df in sheets.items():
-            text += f"## Sheet: {sheet_name}\n\n"
-            text += df.to_markdown(index=False)
-            text += "\n\n"
-        return text
+        return "".join(line for _, _, line in iter_excel_rows(path))
+
+
+def iter_pdf_pages(
+    path: str,
+    first_page: int = 1,
+    last_page: Optional[int] = None,
+    max_workers: int = 1,
+    pages_per_task: int = 8,
+    executor: Optional[Executor] = None,
+) -> Iterator[Tuple[int, str]]:
+    """
+    Extract PDF pages in ranges of `pages_per_task` on a process pool and
+    yield them in page order. At most two ranges per worker are in flight,
+    so memory stays bounded however long the document is. Pass `executor`
+    to share one pool between documents; otherwise a pool of `max_workers`
+    processes is started for this one.
+    """
+    page_count = len(PdfReader(path).pages)
+    last_page = page_count if last_page is None else min(last_page, page_count)
+    first_page = max(first_page, 1)
+    ranges = [
+        (start, min(start + pages_per_task, last_page + 1))
+        for start in range(first_page, last_page + 1, pages_per_task)
+    ]
+    if (executor is None and max_workers <= 1) or len(ranges) <= 1:
+        for start, end in ranges:
+            yield from _extract_pages(path, start, end)
+        return
+
+    if executor is not None:
+        yield from _extract_in_order(executor, path, ranges, 2 * max_workers)
+        return
+    with _process_pool(min(max_workers, len(ranges))) as pool:
+        yield from _extract_in_order(pool, path, ranges, 2 * max_workers)
+
+
+def _extract_in_order(
+    pool: Executor, path: str, ranges: List[Tuple[int, int]], window: int
+) -> Iterator[Tuple[int, str]]:
+    pending = [pool.submit(_extract_pages, path, *r) for r in ranges[:window]]
+    submitted = len(pending)
+    try:
+        while pending:
+            pages = pending.pop(0).result()
+            if submitted < len(ranges):
+                pending.append(pool.submit(_extract_pages, path, *ranges[submitted]))
+                submitted += 1
+            yield from pages
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _process_pool(max_workers: int) -> ProcessPoolExecutor:
+    # Forking a multi-threaded process (e.g. the Streamlit server) can
+    # deadlock the children, so workers are always spawned
+    return ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def _close_at_exit(ref: "weakref.ReferenceType[FileConverter]") -> None:
+    converter = ref()
+    if converter is not None:
+        converter.close()
+
+
+def _extract_pages(path: str, start: int, end: int) -> list:
+    reader = PdfReader(path)
+    return [
+        (number, reader.pages[number - 1].extract_text() or "")
+        for number in range(start, end)
+    ]
+
+
+# Chunking
+
+
+def _group(
+    file_path: str,
+    unit: SourceUnit,
+    pieces: Iterable[Tuple[Optional[str], int, str]],
+    chunk_chars: int,
+) -> Iterator[TextChunk]:
+    """
+    Pack consecutive (sheet, number, text) pieces into chunks of about
+    `chunk_chars`; a chunk never spans two sheets.
+    """
+    parts: List[str] = []
+    size = 0
+    sheet = start = end = None
+    for piece_sheet, number, text in pieces:
+        if parts and (piece_sheet != sheet or size >= chunk_chars):
+            yield TextChunk(
+                file_path=file_path,
+                text="".join(parts),
+                unit=unit,
+                start=start,
+                end=end,
+                sheet=sheet,
+            )
+            parts, size = [], 0
+        if not parts:
+            sheet, start = piece_sheet, number
+        end = number
+        parts.append(text)
+        size += len(text)
+    if parts:
+        yield TextChunk(
+            file_path=file_path,
+            text="".join(parts),
+            unit=unit,
+            start=start,
+            end=end,
+            sheet=sheet,
+        )
+
+
+def _iter_text_chunks(file_path: str, chunk_chars: int) -> Iterator[TextChunk]:
+    """
+    Split a memory-mapped text file at line ends into chunks of about
+    `chunk_chars` bytes. Offsets are byte offsets into the file.
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            position, length = 0, len(data)
+            while position < length:
+                cut = min(position + chunk_chars, length)
+                if cut < length:
+                    newline = data.rfind(b"\n", position, cut)
+                    if newline >= 0:
+                        cut = newline + 1
+                    else:
+                        # No line end: back off to a character boundary
+                        while cut > position + 1 and (
+                            data[cut] & 0xC0 == 0x80 or data[cut - 1] == 0x0D
+                        ):
+                            cut -= 1
+                text = data[position:cut].decode("utf-8", errors="ignore")
+                yield TextChunk(
+                    file_path=file_path,
+                    # Same newline translation as reading in text mode
+                    text=text.replace("\r\n", "\n").replace("\r", "\n"),
+                    unit=SourceUnit.BYTE,
+                    start=position,
+                    end=cut,
+                )
+                position = cut
+
+
+# Spreadsheets
+
+
+def iter_excel_rows(
+    path: str,
+    sheets: Optional[List[str]] = None,
+    first_row: int = 1,
+    last_row: Optional[int] = None,
+) -> Iterator[Tuple[str, int, str]]:
+    """
+    Render workbook sheets as compact Markdown tables, one row at a time.
+    Yields (sheet name, sheet row number, text); the header row's text also
+    carries the sheet heading and the table separator, the last row's text
+    the blank line that closes the table.
+
+    Cells are not padded, empty rows and columns are dropped and blank
+    header cells take the text of the header to their left, as merged
+    headers read back empty. `sheets` and the inclusive 1-based row range
+    select what is rendered; the header row is always included.
+    .xlsx is read in streaming mode, so memory does not grow with the
+    number of rows.
+    """
+    if os.path.splitext(path)[1].lower() != ".xlsx":
+        # Legacy .xls is only readable through pandas, which loads it whole
+        frames = pd.read_excel(path, sheet_name=sheets or None, header=None)
+        for name, frame in frames.items():
+            rows = [(i + 1, tuple(r)) for i, r in enumerate(frame.itertuples(False))]
+            yield from _render_sheet(str(name), lambda: iter(rows), first_row, last_row)
+        return
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        for name in workbook.sheetnames:
+            if sheets is not None and name not in sheets:
+                continue
+            worksheet = workbook[name]
+
+            def rows(worksheet=worksheet):
+                return enumerate(
+                    worksheet.iter_rows(max_row=last_row, values_only=True), 1
+                )
+
+            yield from _render_sheet(name, rows, first_row, last_row)
+    finally:
+        workbook.close()
+
+
+def _render_sheet(
+    name: str,
+    rows: Callable[[], Iterable[Tuple[int, tuple]]],
+    first_row: int,
+    last_row: Optional[int],
+) -> Iterator[Tuple[str, int, str]]:
+    # First pass: find the header row and the columns that hold any value
+    header_row = None
+    columns = set()
+    for number, values in rows():
+        if last_row is not None and number > last_row:
+            break
+        cells = [i for i, v in enumerate(values) if _cell_text(v)]
+        if not cells:
+            continue
+        if header_row is None:
+            header_row = number
+        elif number < first_row:
+            continue
+        columns.update(cells)
+    if header_row is None:
+        return
+    columns = sorted(columns)
+
+    # Second pass: render. Each row is held back until the next one, so
+    # the blank line closing the table belongs to the last row
+    last = None
+    for number, values in rows():
+        if last_row is not None and number > last_row:
+            break
+        if number == header_row:
+            header, previous = [], ""
+            for i in columns:
+                text = _cell_text(values[i] if i < len(values) else None)
+                previous = text or previous
+                header.append(previous)
+            separator = "|" + "---|" * len(columns)
+            last = (
+                number,
+                f"## Sheet: {name}\n\n|{'|'.join(header)}|\n{separator}\n",
+            )
+        elif number > header_row and number >= first_row:
+            cells = [
+                _cell_text(values[i] if i < len(values) else None) for i in columns
+            ]
+            if any(cells):
+                yield (name,) + last
+                last = (number, f"|{'|'.join(cells)}|\n")
+    yield name, last[0], last[1] + "\n"
+
+
+def _cell_text(value: Any) -> str:
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, datetime):
+        if value.time() == time(0):
+            return value.date().isoformat()
+        return value.isoformat(sep=" ")
+    if isinstance(value, date):
+        return value.isoformat()
+    text = str(value).strip()
+    return text.replace("|", "\\|").replace("\r\n", "<br>").replace("\n", "<br>")
@@ -0,0 +1,187 @@
+import json
+from typing import Dict, Any, List, Optional
+
+from src.domain.models import (
+    EdgeType,
+    NodeId,
+    NodeType,
+    RequirementEdge,
+    RequirementGraph,
+    RequirementNode,
+)
+
+WILDCARD_STATES = {"*", "Any", "ANY", "any"}
+
+
+class GraphBuilder:
+    """
+    Receives nodes and edges while an extraction JSON is parsed.
+    The default implementation builds a RequirementGraph; other
+    representations (e.g. CompactGraph) provide their own builder.
+    """
+
+    def __init__(self, source_file: Optional[str] = None):
+        self.source_file = source_file
+        self.graph = RequirementGraph()
+
+    def has_node(self, node_id: str) -> bool:
+        return node_id in self.graph.nodes
+
+    def add_node(
+        self,
+        node_id: str,
+        content: str,
+        node_type: NodeType,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.graph.add_node(
+            RequirementNode(
+                id=NodeId(node_id),
+                content=content,
+                type=node_type,
+                source_file=self.source_file,
+                metadata=metadata or {},
+            )
+        )
+
+    def add_edge(
+        self,
+        source_id: str,
+        target_id: str,
+        edge_type: EdgeType,
+        label: Optional[str] = None,
+        condition: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.graph.add_edge(
+            RequirementEdge(
+                source_id=NodeId(source_id),
+                target_id=NodeId(target_id),
+                type=edge_type,
+                label=label,
+                condition=condition,
+                metadata=metadata or {},
+            )
+        )
+
+    def set_initial(self, node_ids: List[str]) -> None:
+        self.graph.initial_node_ids = [NodeId(n) for n in node_ids]
+
+    def build(self) -> RequirementGraph:
+        return self.graph
+
+
+def load_requirement_graph(path: str) -> RequirementGraph:
+    """
+    Load a RequirementGraph from an extracted-structure JSON file.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return graph_from_dict(data, source_file=path)
+
+
+def graph_from_dict(
+    data: Dict[str, Any], source_file: Optional[str] = None
+) -> RequirementGraph:
+    builder = GraphBuilder(source_file)
+    parse_structure(data, builder)
+    return builder.build()
+
+
+def parse_structure(data: Dict[str, Any], builder: GraphBuilder) -> None:
+    """
+    Feed either supported extraction format into `builder`:
+
+    - entities/states/transitions (e.g. requirements/*_extracted.json)
+    - state_transition with states and src/tgt transitions
+      (e.g. poc/intermediates/agv_structure.json); a transition may carry an
+      EdgeType value as "type", "Transition" by default
+    """
+    if "entities" in data:
+        _parse_entities(data, builder)
+    elif "state_transition" in data:
+        _parse_state_transition(data["state_transition"], builder)
+    else:
+        raise ValueError(
+            "Unsupported structure: expected 'entities' or 'state_transition'"
+        )
+
+
+def _parse_entities(data: Dict[str, Any], builder: GraphBuilder) -> None:
+    initial = []
+    pending_edges = []
+
+    for entity in data.get("entities", []):
+        states = entity.get("states", [])
+        if states:
+            # The first listed state of each entity is its initial state
+            initial.append(states[0]["id"])
+        for state in states:
+            builder.add_node(
+                state["id"],
+                state.get("name", state["id"]),
+                _state_type(state),
+                {
+                    "entity": entity.get("id"),
+                    "description": state.get("description", ""),
+                },
+            )
+            for transition in state.get("transitions", []):
+                pending_edges.append((state["id"], transition))
+
+    for source, transition in pending_edges:
+        target = transition["target_state_id"]
+        _ensure_node(builder, target)
+        builder.add_edge(
+            source,
+            target,
+            EdgeType.TRANSITION,
+            label=transition.get("trigger_id"),
+            metadata={
+                "output_ids": transition.get("output_ids", []),
+                "constraint_ids": transition.get("constraint_ids", []),
+            },
+        )
+    builder.set_initial(initial)
+
+
+def _parse_state_transition(data: Dict[str, Any], builder: GraphBuilder) -> None:
+    states = data.get("states", [])
+    final_states = set(data.get("final_states", []))
+    for name in states:
+        node_type = NodeType.TERMINATOR if name in final_states else NodeType.STATE
+        builder.add_node(name, name, node_type)
+
+    for transition in data.get("transitions", []):
+        target = transition["tgt"]
+        _ensure_node(builder, target)
+        if transition["src"] in WILDCARD_STATES:
+            # "from any state": expand to every declared state except the target
+            sources = [name for name in states if name != target]
+        else:
+            sources = [transition["src"]]
+            _ensure_node(builder, sources[0])
+        edge_type = EdgeType(transition.get("type", EdgeType.TRANSITION.value))
+        for source in sources:
+            builder.add_edge(
+                source,
+                target,
+                edge_type,
+                label=transition.get("event"),
+                condition=transition.get("condition"),
+            )
+
+    # Without an explicit list, the first declared state is the initial one
+    builder.set_initial(data.get("initial_states") or states[:1])
+
+
+def _state_type(state: Dict[str, Any]) -> NodeType:
+    if state.get("is_final") or state.get("type") == "final":
+        return NodeType.TERMINATOR
+    return NodeType.STATE
+
+
+def _ensure_node(builder: GraphBuilder, node_id: str) -> None:
+    # Transitions may point at states the extraction never defined
+    if not builder.has_node(node_id):
+        builder.add_node(node_id, node_id, NodeType.STATE, {"undefined": True})
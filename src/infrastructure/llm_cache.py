@@ -0,0 +1,31 @@
+from typing import Optional
+
+from src.infrastructure.content_store import ContentStore
+
+
+class LLMResponseCache(ContentStore):
+    """
+    On-disk cache for LLM responses, keyed by the SHA-256 of the request
+    (provider, model, temperature, system prompt, user prompt). Entries
+    expire after a week by default.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_bytes: int = 256 * 1024 * 1024,
+        max_age_seconds: Optional[float] = 7 * 24 * 3600,
+    ):
+        super().__init__(cache_dir, max_bytes, max_age_seconds)
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model_name: str,
+        temperature: Optional[float],
+        system_prompt: Optional[str],
+        user_prompt: str,
+    ) -> str:
+        return ContentStore.key_for(
+            provider, model_name, temperature, system_prompt, user_prompt
+        )
@@ -0,0 +1,160 @@
+import os
+import json
+import math
+import time
+import random
+import hashlib
+import threading
+from typing import Dict, Any, Optional
+
+
+class CassetteMissError(LookupError):
+    """
+    Raised in replay mode when no recording exists for a request.
+    """
+
+    retryable = False
+
+
+class SimulatedRateLimitError(RuntimeError):
+    """
+    429 injected by the replay latency/error profile.
+    """
+
+    status_code = 429
+
+    def __init__(self, retry_after: Optional[float] = None):
+        super().__init__("429 Simulated rate limit (replay mode)")
+        self.retry_after = retry_after
+
+
+class LatencyProfile:
+    """
+    Simulated provider behaviour for replay mode.
+    Latency is drawn from a log-normal distribution fitted to the given
+    median (p50) and 99th percentile; `rate_limit_rate` is the fraction of
+    requests that fail with a 429.
+    """
+
+    # z-score of the 99th percentile of a standard normal distribution
+    _Z99 = 2.326
+
+    def __init__(
+        self,
+        p50_ms: float = 0.0,
+        p99_ms: Optional[float] = None,
+        rate_limit_rate: float = 0.0,
+        retry_after: Optional[float] = None,
+        seed: Optional[int] = None,
+    ):
+        self.p50_ms = p50_ms
+        self.p99_ms = p99_ms if p99_ms is not None else p50_ms
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "LatencyProfile":
+        p99 = os.getenv("LLM_REPLAY_LATENCY_P99_MS")
+        retry_after = os.getenv("LLM_REPLAY_RETRY_AFTER")
+        seed = os.getenv("LLM_REPLAY_SEED")
+        return cls(
+            p50_ms=float(os.getenv("LLM_REPLAY_LATENCY_P50_MS", "0")),
+            p99_ms=float(p99) if p99 else None,
+            rate_limit_rate=float(os.getenv("LLM_REPLAY_429_RATE", "0")),
+            retry_after=float(retry_after) if retry_after else None,
+            seed=int(seed) if seed else None,
+        )
+
+    def sample_latency(self) -> float:
+        """
+        Return a simulated request latency in seconds.
+        """
+        if self.p50_ms <= 0:
+            return 0.0
+        sigma = max(0.0, math.log(max(self.p99_ms, self.p50_ms) / self.p50_ms))
+        sigma /= self._Z99
+        with self._lock:
+            return self._random.lognormvariate(math.log(self.p50_ms), sigma) / 1000.0
+
+    def maybe_fail(self) -> None:
+        if self.rate_limit_rate <= 0:
+            return
+        with self._lock:
+            hit = self._random.random() < self.rate_limit_rate
+        if hit:
+            raise SimulatedRateLimitError(self.retry_after)
+
+
+class CassetteStore:
+    """
+    Directory of recorded LLM exchanges, one JSON file per request.
+    Keys ignore provider and model so traffic recorded against any real
+    provider can be replayed with LLM_PROVIDER=replay.
+    """
+
+    def __init__(self, cassette_dir: str):
+        self.cassette_dir = cassette_dir
+        os.makedirs(self.cassette_dir, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        system_prompt: Optional[str], user_prompt: str, temperature: Optional[float]
+    ) -> str:
+        payload = json.dumps(
+            [temperature, system_prompt, user_prompt], ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def record(
+        self,
+        system_prompt: Optional[str],
+        user_prompt: str,
+        temperature: Optional[float],
+        response: str,
+        provider: str,
+        model_name: str,
+        latency_ms: Optional[float] = None,
+    ) -> None:
+        key = self.make_key(system_prompt, user_prompt, temperature)
+        entry = {
+            "key": key,
+            "provider": provider,
+            "model": model_name,
+            "temperature": temperature,
+            "system_prompt": system_prompt,
+            "user_prompt": user_prompt,
+            "response": response,
+            "latency_ms": latency_ms,
+            "recorded_at": time.time(),
+        }
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+    def load(
+        self,
+        system_prompt: Optional[str],
+        user_prompt: str,
+        temperature: Optional[float],
+    ) -> Dict[str, Any]:
+        key = self.make_key(system_prompt, user_prompt, temperature)
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            raise CassetteMissError(
+                f"No recorded response for request {key[:12]} in {self.cassette_dir}. "
+                "Record it first with LLM_RECORD_DIR against a real provider."
+            )
+        self.hits += 1
+        return entry
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cassette_dir, f"{key}.json")
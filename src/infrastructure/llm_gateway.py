@@ -3,7 +3,7 @@ import json
 import re
 import time
 import random
-from typing import Dict, Any, List, Callable
+from typing import Dict, Any, List, Callable, Optional, Iterator, Tuple
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -11,11 +11,45 @@ from google import genai
 from openai import OpenAI
 
 from src.domain.interfaces import LLMGateway
+from src.infrastructure.llm_cache import LLMResponseCache
+from src.infrastructure.rate_limiter import get_rate_limiter, classify_error
+from src.infrastructure.token_estimator import (
+    estimate_tokens,
+    estimate_cost,
+    context_window,
+)
+from src.infrastructure.section_chunker import SectionChunker
+from src.infrastructure.streaming_json import IncrementalDefectParser
+from src.infrastructure.single_flight import get_single_flight
+from src.infrastructure.llm_cassette import CassetteStore, LatencyProfile
 
 load_dotenv()
 
+# Size of the chunks a replayed response is streamed in
+REPLAY_CHUNK_CHARS = 64
+
+# Assumed completion size of one verification call, for cost estimates
+EXPECTED_OUTPUT_TOKENS = 2048
+
+# Summary of the placeholder result returned for unparseable responses
+PARSE_ERROR_SUMMARY = "Error parsing LLM response"
+
+
+class StreamInterruptedError(RuntimeError):
+    """
+    Raised when a stream fails after output was already delivered to callers.
+    Not retried, since a retry would emit the same tokens twice.
+    """
+
+    retryable = False
+
+
+class BaseLLMGateway:
+    """
+    Provider settings, response cache and response parsing shared by the
+    synchronous and asynchronous gateways. Subclasses create the client.
+    """
 
-class LLMGatewayImpl(LLMGateway):
     def __init__(self):
         self.google_api_key = os.getenv("GOOGLE_API_KEY")
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
@@ -27,12 +61,10 @@ class LLMGatewayImpl(LLMGateway):
 
         if self.provider == "google":
             self.model_name = os.getenv("GOOGLE_MODEL", "gemini-2.0-flash-exp")
-            self.client = genai.Client(api_key=self.google_api_key)
+        elif self.provider == "replay":
+            self.model_name = os.getenv("REPLAY_MODEL", "replay")
         else:
             self.model_name = os.getenv("OPENAI_MODEL", "gpt-4o")
-            self.client = OpenAI(
-                api_key=self.openai_api_key, base_url=self.openai_base_url
-            )
 
         # Resolve prompt path
         self.prompt_path = (
@@ -40,18 +72,207 @@ class LLMGatewayImpl(LLMGateway):
             / "prompts"
             / "verify_requirements_llm.md"
         )
+        self.merge_prompt_path = (
+            Path(__file__).parent.parent.parent
+            / "prompts"
+            / "merge_verification_results.md"
+        )
 
-    def verify_requirements(self, text: str) -> Dict[str, Any]:
+        # Token budget for a single verification call. Documents that do not
+        # fit are verified chunk by chunk and merged (map-reduce).
+        self.output_token_reserve = int(os.getenv("LLM_OUTPUT_TOKEN_RESERVE", "8192"))
+        max_input_tokens = os.getenv("LLM_MAX_INPUT_TOKENS")
+        self.max_input_tokens = int(max_input_tokens) if max_input_tokens else None
+
+        # Response cache (disable with LLM_CACHE_ENABLED=false)
+        self.cache = None
+        if os.getenv("LLM_CACHE_ENABLED", "true").lower() not in ("0", "false", "no"):
+            max_age = float(os.getenv("LLM_CACHE_MAX_AGE_SECONDS", str(7 * 24 * 3600)))
+            self.cache = LLMResponseCache(
+                cache_dir=os.getenv(
+                    "LLM_CACHE_DIR",
+                    str(Path(__file__).parent.parent.parent / ".llm_cache"),
+                ),
+                max_bytes=int(os.getenv("LLM_CACHE_MAX_BYTES", str(256 * 1024 * 1024))),
+                max_age_seconds=max_age if max_age > 0 else None,
+            )
+
+        # Process-wide RPM/TPM budgets shared by every gateway instance
+        self.rate_limiter = get_rate_limiter()
+        self.rate_limit_key = f"{self.provider}:{self.model_name}"
+        self.limiter_wait_seconds = 0.0
+
+        # Record/replay: LLM_PROVIDER=replay serves recorded cassettes offline,
+        # LLM_RECORD_DIR captures real traffic into cassettes.
+        self.cassettes = None
+        self.latency_profile = None
+        self.recorder = None
+        if self.provider == "replay":
+            self.cassettes = CassetteStore(
+                os.getenv(
+                    "LLM_CASSETTE_DIR",
+                    str(Path(__file__).parent.parent.parent / "cassettes"),
+                )
+            )
+            self.latency_profile = LatencyProfile.from_env()
+        elif os.getenv("LLM_RECORD_DIR"):
+            self.recorder = CassetteStore(os.getenv("LLM_RECORD_DIR"))
+
+    def _build_verification_prompt(self, text: str) -> str:
         if not self.prompt_path.exists():
             raise FileNotFoundError(f"Prompt file not found at {self.prompt_path}")
 
         with open(self.prompt_path, "r", encoding="utf-8") as f:
             prompt_tmpl = f.read()
 
-        prompt = prompt_tmpl.replace("{{requirement_text}}", text)
+        return prompt_tmpl.replace("{{requirement_text}}", text)
+
+    def _input_token_budget(self) -> int:
+        budget = context_window(self.model_name) - self.output_token_reserve
+        if self.max_input_tokens is not None:
+            budget = min(budget, self.max_input_tokens)
+        return budget
+
+    def _plan_verification(self, text: str) -> List[str]:
+        """
+        Return the requirement text split into pieces that each fit the
+        model's input budget together with the prompt template.
+        """
+        template_tokens = estimate_tokens(self._build_verification_prompt(""))
+        available = max(1024, self._input_token_budget() - template_tokens)
+        if estimate_tokens(text) <= available:
+            return [text]
+        return [chunk.text for chunk in SectionChunker(available).split(text)]
+
+    def estimate_verification(self, text: str) -> Dict[str, Any]:
+        chunks = self._plan_verification(text)
+        template_tokens = estimate_tokens(self._build_verification_prompt(""))
+        input_tokens = sum(estimate_tokens(c) + template_tokens for c in chunks)
+        calls = len(chunks)
+        if len(chunks) > 1:
+            # The merge call reads roughly every chunk's output
+            calls += 1
+            input_tokens += len(chunks) * EXPECTED_OUTPUT_TOKENS
+        output_tokens = calls * EXPECTED_OUTPUT_TOKENS
+
+        return {
+            "model": self.model_name,
+            "context_window": context_window(self.model_name),
+            "input_token_budget": self._input_token_budget(),
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "chunks": len(chunks),
+            "calls": calls,
+            "estimated_cost_usd": estimate_cost(
+                self.model_name, input_tokens, output_tokens
+            ),
+        }
+
+    def _tag_chunk_defects(
+        self, index: int, defects: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        # Every chunk numbers its defects from DEF-001; keep IDs unique
+        tagged = []
+        for d in defects:
+            d = dict(d)
+            d["id"] = f"C{index + 1}-{d.get('id', 'N/A')}"
+            tagged.append(d)
+        return tagged
+
+    def _prepare_merge(
+        self, chunk_results: List[Dict[str, Any]]
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        Merge chunk results locally (exact duplicates removed) and build the
+        prompt for the LLM merge/dedupe pass. The prompt is None when the
+        merge input itself would not fit the budget.
+        """
+        summaries = []
+        defects = []
+        seen = set()
+        for index, result in enumerate(chunk_results):
+            summaries.append(
+                f"- Chunk {index + 1}: {result.get('summary', 'No summary provided.')}"
+            )
+            for d in self._tag_chunk_defects(index, result.get("defects", [])):
+                identity = (
+                    d.get("category"),
+                    " ".join(str(d.get("location", "")).split()).lower(),
+                    " ".join(str(d.get("description", "")).split()).lower(),
+                )
+                if identity in seen:
+                    continue
+                seen.add(identity)
+                defects.append(d)
+
+        local = {"summary": "\n".join(summaries), "defects": defects}
+
+        if not self.merge_prompt_path.exists() or not defects:
+            return local, None
+        with open(self.merge_prompt_path, "r", encoding="utf-8") as f:
+            merge_tmpl = f.read()
+        prompt = merge_tmpl.replace("{{chunk_summaries}}", local["summary"]).replace(
+            "{{defects_json}}", json.dumps(defects, ensure_ascii=False, indent=2)
+        )
+        if estimate_tokens(prompt) > self._input_token_budget():
+            return local, None
+        return local, prompt
+
+    def _finish_merge(
+        self, merge_response: Optional[str], local: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        if not merge_response:
+            return local
+        merged = self._extract_json_block(merge_response)
+        if not isinstance(merged, dict) or (
+            local["defects"] and not merged.get("defects")
+        ):
+            # Unparseable or lossy merge; keep the local result
+            return local
+        return merged
+
+    def _request_key(
+        self,
+        system_prompt: Optional[str],
+        user_prompt: str,
+        temperature: Optional[float],
+    ) -> str:
+        """
+        Content hash identifying a request; used for caching and coalescing.
+        """
+        return LLMResponseCache.make_key(
+            self.provider, self.model_name, temperature, system_prompt, user_prompt
+        )
+
+    def _google_contents(self, system_prompt: Optional[str], user_prompt: str) -> str:
+        # generate_content has no separate system role here, so the
+        # system prompt is prepended to the user prompt.
+        if system_prompt is None:
+            return user_prompt
+        return f"System: {system_prompt}\n\nUser: {user_prompt}"
+
+    def _google_config(self, temperature: Optional[float]):
+        from google.genai.types import GenerateContentConfig
+
+        if temperature is None:
+            return None
+        return GenerateContentConfig(temperature=temperature)
+
+    def _openai_kwargs(
+        self,
+        system_prompt: Optional[str],
+        user_prompt: str,
+        temperature: Optional[float],
+    ) -> Dict[str, Any]:
+        messages = []
+        if system_prompt is not None:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": user_prompt})
 
-        response_text = self._call_llm_generic(prompt)
-        return self._extract_json_block(response_text)
+        kwargs = {"model": self.model_name, "messages": messages}
+        if temperature is not None:
+            kwargs["temperature"] = temperature
+        return kwargs
 
     def _extract_json_block(self, text: str) -> dict:
         # Remove <think> blocks (often from reasoning models)
@@ -71,71 +292,400 @@ class LLMGatewayImpl(LLMGateway):
         try:
             return json.loads(json_str)
         except json.JSONDecodeError:
-            return {"summary": "Error parsing LLM response", "defects": []}
+            return {"summary": PARSE_ERROR_SUMMARY, "defects": []}
+
+    def _estimate_request_tokens(
+        self, system_prompt: Optional[str], user_prompt: str
+    ) -> int:
+        return estimate_tokens(system_prompt or "") + estimate_tokens(user_prompt)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        if self.cache is None:
+            return {}
+        return self.cache.stats()
+
+    def _cached_response(self, key: str, use_cache: bool) -> Optional[str]:
+        if self.cache is None or not use_cache:
+            return None
+        return self.cache.get(key)
+
+    def _store_response(
+        self,
+        key: str,
+        response: Optional[str],
+        use_cache: bool = True,
+        expect_json: bool = False,
+    ) -> None:
+        """
+        Cache a fresh response. Responses that should be JSON are only cached
+        once they parse, so a bad completion is not replayed on every retry.
+        """
+        if self.cache is None or not use_cache or not response:
+            return
+        if expect_json and not self._parses_as_json(response):
+            return
+        self.cache.put(key, response)
+
+    def _parses_as_json(self, response: str) -> bool:
+        result = self._extract_json_block(response)
+        return not (
+            isinstance(result, dict) and result.get("summary") == PARSE_ERROR_SUMMARY
+        )
+
+    def _load_replay(
+        self,
+        system_prompt: Optional[str],
+        user_prompt: str,
+        temperature: Optional[float],
+    ) -> Tuple[str, float]:
+        """
+        Return the recorded response and the simulated latency in seconds.
+        """
+        self.latency_profile.maybe_fail()
+        entry = self.cassettes.load(system_prompt, user_prompt, temperature)
+        return entry["response"], self.latency_profile.sample_latency()
+
+    def _record(
+        self,
+        system_prompt: Optional[str],
+        user_prompt: str,
+        temperature: Optional[float],
+        response: Optional[str],
+        started_at: float,
+    ) -> None:
+        if self.recorder is None or not response:
+            return
+        self.recorder.record(
+            system_prompt,
+            user_prompt,
+            temperature,
+            response,
+            provider=self.provider,
+            model_name=self.model_name,
+            latency_ms=(time.monotonic() - started_at) * 1000.0,
+        )
+
+    def rate_limit_stats(self) -> Dict[str, Any]:
+        stats = self.rate_limiter.stats()
+        stats["gateway_wait_seconds"] = self.limiter_wait_seconds
+        return stats
+
+    def single_flight_stats(self) -> Dict[str, int]:
+        return self.single_flight.stats()
+
+
+class LLMGatewayImpl(BaseLLMGateway, LLMGateway):
+    def __init__(self):
+        super().__init__()
+        self.single_flight = get_single_flight()
+
+        if self.provider == "google":
+            self.client = genai.Client(api_key=self.google_api_key)
+        elif self.provider == "replay":
+            self.client = None
+        else:
+            self.client = OpenAI(
+                api_key=self.openai_api_key, base_url=self.openai_base_url
+            )
+
+    def verify_requirements(self, text: str, use_cache: bool = True) -> Dict[str, Any]:
+        chunks = self._plan_verification(text)
+        results = []
+        for chunk in chunks:
+            prompt = self._build_verification_prompt(chunk)
+            response_text = self._call_llm_generic(prompt, use_cache=use_cache)
+            results.append(self._extract_json_block(response_text))
+
+        if len(results) == 1:
+            return results[0]
+        return self._merge_chunk_results(results, use_cache)
+
+    def _merge_chunk_results(
+        self, chunk_results: List[Dict[str, Any]], use_cache: bool = True
+    ) -> Dict[str, Any]:
+        local, merge_prompt = self._prepare_merge(chunk_results)
+        if merge_prompt is None:
+            return local
+        try:
+            merge_response = self._call_llm_generic(merge_prompt, use_cache=use_cache)
+        except Exception as e:
+            print(f"Merge pass failed, using local merge: {e}")
+            return local
+        return self._finish_merge(merge_response, local)
+
+    def verify_requirements_stream(
+        self,
+        text: str,
+        on_token: Optional[Callable[[str], None]] = None,
+        on_defect: Optional[Callable[[Dict[str, Any]], None]] = None,
+        use_cache: bool = True,
+    ) -> Dict[str, Any]:
+        chunks = self._plan_verification(text)
+        results = []
+        for index, chunk in enumerate(chunks):
+            parser = IncrementalDefectParser()
+            emitted = []
+
+            def handle_chunk(chunk_text: str) -> None:
+                if on_token:
+                    on_token(chunk_text)
+                for defect in parser.feed(chunk_text):
+                    emitted.append(defect)
+                    if on_defect:
+                        if len(chunks) > 1:
+                            defect = self._tag_chunk_defects(index, [defect])[0]
+                        on_defect(defect)
+
+            response_text = self._complete_stream(
+                None,
+                self._build_verification_prompt(chunk),
+                None,
+                handle_chunk,
+                use_cache=use_cache,
+                expect_json=True,
+            )
+            result = self._extract_json_block(response_text)
+            if not result.get("defects") and emitted:
+                # The tail of the response was malformed; keep what was complete
+                result["defects"] = emitted
+            results.append(result)
+
+        if len(results) == 1:
+            return results[0]
+        return self._merge_chunk_results(results, use_cache)
 
     def _retry_with_backoff(
-        self, func: Callable, max_retries: int = 5, initial_delay: float = 2.0
+        self,
+        func: Callable,
+        estimated_tokens: int = 0,
+        max_retries: int = 5,
+        initial_delay: float = 2.0,
     ) -> str:
         """
-        Executes a function with exponential backoff on exception.
+        Executes a function under the shared rate limiter, with exponential
+        backoff on retryable errors. Fatal errors (auth, bad request) are
+        raised immediately; a provider Retry-After pauses the whole key.
         """
         delay = initial_delay
         for attempt in range(max_retries):
+            self.limiter_wait_seconds += self.rate_limiter.acquire(
+                self.rate_limit_key, estimated_tokens
+            )
             try:
-                return func()
-            except Exception as e:
-                # Check for rate limit keywords if possible
-                error_msg = str(e).lower()
-                is_rate_limit = (
-                    "429" in error_msg
-                    or "quota" in error_msg
-                    or "rate limit" in error_msg
+                response = func()
+                self.rate_limiter.consume(
+                    self.rate_limit_key, estimate_tokens(response or "")
                 )
+                return response
+            except Exception as e:
+                is_retryable, retry_after = classify_error(e)
+                if not is_retryable:
+                    print(f"Request failed with non-retryable error: {e}")
+                    raise e
 
                 if attempt == max_retries - 1:
                     print(f"Max retries reached. Last error: {e}")
                     raise e
 
                 print(f"Request failed (Attempt {attempt+1}/{max_retries}): {e}")
-                print(f"Retrying in {delay:.2f} seconds...")
-
-                time.sleep(delay)
-                # Exponential backoff with jitter
-                delay = delay * 2 + random.uniform(0, 1)
+                if retry_after is not None:
+                    # The limiter holds every caller until the provider is ready
+                    print(f"Provider asked to retry after {retry_after:.2f} seconds...")
+                    self.rate_limiter.penalize(self.rate_limit_key, retry_after)
+                else:
+                    print(f"Retrying in {delay:.2f} seconds...")
+                    time.sleep(delay)
+                    # Exponential backoff with jitter
+                    delay = delay * 2 + random.uniform(0, 1)
         return ""
 
-    def _call_llm_generic(self, prompt: str, temperature: float = None) -> str:
-        if self.provider == "google":
-            from google.genai.types import GenerateContentConfig
-
-            def call_google():
-                config = (
-                    GenerateContentConfig(temperature=temperature)
-                    if temperature is not None
-                    else None
-                )
-                response = self.client.models.generate_content(
-                    model=self.model_name,
-                    contents=prompt,
-                    config=config,
-                )
-                return response.text
+    def _call_llm_generic(
+        self, prompt: str, temperature: float = None, use_cache: bool = True
+    ) -> str:
+        """
+        Request whose response is parsed with _extract_json_block.
+        """
+        return self._complete(None, prompt, temperature, use_cache, expect_json=True)
+
+    def _complete(
+        self,
+        system_prompt: Optional[str],
+        user_prompt: str,
+        temperature: Optional[float],
+        use_cache: bool = True,
+        expect_json: bool = False,
+    ) -> str:
+        """
+        Single entry point for every LLM request.
+        Serves repeated requests from the response cache; `use_cache=False`
+        forces a fresh provider call and leaves the cache untouched. With
+        `expect_json`, only responses that parse as JSON are cached.
+        """
+        key = self._request_key(system_prompt, user_prompt, temperature)
+        cached = self._cached_response(key, use_cache)
+        if cached is not None:
+            return cached
+
+        def call_upstream() -> str:
+            response = self._retry_with_backoff(
+                lambda: self._call_provider(system_prompt, user_prompt, temperature),
+                estimated_tokens=self._estimate_request_tokens(
+                    system_prompt, user_prompt
+                ),
+            )
+            self._store_response(key, response, use_cache, expect_json)
+            return response
+
+        # Identical requests already in flight share one upstream call
+        response, _ = self.single_flight.do(key, call_upstream)
+        return response
+
+    def _complete_stream(
+        self,
+        system_prompt: Optional[str],
+        user_prompt: str,
+        temperature: Optional[float],
+        on_chunk: Callable[[str], None],
+        use_cache: bool = True,
+        expect_json: bool = False,
+    ) -> str:
+        """
+        Streaming counterpart of _complete: passes each chunk to `on_chunk`
+        and returns the full response. Cache hits and coalesced requests
+        are delivered as one chunk.
+        """
+        key = self._request_key(system_prompt, user_prompt, temperature)
+        cached = self._cached_response(key, use_cache)
+        if cached is not None:
+            on_chunk(cached)
+            return cached
+
+        def stream() -> str:
+            chunks = []
+            try:
+                for chunk in self._stream_provider(
+                    system_prompt, user_prompt, temperature
+                ):
+                    if chunk:
+                        chunks.append(chunk)
+                        on_chunk(chunk)
+            except Exception as e:
+                if chunks:
+                    raise StreamInterruptedError(f"Stream interrupted: {e}") from e
+                raise
+            return "".join(chunks)
+
+        def call_upstream() -> str:
+            response = self._retry_with_backoff(
+                stream,
+                estimated_tokens=self._estimate_request_tokens(
+                    system_prompt, user_prompt
+                ),
+            )
+            self._store_response(key, response, use_cache, expect_json)
+            return response
+
+        response, coalesced = self.single_flight.do(key, call_upstream)
+        if coalesced:
+            on_chunk(response)
+        return response
+
+    def _stream_provider(
+        self,
+        system_prompt: Optional[str],
+        user_prompt: str,
+        temperature: Optional[float],
+    ) -> Iterator[str]:
+        if self.provider == "replay":
+            yield from self._replay_stream(system_prompt, user_prompt, temperature)
+            return
+
+        started_at = time.monotonic()
+        chunks = []
+        for chunk in self._stream_remote(system_prompt, user_prompt, temperature):
+            chunks.append(chunk or "")
+            yield chunk
+        self._record(
+            system_prompt, user_prompt, temperature, "".join(chunks), started_at
+        )
 
-            return self._retry_with_backoff(call_google)
+    def _stream_remote(
+        self,
+        system_prompt: Optional[str],
+        user_prompt: str,
+        temperature: Optional[float],
+    ) -> Iterator[str]:
+        if self.provider == "google":
+            for chunk in self.client.models.generate_content_stream(
+                model=self.model_name,
+                contents=self._google_contents(system_prompt, user_prompt),
+                config=self._google_config(temperature),
+            ):
+                yield chunk.text
         else:
-
-            def call_openai():
-                kwargs = {
-                    "model": self.model_name,
-                    "messages": [{"role": "user", "content": prompt}],
-                }
-                if temperature is not None:
-                    kwargs["temperature"] = temperature
-
-                response = self.client.chat.completions.create(**kwargs)
-                return response.choices[0].message.content
-
-            return self._retry_with_backoff(call_openai)
+            stream = self.client.chat.completions.create(
+                stream=True,
+                **self._openai_kwargs(system_prompt, user_prompt, temperature),
+            )
+            for chunk in stream:
+                if chunk.choices:
+                    yield chunk.choices[0].delta.content
+
+    def _replay_stream(
+        self,
+        system_prompt: Optional[str],
+        user_prompt: str,
+        temperature: Optional[float],
+    ) -> Iterator[str]:
+        response, latency = self._load_replay(system_prompt, user_prompt, temperature)
+        chunks = [
+            response[i : i + REPLAY_CHUNK_CHARS]
+            for i in range(0, len(response), REPLAY_CHUNK_CHARS)
+        ]
+        # First token after a third of the latency, the rest spread evenly
+        time.sleep(latency / 3)
+        interval = (latency * 2 / 3) / max(1, len(chunks))
+        for chunk in chunks:
+            yield chunk
+            if interval:
+                time.sleep(interval)
+
+    def _call_provider(
+        self,
+        system_prompt: Optional[str],
+        user_prompt: str,
+        temperature: Optional[float],
+    ) -> str:
+        if self.provider == "replay":
+            response, latency = self._load_replay(
+                system_prompt, user_prompt, temperature
+            )
+            time.sleep(latency)
+            return response
+
+        started_at = time.monotonic()
+        response = self._call_remote(system_prompt, user_prompt, temperature)
+        self._record(system_prompt, user_prompt, temperature, response, started_at)
+        return response
+
+    def _call_remote(
+        self,
+        system_prompt: Optional[str],
+        user_prompt: str,
+        temperature: Optional[float],
+    ) -> str:
+        if self.provider == "google":
+            response = self.client.models.generate_content(
+                model=self.model_name,
+                contents=self._google_contents(system_prompt, user_prompt),
+                config=self._google_config(temperature),
+            )
+            return response.text
+        else:
+            response = self.client.chat.completions.create(
+                **self._openai_kwargs(system_prompt, user_prompt, temperature)
+            )
+            return response.choices[0].message.content
 
     # Deprecated interface methods
     def extract_structure(self, text: str) -> Dict[str, Any]:
@@ -149,38 +699,10 @@ class LLMGatewayImpl(LLMGateway):
     def check_text_contradiction(self, text_a: str, text_b: str) -> Dict[str, Any]:
         raise NotImplementedError("This method is deprecated.")
 
-    def call_llm_text(self, prompt: str) -> str:
-        return self._call_llm_generic(prompt)
+    def call_llm_text(self, prompt: str, use_cache: bool = True) -> str:
+        return self._complete(None, prompt, None, use_cache)
 
-    def call_llm_with_system(self, system_prompt: str, user_prompt: str) -> str:
-        if self.provider == "google":
-
-            def call_google():
-                # Gemini doesn't strictly have a "system" role in the same way as OpenAI in generate_content
-                # But we can use system_instruction if using the beta client or just prepend it.
-                # Since we are using genai.Client (Google Gen AI SDK v0.x or 1.x?), let's check init.
-                # The code uses genai.Client(api_key=...) which suggests the newer SDK.
-                # However, for simplicity and compatibility with the existing _call_llm_generic pattern:
-                # We will prepend the system prompt or use config if available.
-                # Actually, the simplest way for both providers that is robust:
-                full_prompt = f"System: {system_prompt}\n\nUser: {user_prompt}"
-                response = self.client.models.generate_content(
-                    model=self.model_name,
-                    contents=full_prompt,
-                )
-                return response.text
-
-            return self._retry_with_backoff(call_google)
-        else:
-
-            def call_openai():
-                response = self.client.chat.completions.create(
-                    model=self.model_name,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                )
-                return response.choices[0].message.content
-
-            return self._retry_with_backoff(call_openai)
+    def call_llm_with_system(
+        self, system_prompt: str, user_prompt: str, use_cache: bool = True
+    ) -> str:
+        return self._complete(system_prompt, user_prompt, None, use_cache)
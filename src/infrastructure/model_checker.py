@@ -0,0 +1,524 @@
+import os
+import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.domain.models import (
+    Defect,
+    DefectCategory,
+    ModelProperty,
+    PropertyKind,
+    PropertyResult,
+    Severity,
+)
+from src.infrastructure.content_store import ContentStore
+from src.infrastructure.state_machine_model import (
+    TRUE,
+    Formula,
+    StateMachineModel,
+    Transition,
+    conjoin,
+    describe,
+    model_from_dict,
+    negate,
+    solve,
+)
+
+# One state per machine, in StateMachineModel.machines order
+Configuration = Tuple[str, ...]
+
+DEFECT_CATEGORIES = {
+    PropertyKind.CONFLICTING_OUTPUTS: DefectCategory.CONFLICTING_OUTPUTS,
+    PropertyKind.MISSING_ELSE: DefectCategory.MISSING_ELSE,
+    PropertyKind.TIMING_BOUND: DefectCategory.TIMING_VIOLATION,
+    PropertyKind.REACHABILITY: DefectCategory.DEAD_ENDS,
+}
+
+
+class ModelChecker:
+    """
+    In-process bounded model checker for extracted state machines, used in
+    place of generating one Alloy model per viewpoint.
+
+    Properties are explored up to `bound` steps from the initial states and
+    spread over a process pool. Results are cached per property and model
+    content hash, in memory and, with `cache_dir`, on disk.
+    """
+
+    def __init__(
+        self,
+        bound: int = 10,
+        max_workers: Optional[int] = None,
+        cache_dir: Optional[str] = None,
+    ):
+        self.bound = bound
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.cache = ContentStore(cache_dir) if cache_dir else None
+        self._memory: Dict[str, PropertyResult] = {}
+
+    @staticmethod
+    def model_hash(data: Dict[str, Any]) -> str:
+        payload = json.dumps(data, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def check(
+        self,
+        data: Dict[str, Any],
+        properties: Optional[List[ModelProperty]] = None,
+    ) -> List[PropertyResult]:
+        """
+        Check `properties` (by default those of default_properties) against
+        an extracted structure; results are returned in the same order.
+        """
+        model = model_from_dict(data)
+        if properties is None:
+            properties = default_properties(model)
+        model_hash = self.model_hash(data)
+
+        results: List[Optional[PropertyResult]] = [None] * len(properties)
+        pending: List[Tuple[int, str]] = []
+        for i, prop in enumerate(properties):
+            key = self._key(model_hash, prop)
+            cached = self._lookup(key)
+            if cached is not None:
+                results[i] = cached.model_copy(update={"cached": True})
+            else:
+                pending.append((i, key))
+
+        checked = self._run(data, model, [properties[i] for i, _ in pending])
+        for (i, key), result in zip(pending, checked):
+            self._store(key, result)
+            results[i] = result
+        return results
+
+    def to_defects(self, results: List[PropertyResult]) -> List[Defect]:
+        """
+        Convert violated properties into the report's Defect model.
+        """
+        violated = [r for r in results if not r.holds]
+        return [
+            Defect(
+                id=f"MC-{i:03d}",
+                category=DEFECT_CATEGORIES[r.kind],
+                severity=(
+                    Severity.CRITICAL
+                    if r.kind == PropertyKind.CONFLICTING_OUTPUTS
+                    else Severity.MAJOR
+                ),
+                location=" -> ".join(r.trace) or r.property_id,
+                description=r.message,
+                recommendation=_RECOMMENDATIONS[r.kind],
+            )
+            for i, r in enumerate(violated, 1)
+        ]
+
+    def _run(
+        self,
+        data: Dict[str, Any],
+        model: StateMachineModel,
+        properties: List[ModelProperty],
+    ) -> List[PropertyResult]:
+        workers = min(self.max_workers, len(properties))
+        if workers <= 1:
+            return [check_property(model, p, self.bound) for p in properties]
+        # Each worker rebuilds the model once and checks every n-th property
+        chunks = [properties[i::workers] for i in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(
+                pool.map(_check_chunk, [data] * workers, [self.bound] * workers, chunks)
+            )
+        results: List[PropertyResult] = [None] * len(properties)
+        for i, chunk_results in enumerate(outcomes):
+            results[i::workers] = chunk_results
+        return results
+
+    def _key(self, model_hash: str, prop: ModelProperty) -> str:
+        payload = json.dumps(
+            [model_hash, self.bound, prop.model_dump(mode="json")],
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _lookup(self, key: str) -> Optional[PropertyResult]:
+        result = self._memory.get(key)
+        if result is None and self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                result = PropertyResult.model_validate_json(cached)
+                self._memory[key] = result
+        return result
+
+    def _store(self, key: str, result: PropertyResult) -> None:
+        self._memory[key] = result
+        if self.cache is not None:
+            self.cache.put(key, result.model_dump_json())
+
+
+def _check_chunk(
+    data: Dict[str, Any], bound: int, properties: List[ModelProperty]
+) -> List[PropertyResult]:
+    model = model_from_dict(data)
+    return [check_property(model, p, bound) for p in properties]
+
+
+_RECOMMENDATIONS = {
+    PropertyKind.CONFLICTING_OUTPUTS: (
+        "Define which output takes priority, or make the triggering "
+        "conditions mutually exclusive."
+    ),
+    PropertyKind.MISSING_ELSE: (
+        "Specify the behaviour when none of the conditions hold "
+        "(e.g. stay in the state or report an error)."
+    ),
+    PropertyKind.TIMING_BOUND: (
+        "Relax the deadline or shorten the delays on the path."
+    ),
+    PropertyKind.REACHABILITY: "Add the missing transition.",
+}
+
+
+# Properties
+
+
+def default_properties(model: StateMachineModel) -> List[ModelProperty]:
+    """
+    One property per conflict group with several outputs, per guarded
+    (machine, state, event) and per transition with a deadline.
+    """
+    properties = []
+    outputs = {o for t in model.transitions for o in t.outputs}
+    for entries in list(model.entry_outputs.values()) + list(
+        model.event_outputs.values()
+    ):
+        outputs.update(o for o, _ in entries)
+    groups: Dict[str, List[str]] = {}
+    for output in sorted(outputs):
+        groups.setdefault(model.group_of(output), []).append(output)
+    for group, members in sorted(groups.items()):
+        if len(members) > 1:
+            properties.append(
+                ModelProperty(
+                    id=f"conflict:{group}",
+                    kind=PropertyKind.CONFLICTING_OUTPUTS,
+                    conflict_group=group,
+                    description=f"Outputs of '{group}' never fire together",
+                )
+            )
+
+    seen = set()
+    for t in model.transitions:
+        key = (t.machine, t.source, t.event)
+        if key in seen:
+            continue
+        seen.add(key)
+        if all(o.guard == TRUE for o in model.outgoing(*key)):
+            continue
+        properties.append(
+            ModelProperty(
+                id=f"else:{t.machine}:{t.source}:{t.event}",
+                kind=PropertyKind.MISSING_ELSE,
+                machine=t.machine,
+                state=t.source,
+                event=t.event,
+                description=f"'{t.event}' is handled in '{t.source}' for every input",
+            )
+        )
+
+    for t in model.transitions:
+        if t.deadline_ms is None:
+            continue
+        properties.append(
+            ModelProperty(
+                id=f"timing:{t.machine}:{t.source}:{t.event}:{t.target}",
+                kind=PropertyKind.TIMING_BOUND,
+                machine=t.machine,
+                state=t.source,
+                target=t.target,
+                deadline_ms=t.deadline_ms,
+                description=(
+                    f"'{t.target}' is reached from '{t.source}' "
+                    f"within {t.deadline_ms:g} ms"
+                ),
+            )
+        )
+    return properties
+
+
+def properties_from_viewpoints(
+    viewpoints: List[Dict[str, Any]], model: StateMachineModel
+) -> List[ModelProperty]:
+    """
+    Reachability properties for Liveness viewpoints as generated by
+    prompts/extract_viewpoints.md: one target state means it can be left,
+    two mean the second is reachable from the first. Other viewpoints
+    (e.g. resource exclusivity) have no counterpart in the model and are
+    skipped.
+    """
+    properties = []
+    for viewpoint in viewpoints:
+        states = viewpoint.get("target_states") or []
+        if viewpoint.get("category") != "Liveness" or not 1 <= len(states) <= 2:
+            continue
+        machine = next((m for m, s in model.machines.items() if states[0] in s), None)
+        if machine is None:
+            continue
+        properties.append(
+            ModelProperty(
+                id=viewpoint["id"],
+                kind=PropertyKind.REACHABILITY,
+                machine=machine,
+                state=states[0],
+                target=states[1] if len(states) > 1 else None,
+                description=viewpoint.get("name", ""),
+            )
+        )
+    return properties
+
+
+def check_property(
+    model: StateMachineModel, prop: ModelProperty, bound: int
+) -> PropertyResult:
+    checks = {
+        PropertyKind.CONFLICTING_OUTPUTS: _check_conflicts,
+        PropertyKind.MISSING_ELSE: _check_missing_else,
+        PropertyKind.TIMING_BOUND: _check_timing,
+        PropertyKind.REACHABILITY: _check_reachability,
+    }
+    holds, message, trace, assignment = checks[prop.kind](model, prop, bound)
+    return PropertyResult(
+        property_id=prop.id,
+        kind=prop.kind,
+        holds=holds,
+        message=message,
+        trace=trace,
+        assignment=dict(assignment or {}),
+    )
+
+
+# Checks return (holds, message, trace, assignment)
+
+
+def _check_conflicts(model: StateMachineModel, prop: ModelProperty, bound: int):
+    group = prop.conflict_group
+    machines = list(model.machines)
+    for config, event, next_config, guard, emitted, parents in _explore(model, bound):
+        outputs = [(o, c) for o, c in emitted if model.group_of(o) == group]
+        for i, (first, first_condition) in enumerate(outputs):
+            for second, second_condition in outputs[i + 1 :]:
+                if first == second:
+                    continue
+                witness = solve(conjoin((guard, first_condition, second_condition)))
+                if witness is None:
+                    continue
+                trace = _trace(machines, parents, config) + [
+                    _step(machines, config, event, next_config)
+                ]
+                return (
+                    False,
+                    f"'{first}' and '{second}' ({group}) are output together "
+                    f"on '{event}'.",
+                    trace,
+                    witness,
+                )
+    return True, f"No conflicting '{group}' outputs within {bound} steps.", [], None
+
+
+def _check_missing_else(model: StateMachineModel, prop: ModelProperty, bound: int):
+    parents = _reach(model, prop.machine, model.initial[prop.machine], bound)
+    if prop.state not in parents:
+        return (
+            True,
+            f"'{prop.state}' is not reachable within {bound} steps.",
+            [],
+            None,
+        )
+    guards = [t.guard for t in model.outgoing(prop.machine, prop.state, prop.event)]
+    uncovered = conjoin(negate(g) for g in guards)
+    witness = solve(uncovered)
+    if witness is None:
+        return True, f"Every input is handled by '{prop.event}'.", [], None
+    return (
+        False,
+        f"'{prop.event}' in '{prop.state}' has no transition when "
+        f"{describe(uncovered)}.",
+        _path(parents, prop.state),
+        witness,
+    )
+
+
+def _check_timing(model: StateMachineModel, prop: ModelProperty, bound: int):
+    # Bounded shortest path by accumulated minimum delay
+    best: Dict[str, Tuple[float, List[Transition]]] = {prop.state: (0.0, [])}
+    frontier = dict(best)
+    for _ in range(bound):
+        updated = {}
+        for state, (delay, path) in frontier.items():
+            for t in model.transitions_from(prop.machine, state):
+                total = delay + t.delay_ms
+                if t.target in best and best[t.target][0] <= total:
+                    continue
+                if solve(t.guard) is None:
+                    continue
+                best[t.target] = updated[t.target] = (total, path + [t])
+        frontier = updated
+    if prop.target not in best:
+        return (
+            False,
+            f"'{prop.target}' is not reachable from '{prop.state}' "
+            f"within {bound} steps.",
+            [],
+            None,
+        )
+    delay, path = best[prop.target]
+    trace = [repr(t) for t in path]
+    if delay > prop.deadline_ms:
+        return (
+            False,
+            f"Reaching '{prop.target}' from '{prop.state}' takes at least "
+            f"{delay:g} ms, over the {prop.deadline_ms:g} ms limit.",
+            trace,
+            None,
+        )
+    return True, f"'{prop.target}' is reached in {delay:g} ms.", trace, None
+
+
+def _check_reachability(model: StateMachineModel, prop: ModelProperty, bound: int):
+    if prop.target is None:
+        for t in model.transitions_from(prop.machine, prop.state):
+            if t.target != prop.state and solve(t.guard) is not None:
+                return True, f"'{prop.state}' can be left.", [repr(t)], None
+        return False, f"'{prop.state}' has no transition to another state.", [], None
+    parents = _reach(model, prop.machine, prop.state, bound)
+    if prop.target in parents:
+        return True, f"'{prop.target}' is reachable.", _path(parents, prop.target), None
+    return (
+        False,
+        f"'{prop.target}' is not reachable from '{prop.state}' within {bound} steps.",
+        [],
+        None,
+    )
+
+
+# Search
+
+
+def _reach(
+    model: StateMachineModel, machine: str, start: str, bound: int
+) -> Dict[str, Optional[Tuple[str, Transition]]]:
+    """
+    Breadth-first search of one machine. Guards sample fresh inputs every
+    step and other machines never block, so a transition is possible
+    whenever its guard is satisfiable.
+    """
+    parents: Dict[str, Optional[Tuple[str, Transition]]] = {start: None}
+    frontier = [start]
+    for _ in range(bound):
+        next_frontier = []
+        for state in frontier:
+            for t in model.transitions_from(machine, state):
+                if t.target not in parents and solve(t.guard) is not None:
+                    parents[t.target] = (state, t)
+                    next_frontier.append(t.target)
+        frontier = next_frontier
+    return parents
+
+
+def _path(
+    parents: Dict[str, Optional[Tuple[str, Transition]]], state: str
+) -> List[str]:
+    steps = []
+    while parents[state] is not None:
+        state, transition = parents[state]
+        steps.append(repr(transition))
+    return steps[::-1]
+
+
+def _explore(model: StateMachineModel, bound: int) -> Iterator[tuple]:
+    """
+    Breadth-first over configurations of all machines. Yields every possible
+    step as (configuration, event, next configuration, guard, emitted
+    outputs with their conditions, parent map).
+    """
+    machines = list(model.machines)
+    start: Configuration = tuple(model.initial[m] for m in machines)
+    parents: Dict[Configuration, Optional[Tuple[Configuration, str]]] = {start: None}
+    frontier = [start]
+    events = model.all_events()
+    for _ in range(bound):
+        next_frontier = []
+        for config in frontier:
+            for event in events:
+                for next_config, guard, emitted in _steps(
+                    model, machines, config, event
+                ):
+                    yield config, event, next_config, guard, emitted, parents
+                    if next_config not in parents:
+                        parents[next_config] = (config, event)
+                        next_frontier.append(next_config)
+        frontier = next_frontier
+
+
+def _steps(
+    model: StateMachineModel,
+    machines: List[str],
+    config: Configuration,
+    event: str,
+) -> Iterator[Tuple[Configuration, Formula, List[Tuple[str, Formula]]]]:
+    """
+    Every machine with a transition on `event` takes one whose guard holds,
+    or stays when none does; the joint guard must be satisfiable.
+    """
+    options = []
+    for machine, state in zip(machines, config):
+        candidates = model.outgoing(machine, state, event)
+        stay = conjoin(negate(t.guard) for t in candidates)
+        options.append([(t, t.guard) for t in candidates] + [(None, stay)])
+
+    event_outputs = model.event_outputs.get(event, [])
+    for choice in product(*options):
+        guard = conjoin(g for _, g in choice)
+        if solve(guard) is None:
+            continue
+        fired = [t for t, _ in choice if t is not None]
+        if not fired and not event_outputs:
+            continue
+        emitted = [(o, TRUE) for t in fired for o in t.outputs]
+        for t in fired:
+            emitted += model.entry_outputs.get((t.machine, t.target), [])
+        emitted += event_outputs
+        next_config = tuple(
+            t.target if t is not None else state
+            for (t, _), state in zip(choice, config)
+        )
+        yield next_config, guard, emitted
+
+
+def _trace(
+    machines: List[str],
+    parents: Dict[Configuration, Optional[Tuple[Configuration, str]]],
+    config: Configuration,
+) -> List[str]:
+    steps = []
+    while parents[config] is not None:
+        previous, event = parents[config]
+        steps.append(_step(machines, previous, event, config))
+        config = previous
+    return steps[::-1]
+
+
+def _step(
+    machines: List[str], config: Configuration, event: str, next_config: Configuration
+) -> str:
+    return (
+        f"{_configuration(machines, config)} --{event}--> "
+        f"{_configuration(machines, next_config)}"
+    )
+
+
+def _configuration(machines: List[str], config: Configuration) -> str:
+    if len(machines) == 1:
+        return config[0]
+    return "[" + ", ".join(f"{m}={s}" for m, s in zip(machines, config)) + "]"
@@ -0,0 +1,221 @@
+import os
+import re
+import json
+import time
+import asyncio
+import threading
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional, Tuple
+
+# HTTP status codes that will never succeed on retry
+FATAL_STATUS_CODES = {400, 401, 403, 404, 405, 413, 422}
+
+
+class TokenBucket:
+    """
+    Classic token bucket refilled continuously at `rate_per_minute`.
+
+    Callers reserve capacity up front; the balance may go negative, in which
+    case the returned delay is how long the caller must wait for its turn.
+    This keeps reservations FIFO-fair across threads and coroutines.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self.available = self.capacity
+        self.updated_at = time.monotonic()
+
+    def reserve(self, amount: float, now: float) -> float:
+        self.available = min(
+            self.capacity,
+            self.available + (now - self.updated_at) * self.rate_per_second,
+        )
+        self.updated_at = now
+        self.available -= amount
+        if self.available >= 0:
+            return 0.0
+        return -self.available / self.rate_per_second
+
+
+class _Budget:
+    def __init__(self, rpm: Optional[float], tpm: Optional[float]):
+        self.requests = TokenBucket(rpm) if rpm else None
+        self.tokens = TokenBucket(tpm) if tpm else None
+        self.blocked_until = 0.0
+
+
+class RateLimiter:
+    """
+    Process-wide limiter enforcing requests-per-minute and tokens-per-minute
+    budgets per key (typically "provider:model").
+    Shared by every gateway instance so independent sessions draw on one quota.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        overrides: Optional[Dict[str, Dict[str, float]]] = None,
+    ):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.overrides = overrides or {}
+        self._budgets: Dict[str, _Budget] = {}
+        self._lock = threading.Lock()
+
+        self.waits = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def reserve(self, key: str, tokens: int = 0) -> float:
+        """
+        Reserve one request and `tokens` tokens; return the required wait in seconds.
+        """
+        with self._lock:
+            budget = self._get_budget(key)
+            now = time.monotonic()
+            delay = max(0.0, budget.blocked_until - now)
+            if budget.requests is not None:
+                delay = max(delay, budget.requests.reserve(1, now))
+            if budget.tokens is not None and tokens:
+                delay = max(delay, budget.tokens.reserve(tokens, now))
+
+            if delay > 0:
+                self.waits += 1
+                self.total_wait_seconds += delay
+                self.max_wait_seconds = max(self.max_wait_seconds, delay)
+            return delay
+
+    def acquire(self, key: str, tokens: int = 0) -> float:
+        """
+        Block until the budget allows the request; return seconds waited.
+        """
+        delay = self.reserve(key, tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, key: str, tokens: int = 0) -> float:
+        delay = self.reserve(key, tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def consume(self, key: str, tokens: int) -> None:
+        """
+        Charge tokens known only after the call (e.g. the completion).
+        """
+        if tokens <= 0:
+            return
+        with self._lock:
+            budget = self._get_budget(key)
+            if budget.tokens is not None:
+                budget.tokens.reserve(tokens, time.monotonic())
+
+    def penalize(self, key: str, seconds: float) -> None:
+        """
+        Honor a provider Retry-After: hold every caller on `key` for `seconds`.
+        """
+        with self._lock:
+            budget = self._get_budget(key)
+            budget.blocked_until = max(budget.blocked_until, time.monotonic() + seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "waits": self.waits,
+                "total_wait_seconds": self.total_wait_seconds,
+                "max_wait_seconds": self.max_wait_seconds,
+            }
+
+    def _get_budget(self, key: str) -> _Budget:
+        budget = self._budgets.get(key)
+        if budget is None:
+            limits = self.overrides.get(key, {})
+            budget = _Budget(
+                limits.get("rpm", self.requests_per_minute),
+                limits.get("tpm", self.tokens_per_minute),
+            )
+            self._budgets[key] = budget
+        return budget
+
+
+_shared_limiter: Optional[RateLimiter] = None
+_shared_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    Return the process-wide limiter configured from the environment:
+    LLM_RPM / LLM_TPM set default budgets, LLM_RATE_LIMITS overrides them per
+    key as JSON, e.g. '{"openai:gpt-4o": {"rpm": 500, "tpm": 30000}}'.
+    """
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            rpm = os.getenv("LLM_RPM")
+            tpm = os.getenv("LLM_TPM")
+            _shared_limiter = RateLimiter(
+                requests_per_minute=float(rpm) if rpm else None,
+                tokens_per_minute=float(tpm) if tpm else None,
+                overrides=json.loads(os.getenv("LLM_RATE_LIMITS", "{}")),
+            )
+        return _shared_limiter
+
+
+def classify_error(error: Exception) -> Tuple[bool, Optional[float]]:
+    """
+    Return (is_retryable, retry_after_seconds) for a provider exception.
+    Auth and bad-request errors are fatal; rate limits, timeouts, server and
+    connection errors are retryable.
+    """
+    # Errors may opt out of retries explicitly (e.g. an interrupted stream)
+    if getattr(error, "retryable", True) is False:
+        return False, None
+    if _status_code(error) in FATAL_STATUS_CODES:
+        return False, None
+    # Rate limits, timeouts, server errors, connection resets
+    return True, _retry_after(error)
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    # openai.APIStatusError -> status_code, google.genai.errors.APIError -> code
+    for attr in ("status_code", "code"):
+        value = getattr(error, attr, None)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    explicit = getattr(error, "retry_after", None)
+    if isinstance(explicit, (int, float)):
+        return float(explicit)
+
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers:
+        value = headers.get("retry-after-ms")
+        if value:
+            try:
+                return float(value) / 1000.0
+            except ValueError:
+                pass
+        value = headers.get("retry-after")
+        if value:
+            try:
+                return float(value)
+            except ValueError:
+                try:
+                    return max(
+                        0.0, parsedate_to_datetime(value).timestamp() - time.time()
+                    )
+                except (TypeError, ValueError):
+                    pass
+
+    # Gemini reports RetryInfo in the error body, e.g. "retryDelay": "30s"
+    match = re.search(r"retryDelay['\"]?\s*:\s*['\"](\d+(?:\.\d+)?)s", str(error))
+    if match:
+        return float(match.group(1))
+    return None
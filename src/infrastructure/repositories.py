@@ -1,41 +1,113 @@
 import os
 import yaml
 import json
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from src.domain.models import Project, ProjectId, VerificationResult, ProjectConfig
-from src.application.interfaces import ProjectRepository
+from src.application.interfaces import ConcurrentModificationError, ProjectRepository
+
+try:
+    import fcntl
+except ImportError:  # Windows: locking is best effort within one process
+    fcntl = None
+
+# libyaml bindings parse and emit several times faster when installed
+try:
+    from yaml import CSafeLoader as YamlLoader, CDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, Dumper as YamlDumper
 
 
 class FileProjectRepository(ProjectRepository):
+    """
+    Stores each project in `projects/<id>/project.yaml` and its results in
+    `projects/<id>/reports/<timestamp>/`. Writes are atomic (write, then
+    rename) and serialized per project with an advisory file lock, so several
+    processes can share one projects directory.
+    """
+
     def __init__(self, root_dir: str = "."):
         self.root_dir = root_dir
         self.projects_dir = os.path.join(self.root_dir, "projects")
         os.makedirs(self.projects_dir, exist_ok=True)
+        # Stands in for the file lock where fcntl is unavailable
+        self._thread_lock = threading.Lock()
 
     def _get_project_path(self, project_id: ProjectId) -> str:
         return os.path.join(self.projects_dir, str(project_id))
 
-    def save(self, project: Project) -> None:
-        project_path = self._get_project_path(project.id)
-        os.makedirs(project_path, exist_ok=True)
+    def _config_file(self, project_id: ProjectId) -> str:
+        return os.path.join(self._get_project_path(project_id), "project.yaml")
 
-        # Save project.yaml
-        config_file = os.path.join(project_path, "project.yaml")
-        data = project.model_dump(mode="json")
-        with open(config_file, "w") as f:
-            yaml.dump(data, f)
+    @contextmanager
+    def _locked(self, project_id: ProjectId) -> Iterator[None]:
+        """
+        Exclusive advisory lock on `<project>/.lock`, shared by all threads
+        and processes using the same projects directory.
+        """
+        if fcntl is None:
+            with self._thread_lock:
+                yield
+            return
 
-    def find_by_id(self, id: ProjectId) -> Optional[Project]:
-        project_path = self._get_project_path(id)
-        config_file = os.path.join(project_path, "project.yaml")
+        project_path = self._get_project_path(project_id)
+        lock_path = os.path.join(project_path, ".lock")
+        while True:
+            os.makedirs(project_path, exist_ok=True)
+            f = open(lock_path, "a")
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            # delete() may have removed the file while we were waiting
+            try:
+                if os.fstat(f.fileno()).st_ino == os.stat(lock_path).st_ino:
+                    break
+            except FileNotFoundError:
+                pass
+            f.close()
+        try:
+            yield
+        finally:
+            f.close()
+
+    @staticmethod
+    def _write_atomic(path: str, text: str) -> None:
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
 
-        if not os.path.exists(config_file):
-            return None
+    def save(self, project: Project) -> None:
+        with self._locked(project.id):
+            stored = self.find_by_id(project.id)
+            if stored is None and project.version > 0:
+                # Only new projects may be created; a stale copy of a deleted
+                # project must not bring it back
+                raise ConcurrentModificationError(
+                    f"Project {project.id} was deleted concurrently"
+                )
+            if stored is not None and stored.version != project.version:
+                raise ConcurrentModificationError(
+                    f"Project {project.id} was modified concurrently "
+                    f"(version {stored.version}, expected {project.version})"
+                )
+            data = project.model_dump(mode="json")
+            data["version"] = project.version + 1
+            self._write_atomic(
+                self._config_file(project.id),
+                yaml.dump(data, Dumper=YamlDumper, allow_unicode=True),
+            )
+            project.version += 1
 
-        with open(config_file, "r") as f:
-            data = yaml.safe_load(f)
+    def find_by_id(self, id: ProjectId) -> Optional[Project]:
+        try:
+            with open(self._config_file(id), "r", encoding="utf-8") as f:
+                data = yaml.load(f, Loader=YamlLoader)
+        except FileNotFoundError:
+            return None
 
         if not data or not isinstance(data, dict):
             return None
@@ -54,17 +126,14 @@ class FileProjectRepository(ProjectRepository):
         # Timestamp based folder
         ts_str = result.timestamp.strftime("%Y%m%d_%H%M%S")
         report_dir = os.path.join(reports_dir, ts_str)
-        os.makedirs(report_dir, exist_ok=True)
-
-        # Save JSON
-        result_file = os.path.join(report_dir, "result.json")
-        with open(result_file, "w", encoding="utf-8") as f:
-            f.write(result.model_dump_json(indent=2))
 
-        # Save Markdown Report
-        report_file = os.path.join(report_dir, "report.md")
-        with open(report_file, "w", encoding="utf-8") as f:
-            f.write(result.raw_report)
+        with self._locked(project_id):
+            os.makedirs(report_dir, exist_ok=True)
+            self._write_atomic(
+                os.path.join(report_dir, "result.json"),
+                result.model_dump_json(indent=2),
+            )
+            self._write_atomic(os.path.join(report_dir, "report.md"), result.raw_report)
 
     def list_projects(self) -> List[Project]:
         projects = []
@@ -82,4 +151,98 @@ class FileProjectRepository(ProjectRepository):
 
         project_path = self._get_project_path(project_id)
         if os.path.exists(project_path):
-            shutil.rmtree(project_path)
+            with self._locked(project_id):
+                shutil.rmtree(project_path)
+
+    def list_project_ids(self) -> List[ProjectId]:
+        if not os.path.exists(self.projects_dir):
+            return []
+        return [
+            ProjectId(entry.name)
+            for entry in os.scandir(self.projects_dir)
+            if entry.is_dir()
+        ]
+
+    def stamp(self, project_id: ProjectId) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(self._config_file(project_id))
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+class CachedProjectRepository(ProjectRepository):
+    """
+    Keeps parsed projects of another repository in memory.
+
+    Cached projects are revalidated with the wrapped repository's stamp()
+    (mtime, size and inode of project.yaml for FileProjectRepository), so changes made by
+    other processes are picked up. Repositories without stamps are not
+    cached. Callers receive copies, so mutating a returned project does not
+    touch the cache.
+    """
+
+    def __init__(self, inner: ProjectRepository):
+        self.inner = inner
+        self._lock = threading.Lock()
+        # project ID -> (stamp, project)
+        self._projects: Dict[ProjectId, Tuple[Any, Project]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def save(self, project: Project) -> None:
+        self.inner.save(project)
+        self._invalidate(project.id)
+
+    def find_by_id(self, id: ProjectId) -> Optional[Project]:
+        stamp = self.inner.stamp(id)
+        if stamp is not None:
+            with self._lock:
+                entry = self._projects.get(id)
+                if entry is not None and entry[0] == stamp:
+                    self.hits += 1
+                    return entry[1].model_copy(deep=True)
+                self.misses += 1
+        else:
+            self._invalidate(id)
+
+        project = self.inner.find_by_id(id)
+        if project is not None and stamp is not None:
+            with self._lock:
+                self._projects[id] = (stamp, project.model_copy(deep=True))
+        return project
+
+    def save_result(self, project_id: ProjectId, result: VerificationResult) -> None:
+        self.inner.save_result(project_id, result)
+
+    def list_projects(self) -> List[Project]:
+        projects = []
+        for project_id in self.list_project_ids():
+            project = self.find_by_id(project_id)
+            if project:
+                projects.append(project)
+        return projects
+
+    def delete(self, project_id: ProjectId) -> None:
+        self.inner.delete(project_id)
+        self._invalidate(project_id)
+
+    def list_project_ids(self) -> List[ProjectId]:
+        return self.inner.list_project_ids()
+
+    def stamp(self, project_id: ProjectId) -> Optional[Any]:
+        return self.inner.stamp(project_id)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._projects),
+            }
+
+    def _invalidate(self, project_id: ProjectId) -> None:
+        with self._lock:
+            self._projects.pop(project_id, None)
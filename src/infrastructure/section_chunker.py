@@ -0,0 +1,304 @@
+import re
+import hashlib
+from typing import Dict, Any, List, Optional, Tuple
+
+from src.infrastructure.token_estimator import estimate_tokens
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+_FENCE = re.compile(r"^\s*(```|~~~)")
+# File headers inserted by VerifyRequirementsUseCase between documents
+_DOCUMENT = re.compile(r"^# Document:\s")
+
+# Document headers sit above every heading level of the document itself, so a
+# document that starts with its own "# Title" stays nested under its header
+_ROOT_LEVEL = -1
+_DOCUMENT_LEVEL = 0
+
+
+class SectionChunk:
+    """
+    A contiguous slice of a Markdown document sized by estimated tokens.
+
+    `content` is `document[overlap_start:end]`; `start` is where the chunk's
+    own text begins, so `overlap_start < start` only when the tail of the
+    previous chunk is repeated for context. `context` holds the heading lines
+    of enclosing sections that begin before the chunk, so a chunk cut out of
+    the middle of a section still says where it came from.
+    """
+
+    def __init__(
+        self,
+        id: str,
+        title: str,
+        path: List[str],
+        start: int,
+        end: int,
+        overlap_start: int,
+        content: str,
+        context: str,
+        tokens: int,
+    ):
+        self.id = id
+        self.title = title
+        self.path = path
+        self.start = start
+        self.end = end
+        self.overlap_start = overlap_start
+        self.content = content
+        self.context = context
+        self.tokens = tokens
+
+    @property
+    def text(self) -> str:
+        """
+        Chunk text to send to the model: heading context followed by content.
+        """
+        return self.context + self.content
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "title": self.title,
+            "path": self.path,
+            "start": self.start,
+            "end": self.end,
+            "overlap_start": self.overlap_start,
+            "content": self.text,
+            "tokens": self.tokens,
+        }
+
+
+class _Node:
+    """
+    A heading and everything up to the next heading of the same or higher level.
+    """
+
+    def __init__(
+        self,
+        level: int,
+        title: str,
+        heading: str,
+        start: int,
+        parent: Optional["_Node"],
+    ):
+        self.level = level
+        self.title = title
+        self.heading = heading
+        self.start = start
+        self.end = start
+        self.parent = parent
+        self.children: List["_Node"] = []
+        self.path: List[str] = (parent.path if parent else []) + (
+            [title] if title else []
+        )
+
+    def ancestors(self) -> List["_Node"]:
+        nodes = []
+        node = self
+        while node is not None:
+            nodes.append(node)
+            node = node.parent
+        return list(reversed(nodes))
+
+
+class _Unit:
+    """
+    Smallest piece the packer works with: a whole section or a part of one.
+    """
+
+    def __init__(self, node: _Node, start: int, end: int, part: int, tokens: int):
+        self.node = node
+        self.start = start
+        self.end = end
+        self.part = part
+        self.tokens = tokens
+
+
+class SectionChunker:
+    """
+    Token-aware Markdown chunker.
+
+    Sections that fit `max_tokens` are kept whole and adjacent small sections
+    are packed together. A section that is too large is split at its nested
+    headings, recursively, and only text with no further headings is split at
+    line boundaries. Chunk IDs are derived from the heading path, so editing
+    one section does not renumber the others.
+    """
+
+    def __init__(self, max_tokens: int, overlap_tokens: int = 0):
+        if max_tokens <= 0:
+            raise ValueError("max_tokens must be positive")
+        if not 0 <= overlap_tokens < max_tokens // 2:
+            raise ValueError("overlap_tokens must be less than half of max_tokens")
+        self.max_tokens = max_tokens
+        self.overlap_tokens = overlap_tokens
+
+    def split(self, text: str) -> List[SectionChunk]:
+        if not text.strip():
+            return []
+        root = self._parse(text)
+        budget = self.max_tokens - self.overlap_tokens
+        units: List[_Unit] = []
+        self._collect(text, root, budget, units)
+        return self._pack(text, units, budget)
+
+    def _parse(self, text: str) -> _Node:
+        root = _Node(_ROOT_LEVEL, "", "", 0, None)
+        stack = [root]
+        offset = 0
+        in_fence = False
+        for line in text.splitlines(keepends=True):
+            if _FENCE.match(line):
+                in_fence = not in_fence
+            match = None if in_fence else _HEADING.match(line.rstrip("\r\n"))
+            if match:
+                if _DOCUMENT.match(line):
+                    level = _DOCUMENT_LEVEL
+                else:
+                    level = len(match.group(1))
+                while stack[-1].level >= level:
+                    stack.pop().end = offset
+                node = _Node(level, match.group(2), line, offset, stack[-1])
+                stack[-1].children.append(node)
+                stack.append(node)
+            offset += len(line)
+        for node in stack:
+            node.end = len(text)
+        return root
+
+    def _context_tokens(self, node: _Node) -> int:
+        return sum(estimate_tokens(n.heading) for n in node.ancestors())
+
+    def _collect(self, text: str, node: _Node, budget: int, units: List[_Unit]) -> None:
+        tokens = estimate_tokens(text[node.start : node.end])
+        if (
+            tokens + self._context_tokens(node) - estimate_tokens(node.heading)
+            <= budget
+        ):
+            units.append(_Unit(node, node.start, node.end, 0, tokens))
+            return
+
+        own_end = node.children[0].start if node.children else node.end
+        if text[node.start : own_end].strip():
+            line_budget = max(1, budget - self._context_tokens(node))
+            parts = self._split_lines(text, node.start, own_end, line_budget)
+            for part, (start, end) in enumerate(parts):
+                units.append(
+                    _Unit(node, start, end, part, estimate_tokens(text[start:end]))
+                )
+        for child in node.children:
+            self._collect(text, child, budget, units)
+
+    @staticmethod
+    def _split_lines(
+        text: str, start: int, end: int, budget: int
+    ) -> List[Tuple[int, int]]:
+        pieces = []
+        piece_start = start
+        piece_tokens = 0
+        offset = start
+        for line in text[start:end].splitlines(keepends=True):
+            line_tokens = estimate_tokens(line)
+            if piece_tokens and piece_tokens + line_tokens > budget:
+                pieces.append((piece_start, offset))
+                piece_start, piece_tokens = offset, 0
+            # A single line larger than the budget is hard-split by characters
+            while line_tokens > budget:
+                cut = max(1, len(line) * budget // line_tokens)
+                pieces.append((offset, offset + cut))
+                offset += cut
+                line = line[cut:]
+                line_tokens = estimate_tokens(line)
+                piece_start = offset
+            piece_tokens += line_tokens
+            offset += len(line)
+        if offset > piece_start:
+            pieces.append((piece_start, offset))
+        return pieces
+
+    def _pack(self, text: str, units: List[_Unit], budget: int) -> List[SectionChunk]:
+        groups: List[List[_Unit]] = []
+        group_tokens = 0
+        for unit in units:
+            if (
+                groups
+                and group_tokens + unit.tokens
+                <= budget - self._context_of(groups[-1][0])[1]
+            ):
+                groups[-1].append(unit)
+                group_tokens += unit.tokens
+            else:
+                groups.append([unit])
+                group_tokens = unit.tokens
+
+        chunks: List[SectionChunk] = []
+        seen_ids: Dict[str, int] = {}
+        for group in groups:
+            first, last = group[0], group[-1]
+            start, end = first.start, last.end
+            overlap_start = (
+                self._overlap_start(text, chunks[-1], start) if chunks else start
+            )
+            context, _ = self._context_of(first)
+
+            titles: List[str] = []
+            for unit in group:
+                title = unit.node.title or "Introduction"
+                if not titles or titles[-1] != title:
+                    titles.append(title)
+
+            chunk_id = self._make_id(first, seen_ids)
+            content = text[overlap_start:end]
+            chunks.append(
+                SectionChunk(
+                    id=chunk_id,
+                    title=" + ".join(titles),
+                    path=list(first.node.path),
+                    start=start,
+                    end=end,
+                    overlap_start=overlap_start,
+                    content=content,
+                    context=context,
+                    tokens=estimate_tokens(context + content),
+                )
+            )
+        return chunks
+
+    @staticmethod
+    def _context_of(unit: _Unit) -> Tuple[str, int]:
+        """
+        Heading lines of the sections enclosing `unit` that start before it.
+        """
+        headings = [
+            n.heading
+            for n in unit.node.ancestors()
+            if n.heading and n.start < unit.start
+        ]
+        context = "".join(h if h.endswith("\n") else h + "\n" for h in headings)
+        return context, estimate_tokens(context)
+
+    def _overlap_start(self, text: str, previous: SectionChunk, start: int) -> int:
+        if self.overlap_tokens <= 0:
+            return start
+        lines = text[previous.start : start].splitlines(keepends=True)
+        tokens = 0
+        offset = start
+        for line in reversed(lines):
+            line_tokens = estimate_tokens(line)
+            if tokens + line_tokens > self.overlap_tokens:
+                # Take the tail of a long line rather than no overlap at all
+                remaining = self.overlap_tokens - tokens
+                offset -= len(line) * remaining // line_tokens
+                break
+            tokens += line_tokens
+            offset -= len(line)
+        return offset
+
+    @staticmethod
+    def _make_id(unit: _Unit, seen_ids: Dict[str, int]) -> str:
+        raw = "\x1f".join(unit.node.path) + f"\x1f{unit.part}"
+        chunk_id = "sec-" + hashlib.sha1(raw.encode("utf-8")).hexdigest()[:10]
+        # Repeated heading paths (e.g. two "## Notes") get a numeric suffix
+        count = seen_ids.get(chunk_id, 0)
+        seen_ids[chunk_id] = count + 1
+        return chunk_id if count == 0 else f"{chunk_id}-{count + 1}"
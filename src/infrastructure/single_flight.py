@@ -0,0 +1,154 @@
+import asyncio
+import threading
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls with the same key into one execution.
+    The first caller runs `fn`; callers arriving while it is in flight block
+    and receive the same result (or exception).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, _Call] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Return (result, coalesced); `coalesced` is True when this caller
+        reused another caller's in-flight execution.
+        """
+        with self._lock:
+            call = self._in_flight.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _Call()
+                self._in_flight[key] = call
+                self.calls += 1
+            else:
+                self.coalesced += 1
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            call.done.set()
+        return call.result, False
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._in_flight),
+            }
+
+
+class _LeaderCancelled(Exception):
+    """Set on a shared call whose leader was cancelled; followers retry."""
+
+
+class AsyncSingleFlight:
+    """
+    Asyncio counterpart of SingleFlight. Calls are only shared within one
+    event loop, so an instance can be reused across asyncio.run() calls and
+    threads. If the caller running `fn` is cancelled, the callers waiting on
+    it retry and one of them runs `fn` instead.
+    """
+
+    def __init__(self):
+        # Event loop -> key -> future of the call in flight on that loop
+        self._loops = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.coalesced = 0
+
+    def _in_flight(self) -> Dict[str, asyncio.Future]:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            in_flight = self._loops.get(loop)
+            if in_flight is None:
+                in_flight = self._loops[loop] = {}
+            return in_flight
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        in_flight = self._in_flight()
+        while True:
+            future = in_flight.get(key)
+            if future is None:
+                return await self._lead(in_flight, key, fn)
+            self.coalesced += 1
+            try:
+                # shield: a cancelled follower must not cancel the shared call
+                return await asyncio.shield(future), True
+            except _LeaderCancelled:
+                self.coalesced -= 1
+
+    async def _lead(
+        self,
+        in_flight: Dict[str, asyncio.Future],
+        key: str,
+        fn: Callable[[], Awaitable[Any]],
+    ) -> Tuple[Any, bool]:
+        future = asyncio.get_running_loop().create_future()
+        in_flight[key] = future
+        self.calls += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an unobserved follower-less error is not logged
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            del in_flight[key]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": sum(len(m) for m in list(self._loops.values())),
+        }
+
+
+_shared_single_flight: Optional[SingleFlight] = None
+_shared_lock = threading.Lock()
+
+
+def get_single_flight() -> SingleFlight:
+    """
+    Return the process-wide SingleFlight shared by every sync gateway instance.
+    """
+    global _shared_single_flight
+    with _shared_lock:
+        if _shared_single_flight is None:
+            _shared_single_flight = SingleFlight()
+        return _shared_single_flight
@@ -0,0 +1,335 @@
+import os
+import glob
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from src.domain.models import (
+    Defect,
+    DefectCategory,
+    Project,
+    ProjectConfig,
+    ProjectId,
+    Severity,
+    VerificationResult,
+)
+from src.application.interfaces import ConcurrentModificationError, ProjectRepository
+from src.infrastructure.repositories import FileProjectRepository
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    config TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS input_files (
+    project_id TEXT NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    PRIMARY KEY (project_id, position)
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    project_id TEXT NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    timestamp TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    raw_report TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_project ON runs (project_id, timestamp);
+CREATE TABLE IF NOT EXISTS defects (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    project_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    defect_id TEXT NOT NULL,
+    category TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    location TEXT NOT NULL,
+    description TEXT NOT NULL,
+    recommendation TEXT NOT NULL,
+    PRIMARY KEY (run_id, position)
+);
+CREATE INDEX IF NOT EXISTS defects_by_project ON defects (project_id, run_id);
+CREATE INDEX IF NOT EXISTS defects_by_category ON defects (project_id, category);
+CREATE INDEX IF NOT EXISTS defects_by_severity ON defects (project_id, severity);
+"""
+
+
+class SqliteProjectRepository(ProjectRepository):
+    """
+    ProjectRepository backed by a single SQLite database in WAL mode, so
+    readers in other threads and processes are never blocked by a writer.
+
+    Verification runs and their defects are stored in indexed tables and can
+    be queried with list_results() and find_defects(). Each thread uses its
+    own connection.
+    """
+
+    def __init__(self, db_path: str = "projects.db", timeout_seconds: float = 30.0):
+        self.db_path = db_path
+        self.timeout_seconds = timeout_seconds
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+        self._local = threading.local()
+        self._migrate()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.db_path, timeout=self.timeout_seconds)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA foreign_keys=ON")
+            self._local.connection = connection
+        return connection
+
+    def _migrate(self) -> None:
+        connection = self._connection()
+        if connection.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+            return
+        # Processes opening a new database together create the schema one
+        # after another under the write lock. executescript() would commit
+        # the transaction, so statements run one by one.
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            if version < SCHEMA_VERSION:
+                for statement in _SCHEMA.split(";"):
+                    if statement.strip():
+                        connection.execute(statement)
+                connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            connection.commit()
+        except BaseException:
+            connection.rollback()
+            raise
+
+    def close(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def save(self, project: Project) -> None:
+        connection = self._connection()
+        values = (
+            project.name,
+            project.created_at.isoformat(),
+            project.config.model_dump_json(),
+            project.version + 1,
+            project.id,
+        )
+        with connection:
+            updated = connection.execute(
+                "UPDATE projects SET name = ?, created_at = ?, config = ?, "
+                "version = ? WHERE id = ? AND version = ?",
+                values + (project.version,),
+            ).rowcount
+            if not updated:
+                if project.version > 0:
+                    # Changed or deleted since it was loaded; only new
+                    # projects may be inserted
+                    raise ConcurrentModificationError(
+                        f"Project {project.id} was modified or deleted "
+                        f"concurrently (expected version {project.version})"
+                    )
+                try:
+                    connection.execute(
+                        "INSERT INTO projects (name, created_at, config, version, id) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        values,
+                    )
+                except sqlite3.IntegrityError:
+                    raise ConcurrentModificationError(
+                        f"Project {project.id} was modified concurrently "
+                        f"(expected version {project.version})"
+                    ) from None
+            connection.execute(
+                "DELETE FROM input_files WHERE project_id = ?", (project.id,)
+            )
+            connection.executemany(
+                "INSERT INTO input_files (project_id, position, path) VALUES (?, ?, ?)",
+                [(project.id, i, path) for i, path in enumerate(project.input_files)],
+            )
+        project.version += 1
+
+    def find_by_id(self, id: ProjectId) -> Optional[Project]:
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT * FROM projects WHERE id = ?", (id,)
+        ).fetchone()
+        if row is None:
+            return None
+        files = connection.execute(
+            "SELECT path FROM input_files WHERE project_id = ? ORDER BY position",
+            (id,),
+        ).fetchall()
+        return self._to_project(row, [f["path"] for f in files])
+
+    def list_projects(self) -> List[Project]:
+        connection = self._connection()
+        files: Dict[str, List[str]] = {}
+        for row in connection.execute(
+            "SELECT project_id, path FROM input_files ORDER BY project_id, position"
+        ):
+            files.setdefault(row["project_id"], []).append(row["path"])
+        return [
+            self._to_project(row, files.get(row["id"], []))
+            for row in connection.execute("SELECT * FROM projects ORDER BY created_at")
+        ]
+
+    def delete(self, project_id: ProjectId) -> None:
+        connection = self._connection()
+        with connection:
+            connection.execute("DELETE FROM projects WHERE id = ?", (project_id,))
+
+    def save_result(self, project_id: ProjectId, result: VerificationResult) -> None:
+        connection = self._connection()
+        with connection:
+            cursor = connection.execute(
+                "INSERT INTO runs (project_id, timestamp, summary, raw_report) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    project_id,
+                    result.timestamp.isoformat(),
+                    result.summary,
+                    result.raw_report,
+                ),
+            )
+            connection.executemany(
+                "INSERT INTO defects (run_id, project_id, position, defect_id, "
+                "category, severity, location, description, recommendation) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        cursor.lastrowid,
+                        project_id,
+                        i,
+                        d.id,
+                        d.category.value,
+                        d.severity.value,
+                        d.location,
+                        d.description,
+                        d.recommendation,
+                    )
+                    for i, d in enumerate(result.defects)
+                ],
+            )
+
+    def list_results(
+        self, project_id: ProjectId, limit: Optional[int] = None
+    ) -> List[VerificationResult]:
+        """
+        Verification results of a project, newest first.
+        """
+        connection = self._connection()
+        runs = connection.execute(
+            "SELECT * FROM runs WHERE project_id = ? "
+            "ORDER BY timestamp DESC, id DESC LIMIT ?",
+            (project_id, -1 if limit is None else limit),
+        ).fetchall()
+        results = []
+        for run in runs:
+            defects = connection.execute(
+                "SELECT * FROM defects WHERE run_id = ? ORDER BY position",
+                (run["id"],),
+            ).fetchall()
+            results.append(
+                VerificationResult(
+                    project_id=ProjectId(run["project_id"]),
+                    timestamp=datetime.fromisoformat(run["timestamp"]),
+                    summary=run["summary"],
+                    defects=[self._to_defect(d) for d in defects],
+                    raw_report=run["raw_report"],
+                )
+            )
+        return results
+
+    def find_defects(
+        self,
+        project_id: ProjectId,
+        category: Optional[DefectCategory] = None,
+        severity: Optional[Severity] = None,
+        latest_only: bool = False,
+    ) -> List[Defect]:
+        """
+        Defects of a project across its runs (newest run first), optionally
+        filtered by category and severity or limited to the latest run.
+        """
+        query = (
+            "SELECT d.* FROM defects d JOIN runs r ON r.id = d.run_id "
+            "WHERE d.project_id = ?"
+        )
+        params: list = [project_id]
+        if category is not None:
+            query += " AND d.category = ?"
+            params.append(DefectCategory(category).value)
+        if severity is not None:
+            query += " AND d.severity = ?"
+            params.append(Severity(severity).value)
+        if latest_only:
+            query += (
+                " AND d.run_id = (SELECT id FROM runs WHERE project_id = ? "
+                "ORDER BY timestamp DESC, id DESC LIMIT 1)"
+            )
+            params.append(project_id)
+        query += " ORDER BY r.timestamp DESC, d.run_id DESC, d.position"
+        rows = self._connection().execute(query, params).fetchall()
+        return [self._to_defect(row) for row in rows]
+
+    def import_directory(self, root_dir: str) -> Dict[str, int]:
+        """
+        Copy projects and results from a FileProjectRepository layout
+        (`<root_dir>/projects/<id>/project.yaml` and
+        `reports/<timestamp>/result.json`). Projects that already exist here
+        are skipped, so the import can be re-run safely.
+        """
+        source = FileProjectRepository(root_dir)
+        counts = {"projects": 0, "results": 0, "skipped": 0}
+        for project in source.list_projects():
+            if self.find_by_id(project.id) is not None:
+                counts["skipped"] += 1
+                continue
+            # Versions restart in this store
+            self.save(project.model_copy(update={"version": 0}))
+            counts["projects"] += 1
+            pattern = os.path.join(
+                source.projects_dir, str(project.id), "reports", "*", "result.json"
+            )
+            for path in sorted(glob.glob(pattern)):
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        result = VerificationResult.model_validate_json(f.read())
+                except (OSError, ValueError) as e:
+                    print(f"Skipping {path}: {e}")
+                    continue
+                self.save_result(project.id, result)
+                counts["results"] += 1
+        return counts
+
+    @staticmethod
+    def _to_project(row: sqlite3.Row, input_files: List[str]) -> Project:
+        return Project(
+            id=ProjectId(row["id"]),
+            name=row["name"],
+            created_at=datetime.fromisoformat(row["created_at"]),
+            config=ProjectConfig(**json.loads(row["config"])),
+            input_files=input_files,
+            version=row["version"],
+        )
+
+    @staticmethod
+    def _to_defect(row: sqlite3.Row) -> Defect:
+        return Defect(
+            id=row["defect_id"],
+            category=row["category"],
+            severity=row["severity"],
+            location=row["location"],
+            description=row["description"],
+            recommendation=row["recommendation"],
+        )
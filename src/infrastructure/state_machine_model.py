@@ -0,0 +1,609 @@
+import re
+import math
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.infrastructure.graph_loader import WILDCARD_STATES
+
+# Guards are nested tuples so they hash, pickle and memoize cheaply:
+#   ("true",) | ("atom", atom) | ("not", f) | ("and", (f, ...)) | ("or", (f, ...))
+# Atoms:
+#   ("num", var, op, value)  numeric comparison, time values in ms
+#   ("enum", var, value)     symbolic equality such as "Load sensor == ON"
+#   ("prop", text)           anything else, an opaque proposition
+Formula = tuple
+
+TRUE: Formula = ("true",)
+
+_NEGATED_OPS = {">": "<=", ">=": "<", "<": ">=", "<=": ">", "==": "!=", "!=": "=="}
+_OP_ALIASES = {"=": "==", "≤": "<=", "≥": ">=", "≠": "!="}
+_TIME_UNITS_MS = {
+    "ms": 1.0,
+    "ミリ秒": 1.0,
+    "s": 1000.0,
+    "sec": 1000.0,
+    "秒": 1000.0,
+    "min": 60_000.0,
+    "分": 60_000.0,
+    "h": 3_600_000.0,
+    "時間": 3_600_000.0,
+}
+_NONE_GUARDS = {"", "none", "always", "true", "-", "n/a"}
+
+_OPERATOR = re.compile(
+    r"(&&|\|\||\bAND\b|\bOR\b|\bNOT\b|\band\b|\bor\b|\bnot\b|!(?!=))"
+)
+_NUMERIC = re.compile(
+    r"^(?P<var>.*?[^\s<>=!])\s*(?P<op><=|>=|==|!=|=|<|>|≤|≥|≠)\s*"
+    r"(?P<sign>[-+±]?)\s*(?P<num>\d+(?:\.\d+)?)\s*(?P<unit>[^\s()\d]*)"
+    r"(?:\s+for\s*(?:>=|≥|>)?\s*(?P<dur>\d+(?:\.\d+)?)\s*(?P<dunit>[^\s()\d]+))?$"
+)
+_SYMBOLIC = re.compile(
+    r"^(?P<var>.*?[^\s<>=!])\s*(?P<op>==|!=|=|≠)\s*(?P<val>[A-Za-z_]\w*)$"
+)
+_DURATION = re.compile(
+    r"(?P<num>\d+(?:\.\d+)?)\s*(?P<unit>ms|ミリ秒|sec|s|秒|min|分|h|時間)(?![a-z])"
+)
+_DEADLINE = re.compile(
+    r"(?:within\s*(?P<num1>\d+(?:\.\d+)?)\s*(?P<unit1>ms|sec|s|min|h)(?![a-z])"
+    r"|(?P<num2>\d+(?:\.\d+)?)\s*(?P<unit2>ms|ミリ秒|秒|分|時間|sec|s|min|h)\s*以内)"
+)
+
+
+# Guard parsing
+
+
+def parse_guard(text: Optional[str]) -> Tuple[Formula, float]:
+    """
+    Parse a natural-language guard such as
+    "Battery SOC > 20% && Current position known" into a formula.
+    Returns the formula and the minimum time it must hold ("for >= 300ms")
+    in milliseconds. Text that is not a comparison becomes an opaque
+    proposition; text that cannot be parsed at all becomes one proposition.
+    """
+    if text is None or text.strip().lower() in _NONE_GUARDS:
+        return TRUE, 0.0
+    tokens = _tokenize(text)
+    parser = _GuardParser(tokens)
+    try:
+        formula = parser.expression()
+        if parser.position != len(tokens):
+            raise ValueError(text)
+    except (ValueError, IndexError):
+        return _atom(text.strip())
+    return formula, parser.delay_ms
+
+
+def _tokenize(text: str) -> List[str]:
+    tokens: List[str] = []
+    for chunk in _OPERATOR.split(text):
+        if _OPERATOR.fullmatch(chunk):
+            word = chunk.lower()
+            tokens.append(
+                "&" if word in ("&&", "and") else "|" if word in ("||", "or") else "!"
+            )
+            continue
+        chunk = chunk.strip()
+        # Grouping parentheses sit at the ends of a chunk; balanced ones
+        # inside it, as in "available (FMS confirmed)", belong to the text
+        while chunk.startswith("("):
+            tokens.append("(")
+            chunk = chunk[1:].strip()
+        closing = 0
+        while chunk.endswith(")") and chunk.count(")") > chunk.count("("):
+            closing += 1
+            chunk = chunk[:-1].strip()
+        if chunk:
+            tokens.append(chunk)
+        tokens.extend(")" * closing)
+    return tokens
+
+
+class _GuardParser:
+    """
+    Recursive descent: expression := term ("|" term)*,
+    term := factor ("&" factor)*, factor := "!" factor | "(" expression ")" | text.
+    """
+
+    def __init__(self, tokens: List[str]):
+        self.tokens = tokens
+        self.position = 0
+        self.delay_ms = 0.0
+
+    def expression(self) -> Formula:
+        terms = [self.term()]
+        while self._peek() == "|":
+            self.position += 1
+            terms.append(self.term())
+        return terms[0] if len(terms) == 1 else ("or", tuple(terms))
+
+    def term(self) -> Formula:
+        factors = [self.factor()]
+        while self._peek() == "&":
+            self.position += 1
+            factors.append(self.factor())
+        return factors[0] if len(factors) == 1 else ("and", tuple(factors))
+
+    def factor(self) -> Formula:
+        token = self.tokens[self.position]
+        self.position += 1
+        if token == "!":
+            return negate(self.factor())
+        if token == "(":
+            formula = self.expression()
+            if self._peek() != ")":
+                raise ValueError("unbalanced parentheses")
+            self.position += 1
+            return formula
+        if token in ("&", "|", ")"):
+            raise ValueError(f"unexpected {token!r}")
+        formula, delay_ms = _atom(token)
+        self.delay_ms = max(self.delay_ms, delay_ms)
+        return formula
+
+    def _peek(self) -> Optional[str]:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return None
+
+
+def _atom(text: str) -> Tuple[Formula, float]:
+    match = _NUMERIC.match(text)
+    if match:
+        op = _OP_ALIASES.get(match["op"], match["op"])
+        value = float(match["num"]) * (-1 if match["sign"] == "-" else 1)
+        value *= _TIME_UNITS_MS.get(match["unit"], 1.0)
+        delay_ms = 0.0
+        if match["dur"]:
+            delay_ms = float(match["dur"]) * _TIME_UNITS_MS.get(match["dunit"], 1.0)
+        return ("atom", ("num", _variable(match["var"]), op, value)), delay_ms
+    match = _SYMBOLIC.match(text)
+    if match:
+        atom = ("atom", ("enum", _variable(match["var"]), match["val"]))
+        return (atom if match["op"] in ("==", "=") else ("not", atom)), 0.0
+    return ("atom", ("prop", " ".join(text.split()))), 0.0
+
+
+def _variable(text: str) -> str:
+    # The whole phrase names the variable: "door sensor state" and
+    # "motor state" are different quantities. Case, spacing and
+    # punctuation are normalized away.
+    words = re.findall(r"\w+", text)
+    return " ".join(words).lower() if words else text.strip().lower()
+
+
+def negate(formula: Formula) -> Formula:
+    if formula[0] == "not":
+        return formula[1]
+    if formula == TRUE:
+        return ("or", ())
+    return ("not", formula)
+
+
+def conjoin(formulas: Iterable[Formula]) -> Formula:
+    parts = tuple(f for f in formulas if f != TRUE)
+    if not parts:
+        return TRUE
+    return parts[0] if len(parts) == 1 else ("and", parts)
+
+
+def parse_duration_ms(text: Optional[str]) -> float:
+    """
+    Largest duration mentioned in an identifier or description, e.g.
+    "trigger_timeout_5min" -> 300000. Zero if there is none.
+    """
+    if not text:
+        return 0.0
+    spaced = text.replace("_", " ")
+    return max(
+        (
+            float(m["num"]) * _TIME_UNITS_MS[m["unit"]]
+            for m in _DURATION.finditer(spaced)
+        ),
+        default=0.0,
+    )
+
+
+def parse_deadline_ms(text: Optional[str]) -> Optional[float]:
+    """
+    Response-time limit in a constraint such as "within 100ms" or
+    "PIN入力から200ms以内に駆動".
+    """
+    if not text:
+        return None
+    match = _DEADLINE.search(text)
+    if not match:
+        return None
+    number = match["num1"] or match["num2"]
+    unit = match["unit1"] or match["unit2"]
+    return float(number) * _TIME_UNITS_MS[unit]
+
+
+# Satisfiability
+
+
+def solve(formula: Formula) -> Optional[Dict[str, Any]]:
+    """
+    Find an assignment that satisfies `formula`, or None if there is none.
+
+    DPLL-style search over the atoms with three-valued evaluation for early
+    pruning; every partial assignment is checked against the theory of each
+    variable (interval constraints for numbers, equalities for symbols).
+    The returned witness maps variables to values and propositions to bools.
+    Results are memoized; each call returns its own copy of the witness.
+    """
+    witness = _solve(formula)
+    return None if witness is None else dict(witness)
+
+
+@lru_cache(maxsize=65536)
+def _solve(formula: Formula) -> Optional[Dict[str, Any]]:
+    atoms = sorted(_atoms(formula, set()), key=repr)
+    assignment: Dict[tuple, bool] = {}
+
+    def search(i: int) -> bool:
+        value = _evaluate(formula, assignment)
+        if value is False:
+            return False
+        if value is True:
+            return True
+        atom = atoms[i]
+        for choice in (True, False):
+            assignment[atom] = choice
+            if _consistent(atom, assignment) and search(i + 1):
+                return True
+        del assignment[atom]
+        return False
+
+    if not search(0):
+        return None
+    return _witness(assignment)
+
+
+def _atoms(formula: Formula, found: set) -> set:
+    kind = formula[0]
+    if kind == "atom":
+        found.add(formula[1])
+    elif kind == "not":
+        _atoms(formula[1], found)
+    elif kind in ("and", "or"):
+        for part in formula[1]:
+            _atoms(part, found)
+    return found
+
+
+def _evaluate(formula: Formula, assignment: Dict[tuple, bool]) -> Optional[bool]:
+    kind = formula[0]
+    if kind == "true":
+        return True
+    if kind == "atom":
+        return assignment.get(formula[1])
+    if kind == "not":
+        value = _evaluate(formula[1], assignment)
+        return None if value is None else not value
+    short_circuit = kind == "or"
+    result: Optional[bool] = not short_circuit
+    for part in formula[1]:
+        value = _evaluate(part, assignment)
+        if value is short_circuit:
+            return short_circuit
+        if value is None:
+            result = None
+    return result
+
+
+def _consistent(atom: tuple, assignment: Dict[tuple, bool]) -> bool:
+    if atom[0] == "prop":
+        return True
+    related = [
+        (a, v) for a, v in assignment.items() if a[0] == atom[0] and a[1] == atom[1]
+    ]
+    if atom[0] == "enum":
+        equal = {a[2] for a, v in related if v}
+        different = {a[2] for a, v in related if not v}
+        return len(equal) <= 1 and not equal & different
+    return _pick_number([(a[2], a[3], v) for a, v in related]) is not None
+
+
+def _pick_number(constraints: List[Tuple[str, float, bool]]) -> Optional[float]:
+    low, low_strict = -math.inf, True
+    high, high_strict = math.inf, True
+    equal: Optional[float] = None
+    excluded = set()
+    for op, value, truth in constraints:
+        if not truth:
+            op = _NEGATED_OPS[op]
+        if op == "==":
+            if equal is not None and equal != value:
+                return None
+            equal = value
+        elif op == "!=":
+            excluded.add(value)
+        elif op in (">", ">="):
+            if value > low or (value == low and op == ">"):
+                low, low_strict = value, op == ">"
+        elif value < high or (value == high and op == "<"):
+            high, high_strict = value, op == "<"
+
+    def inside(x: float) -> bool:
+        return (
+            (x > low or (x == low and not low_strict))
+            and (x < high or (x == high and not high_strict))
+            and x not in excluded
+        )
+
+    if equal is not None:
+        return equal if inside(equal) else None
+    if low == high:
+        return low if inside(low) else None
+    if low > high:
+        return None
+    # Integers are the most readable witnesses; otherwise bisect towards
+    # the lower bound until the point avoids every excluded value
+    if math.isinf(low) and math.isinf(high):
+        candidate = 0.0
+    elif math.isinf(low):
+        candidate = math.floor(high) - (1.0 if high_strict or high in excluded else 0.0)
+    elif math.isinf(high):
+        candidate = math.floor(low) + (1.0 if low_strict or low in excluded else 0.0)
+    else:
+        candidate = (low + high) / 2
+    for _ in range(len(excluded) + 2):
+        if inside(candidate):
+            return candidate
+        if math.isinf(low):
+            candidate -= 1.0
+        elif math.isinf(high):
+            candidate += 1.0
+        else:
+            candidate = (low + candidate) / 2
+    return None
+
+
+def _witness(assignment: Dict[tuple, bool]) -> Dict[str, Any]:
+    witness: Dict[str, Any] = {}
+    numbers: Dict[str, List[Tuple[str, float, bool]]] = {}
+    symbols: Dict[str, Tuple[set, set]] = {}
+    for atom, value in assignment.items():
+        if atom[0] == "prop":
+            witness[atom[1]] = value
+        elif atom[0] == "num":
+            numbers.setdefault(atom[1], []).append((atom[2], atom[3], value))
+        else:
+            equal, different = symbols.setdefault(atom[1], (set(), set()))
+            (equal if value else different).add(atom[2])
+    for var, constraints in numbers.items():
+        number = _pick_number(constraints)
+        witness[var] = int(number) if number == int(number) else number
+    for var, (equal, different) in symbols.items():
+        witness[var] = (
+            next(iter(equal)) if equal else "not " + "/".join(sorted(different))
+        )
+    return witness
+
+
+def describe(formula: Formula) -> str:
+    kind = formula[0]
+    if kind == "true":
+        return "true"
+    if kind == "atom":
+        atom = formula[1]
+        if atom[0] == "num":
+            value = atom[3]
+            return f"{atom[1]} {atom[2]} {int(value) if value == int(value) else value}"
+        if atom[0] == "enum":
+            return f"{atom[1]} == {atom[2]}"
+        return atom[1]
+    if kind == "not":
+        return f"NOT ({describe(formula[1])})"
+    if not formula[1]:
+        return "false" if kind == "or" else "true"
+    joiner = " AND " if kind == "and" else " OR "
+    return joiner.join(f"({describe(part)})" for part in formula[1])
+
+
+# State machine model
+
+
+class Transition:
+    def __init__(
+        self,
+        machine: str,
+        source: str,
+        target: str,
+        event: str,
+        guard: Formula,
+        outputs: Tuple[str, ...],
+        delay_ms: float = 0.0,
+        deadline_ms: Optional[float] = None,
+    ):
+        self.machine = machine
+        self.source = source
+        self.target = target
+        self.event = event
+        self.guard = guard
+        self.outputs = outputs
+        self.delay_ms = delay_ms  # Minimum time before the transition can fire
+        self.deadline_ms = deadline_ms  # Required response time, if any
+
+    def __repr__(self) -> str:
+        return f"{self.source} --{self.event}--> {self.target}"
+
+
+class StateMachineModel:
+    """
+    Finite-state view of an extracted structure for model checking.
+
+    Each entity is a machine (the state_transition format has a single
+    "system" machine). Machines step synchronously on events; guard
+    variables are environment inputs sampled at every step. Outputs fire on
+    transitions, on entering a state or on an event, each optionally guarded.
+    """
+
+    def __init__(self):
+        self.machines: Dict[str, List[str]] = {}
+        self.initial: Dict[str, str] = {}
+        self.transitions: List[Transition] = []
+        self.events: List[str] = []
+        # Output ID -> conflict group; outputs of one group exclude each other
+        self.conflict_groups: Dict[str, str] = {}
+        self.entry_outputs: Dict[Tuple[str, str], List[Tuple[str, Formula]]] = {}
+        self.event_outputs: Dict[str, List[Tuple[str, Formula]]] = {}
+        self._outgoing: Dict[Tuple[str, str, str], List[Transition]] = {}
+        self._from: Dict[Tuple[str, str], List[Transition]] = {}
+
+    def add_transition(self, transition: Transition) -> None:
+        self.transitions.append(transition)
+        key = (transition.machine, transition.source, transition.event)
+        self._outgoing.setdefault(key, []).append(transition)
+        self._from.setdefault(key[:2], []).append(transition)
+        if transition.event not in self.events:
+            self.events.append(transition.event)
+
+    def outgoing(self, machine: str, state: str, event: str) -> List[Transition]:
+        return self._outgoing.get((machine, state, event), [])
+
+    def transitions_from(self, machine: str, state: str) -> List[Transition]:
+        return self._from.get((machine, state), [])
+
+    def all_events(self) -> List[str]:
+        return self.events + [e for e in self.event_outputs if e not in self.events]
+
+    def group_of(self, output_id: str) -> str:
+        return self.conflict_groups.get(output_id) or _device_group(output_id)
+
+
+def _device_group(output_id: str) -> str:
+    # Without an explicit conflict group, outputs driving the same device
+    # conflict: "LED_GREEN_ON"/"LED_RED_BLINK" -> "led",
+    # "output_motor_lock"/"output_motor_unlock" -> "motor"
+    words = [w for w in re.split(r"[_\W]+", output_id.lower()) if w]
+    if len(words) > 1 and words[0] in ("output", "out"):
+        words = words[1:]
+    return words[0] if words else output_id
+
+
+def model_from_dict(data: Dict[str, Any]) -> StateMachineModel:
+    """
+    Build a StateMachineModel from either extraction format
+    (see graph_loader.parse_structure).
+    """
+    model = StateMachineModel()
+    if "entities" in data:
+        _load_entities(data, model)
+    elif "state_transition" in data:
+        _load_state_transition(data, model)
+    else:
+        raise ValueError(
+            "Unsupported structure: expected 'entities' or 'state_transition'"
+        )
+    return model
+
+
+def _load_entities(data: Dict[str, Any], model: StateMachineModel) -> None:
+    triggers = {
+        t["id"]: t.get("description")
+        for t in data.get("unbound_triggers", [])
+        if "id" in t
+    }
+    deadlines = {
+        c["id"]: parse_deadline_ms(c.get("description"))
+        for c in data.get("global_constraints", [])
+        if "id" in c
+    }
+    for output in data.get("defined_outputs", []):
+        if output.get("conflict_group"):
+            model.conflict_groups[output["id"]] = output["conflict_group"]
+
+    for entity in data.get("entities", []):
+        machine = entity.get("id") or entity.get("name", "entity")
+        states = [state["id"] for state in entity.get("states", [])]
+        if not states:
+            continue
+        model.machines[machine] = states
+        model.initial[machine] = states[0]
+        for state in entity["states"]:
+            for transition in state.get("transitions", []):
+                trigger = transition.get("trigger_id") or ""
+                # A trigger described by a condition ("Temp > 28.0") guards
+                # the transition; other descriptions are plain events
+                guard, delay_ms = parse_guard(triggers.get(trigger))
+                if guard[0] == "atom" and guard[1][0] == "prop":
+                    guard, delay_ms = TRUE, 0.0
+                target = transition.get("target_state_id")
+                if not target:
+                    continue
+                if target not in states:
+                    states.append(target)
+                limits = [
+                    deadlines[c]
+                    for c in transition.get("constraint_ids", [])
+                    if deadlines.get(c) is not None
+                ]
+                model.add_transition(
+                    Transition(
+                        machine,
+                        state["id"],
+                        target,
+                        trigger,
+                        guard,
+                        tuple(transition.get("output_ids", [])),
+                        max(delay_ms, parse_duration_ms(trigger)),
+                        min(limits) if limits else None,
+                    )
+                )
+
+
+def _load_state_transition(data: Dict[str, Any], model: StateMachineModel) -> None:
+    section = data["state_transition"]
+    machine = "system"
+    states = list(section.get("states", []))
+    for transition in section.get("transitions", []):
+        for name in (transition.get("src"), transition.get("tgt")):
+            if name and name not in WILDCARD_STATES and name not in states:
+                states.append(name)
+    model.machines[machine] = states
+    initial = section.get("initial_states") or states[:1]
+    if initial:
+        model.initial[machine] = initial[0]
+
+    for transition in section.get("transitions", []):
+        target = transition["tgt"]
+        guard, delay_ms = parse_guard(transition.get("condition"))
+        event = transition.get("event") or ""
+        if transition["src"] in WILDCARD_STATES:
+            sources = [name for name in states if name != target]
+        else:
+            sources = [transition["src"]]
+        for source in sources:
+            model.add_transition(
+                Transition(
+                    machine,
+                    source,
+                    target,
+                    event,
+                    guard,
+                    (),
+                    max(delay_ms, parse_duration_ms(event)),
+                    parse_deadline_ms(transition.get("condition")),
+                )
+            )
+
+    # system_action entries fire on state entry ("State_Enter_Idle",
+    # "SafeMode entry") or on events; other triggers cannot be modelled
+    for action in data.get("system_action", []):
+        output = action.get("action")
+        if not output:
+            continue
+        condition, _ = parse_guard(action.get("condition"))
+        for trigger in re.split(r"\s+OR\s+", action.get("trigger") or ""):
+            trigger = trigger.strip()
+            entered = re.match(r"^State_Enter_(\w+)$", trigger) or re.match(
+                r"^(\w+)\s+entry$", trigger
+            )
+            if entered and entered.group(1) in states:
+                model.entry_outputs.setdefault((machine, entered.group(1)), []).append(
+                    (output, condition)
+                )
+            elif trigger in section.get("events", []) or trigger in model.events:
+                model.event_outputs.setdefault(trigger, []).append((output, condition))
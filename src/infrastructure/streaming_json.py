@@ -0,0 +1,99 @@
+import json
+from typing import Any, Dict, List, Optional
+
+
+class IncrementalDefectParser:
+    """
+    Incrementally scans streamed LLM output for the verification JSON and
+    returns each element of the top-level "defects" array as soon as its
+    closing brace arrives. Text before the JSON (code fences, <think> blocks)
+    is skipped.
+    """
+
+    def __init__(self, array_key: str = "defects"):
+        self.array_key = array_key
+        self._text = ""
+        self._pos = 0
+        self._started = False
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._last_key: Optional[str] = None
+        self._in_target_array = False
+        self._item_start: Optional[int] = None
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        self._text += chunk
+        completed = []
+
+        if not self._started and not self._find_json_start():
+            return completed
+
+        text = self._text
+        i = self._pos
+        while i < len(text):
+            ch = text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if len(self._stack) == 1:
+                        self._last_key = text[self._string_start + 1 : i]
+            elif ch == '"':
+                self._in_string = True
+                self._string_start = i
+            elif ch in "{[":
+                if (
+                    ch == "["
+                    and len(self._stack) == 1
+                    and self._last_key == self.array_key
+                ):
+                    self._in_target_array = True
+                elif ch == "{" and self._in_target_array and len(self._stack) == 2:
+                    self._item_start = i
+                self._stack.append(ch)
+            elif ch in "}]":
+                if self._stack:
+                    self._stack.pop()
+                if self._in_target_array and len(self._stack) == 2 and ch == "}":
+                    item = self._parse_item(text[self._item_start : i + 1])
+                    if item is not None:
+                        completed.append(item)
+                    self._item_start = None
+                elif self._in_target_array and len(self._stack) == 1:
+                    self._in_target_array = False
+            elif ch == "," and len(self._stack) == 1:
+                # A new member starts; forget the previous key
+                self._last_key = None
+            i += 1
+
+        self._pos = i
+        return completed
+
+    def _find_json_start(self) -> bool:
+        text = self._text
+        search_from = 0
+        think_start = text.find("<think>")
+        if think_start != -1:
+            think_end = text.find("</think>", think_start)
+            if think_end == -1:
+                return False
+            search_from = think_end + len("</think>")
+
+        start = text.find("{", search_from)
+        if start == -1:
+            return False
+        self._started = True
+        self._pos = start
+        return True
+
+    def _parse_item(self, raw: str) -> Optional[Dict[str, Any]]:
+        try:
+            item = json.loads(raw)
+        except json.JSONDecodeError:
+            return None
+        return item if isinstance(item, dict) else None
@@ -0,0 +1,70 @@
+from typing import Optional, Tuple
+
+# Context window (tokens) by model-name prefix; the longest matching prefix wins
+MODEL_CONTEXT_WINDOWS = {
+    "gemini-2.5": 1_048_576,
+    "gemini-2.0": 1_048_576,
+    "gemini-1.5-pro": 2_097_152,
+    "gemini-1.5": 1_048_576,
+    "gpt-4.1": 1_047_576,
+    "gpt-4o": 128_000,
+    "gpt-oss": 131_072,
+    "o3": 200_000,
+    "o4-mini": 200_000,
+    "replay": 128_000,
+}
+DEFAULT_CONTEXT_WINDOW = 32_000
+
+# USD per 1M tokens as (input, output), by model-name prefix
+MODEL_PRICING = {
+    "gemini-2.5-pro": (1.25, 10.00),
+    "gemini-2.5-flash": (0.30, 2.50),
+    "gemini-2.0-flash": (0.10, 0.40),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Cheap, tokenizer-free token estimate.
+    ASCII text averages about 4 characters per token, while Japanese and other
+    non-ASCII characters are close to one token each.
+    """
+    if not text:
+        return 0
+    ascii_chars = len(text.encode("ascii", errors="ignore"))
+    other_chars = len(text) - ascii_chars
+    return ascii_chars // 4 + other_chars + 1
+
+
+def _normalize_model(model_name: str) -> str:
+    # "openai/gpt-oss-120b:free" -> "gpt-oss-120b:free", "models/gemini-..." too
+    return model_name.lower().rsplit("/", 1)[-1]
+
+
+def _lookup(table: dict, model_name: str):
+    name = _normalize_model(model_name)
+    for prefix in sorted(table, key=len, reverse=True):
+        if name.startswith(prefix):
+            return table[prefix]
+    return None
+
+
+def context_window(model_name: str) -> int:
+    return _lookup(MODEL_CONTEXT_WINDOWS, model_name) or DEFAULT_CONTEXT_WINDOW
+
+
+def estimate_cost(
+    model_name: str, input_tokens: int, output_tokens: int
+) -> Optional[float]:
+    """
+    Estimated USD cost, or None when the model's pricing is unknown.
+    """
+    pricing: Optional[Tuple[float, float]] = _lookup(MODEL_PRICING, model_name)
+    if pricing is None:
+        return None
+    input_price, output_price = pricing
+    return (input_tokens * input_price + output_tokens * output_price) / 1_000_000
@@ -0,0 +1,178 @@
+import os
+import sys
+import json
+import textwrap
+
+import pytest
+from src.domain.models import AlloyStatus
+from src.infrastructure.alloy_runner import AlloyRunner, write_summary
+
+# Stands in for "java -jar alloy.jar": each "// fake: <line>" comment of the
+# model is printed as a command verdict, "// sleep: <s>" delays the answer
+FAKE_SOLVER = textwrap.dedent("""
+    import os, sys, json, time
+    args = sys.argv[1:]
+    output_dir = args[args.index("--output") + 1]
+    path = args[-1]
+    with open(os.environ["FAKE_ALLOY_LOG"], "a") as log:
+        log.write(os.path.basename(path) + "\\n")
+    for line in open(path, encoding="utf-8"):
+        if line.startswith("// sleep:"):
+            time.sleep(float(line.split(":")[1]))
+        if line.startswith("// exit:"):
+            sys.stderr.write("Fatal: bad jar")
+            sys.exit(int(line.split(":")[1]))
+        if line.startswith("// fake:"):
+            verdict = line.split(":", 1)[1].strip()
+            print("00. " + verdict)
+            kind, name = verdict.split()[:2]
+            if verdict.endswith(" SAT"):
+                with open(os.path.join(output_dir, name + "-solution-0.json"), "w") as f:
+                    json.dump({"instances": [{"state": "Error"}]}, f)
+    """)
+
+
+@pytest.fixture
+def solver(tmp_path, monkeypatch):
+    script = tmp_path / "fake_alloy.py"
+    script.write_text(FAKE_SOLVER, encoding="utf-8")
+    log = tmp_path / "calls.log"
+    log.write_text("")
+    monkeypatch.setenv("FAKE_ALLOY_LOG", str(log))
+    return [sys.executable, str(script)], log
+
+
+def write_models(directory, models):
+    directory.mkdir(exist_ok=True)
+    for name, body in models.items():
+        (directory / name).write_text(body, encoding="utf-8")
+
+
+def calls(log):
+    return sorted(log.read_text().split())
+
+
+def test_verdicts_counterexamples_and_errors(tmp_path, solver):
+    command, _ = solver
+    models = tmp_path / "models"
+    write_models(
+        models,
+        {
+            "verify_VP_001.als": "// fake: check NoDeadEnd 0 UNSAT\n",
+            "verify_VP_002.als": "// fake: check NoConflict 12 SAT\n",
+            "verify_VP_003.als": "// fake: run CanCharge 0 UNSAT\n",
+            "verify_VP_004.als": (
+                '// fake: check Scope !You must specify a scope for sig "X"\n'
+            ),
+            "verify_VP_005.als": "// exit: 1\n",
+        },
+    )
+    results = AlloyRunner(command=command, max_workers=2).run_directory(str(models))
+
+    assert [r.status for r in results] == [
+        AlloyStatus.PASSED,
+        AlloyStatus.VIOLATION_FOUND,
+        AlloyStatus.VIOLATION_FOUND,
+        AlloyStatus.ERROR,
+        AlloyStatus.ERROR,
+    ]
+    assert results[1].commands[0].solution == {"instances": [{"state": "Error"}]}
+    assert "specify a scope" in results[3].message
+    assert "Fatal: bad jar" in results[4].message
+
+
+def test_timeout_is_reported_and_not_cached(tmp_path, solver):
+    command, log = solver
+    models = tmp_path / "models"
+    write_models(
+        models,
+        {
+            "slow.als": "// sleep: 5\n// fake: check A 0 UNSAT\n",
+            "fast.als": "// fake: check B 0 UNSAT\n",
+        },
+    )
+    runner = AlloyRunner(
+        command=command, timeout_seconds=0.5, cache_dir=str(tmp_path / "cache")
+    )
+    results = runner.run_directory(str(models))
+    assert [r.status for r in results] == [AlloyStatus.PASSED, AlloyStatus.TIMEOUT]
+
+    results = runner.run_directory(str(models))
+    assert [r.cached for r in results] == [True, False]
+    assert calls(log) == ["fast.als", "slow.als", "slow.als"]
+
+
+def test_rerun_only_solves_changed_models(tmp_path, solver):
+    command, log = solver
+    models = tmp_path / "models"
+    write_models(
+        models,
+        {f"verify_VP_00{i}.als": f"// fake: check P{i} 0 UNSAT\n" for i in range(1, 5)},
+    )
+    runner = AlloyRunner(command=command, cache_dir=str(tmp_path / "cache"))
+    runner.run_directory(str(models))
+    assert len(calls(log)) == 4
+
+    write_models(models, {"verify_VP_003.als": "// fake: check P3 1 SAT\n"})
+    results = AlloyRunner(command=command, cache_dir=str(tmp_path / "cache")).run(
+        sorted(str(p) for p in models.iterdir())
+    )
+
+    assert calls(log).count("verify_VP_003.als") == 2
+    assert len(calls(log)) == 5
+    assert [r.cached for r in results] == [True, True, False, True]
+    assert results[2].status == AlloyStatus.VIOLATION_FOUND
+
+
+def test_solver_changes_invalidate_cached_verdicts(tmp_path, solver):
+    command, log = solver
+    model = tmp_path / "m.als"
+    model.write_text("// fake: check P 0 UNSAT\n")
+    cache_dir = str(tmp_path / "cache")
+
+    AlloyRunner(command=command, cache_dir=cache_dir).run([str(model)])
+    [cached] = AlloyRunner(command=command, cache_dir=cache_dir).run([str(model)])
+    assert cached.cached
+
+    # A different command line
+    [result] = AlloyRunner(command=command + ["-v"], cache_dir=cache_dir).run(
+        [str(model)]
+    )
+    assert not result.cached
+
+    # The same jar path, replaced by a new build
+    st = os.stat(command[1])
+    os.utime(command[1], ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    [result] = AlloyRunner(command=command, cache_dir=cache_dir).run([str(model)])
+    assert not result.cached
+    assert calls(log) == ["m.als"] * 3
+
+
+def test_missing_solver_is_an_error(tmp_path):
+    model = tmp_path / "m.als"
+    model.write_text("sig A {}\n")
+    runner = AlloyRunner(command=[str(tmp_path / "no-such-java")])
+    [result] = runner.run([str(model)])
+    assert result.status == AlloyStatus.ERROR
+    assert "could not be started" in result.message
+
+
+def test_write_summary(tmp_path, solver):
+    command, _ = solver
+    models = tmp_path / "models"
+    write_models(
+        models,
+        {
+            "a.als": "// fake: check A 0 UNSAT\n",
+            "b.als": "// fake: check B 0 SAT\n",
+        },
+    )
+    results = AlloyRunner(command=command).run_directory(str(models))
+    path = tmp_path / "out" / "summary.json"
+    write_summary(results, str(path))
+
+    summary = json.loads(path.read_text(encoding="utf-8"))
+    assert summary["total"] == 2
+    assert summary["totals"]["PASSED"] == 1
+    assert summary["totals"]["VIOLATION_FOUND"] == 1
+    assert [r["status"] for r in summary["results"]] == ["PASSED", "VIOLATION_FOUND"]
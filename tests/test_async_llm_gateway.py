@@ -0,0 +1,157 @@
+import asyncio
+import pytest
+from src.infrastructure.async_llm_gateway import AsyncLLMGatewayImpl
+
+
+@pytest.fixture
+def gateway(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "openai")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("LLM_CACHE_ENABLED", "false")
+    return AsyncLLMGatewayImpl(max_concurrency=3)
+
+
+def test_concurrency_is_bounded(gateway):
+    in_flight = 0
+    peak = 0
+
+    async def fake_provider(system_prompt, user_prompt, temperature):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return f"echo:{user_prompt}"
+
+    gateway._call_provider = fake_provider
+
+    async def run():
+        return await asyncio.gather(
+            *[gateway.call_llm_text(f"p{i}") for i in range(10)]
+        )
+
+    results = asyncio.run(run())
+    assert results == [f"echo:p{i}" for i in range(10)]
+    assert peak == 3
+
+
+def test_retries_with_async_backoff(gateway):
+    attempts = []
+
+    async def flaky_provider(system_prompt, user_prompt, temperature):
+        attempts.append(user_prompt)
+        if len(attempts) < 2:
+            raise RuntimeError("temporary failure")
+        return "ok"
+
+    gateway._call_provider = flaky_provider
+
+    async def run():
+        return await gateway._retry_with_backoff(
+            lambda: flaky_provider(None, "p", None), initial_delay=0.0
+        )
+
+    assert asyncio.run(run()) == "ok"
+    assert len(attempts) == 2
+
+
+def test_gateway_can_be_reused_across_event_loops(gateway, monkeypatch):
+    # Surface errors instead of retrying them
+    monkeypatch.setattr(
+        "src.infrastructure.async_llm_gateway.classify_error",
+        lambda e: (False, None),
+    )
+
+    async def fake_provider(system_prompt, user_prompt, temperature):
+        await asyncio.sleep(0)
+        return f"echo:{user_prompt}"
+
+    gateway._call_provider = fake_provider
+
+    async def run(prefix):
+        return await asyncio.gather(
+            *[gateway.call_llm_text(f"{prefix}{i}") for i in range(5)]
+        )
+
+    assert asyncio.run(run("a")) == [f"echo:a{i}" for i in range(5)]
+    assert asyncio.run(run("b")) == [f"echo:b{i}" for i in range(5)]
+
+
+def test_cache_io_runs_off_the_event_loop(monkeypatch, tmp_path):
+    import threading
+
+    monkeypatch.setenv("LLM_PROVIDER", "openai")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("LLM_CACHE_ENABLED", "true")
+    monkeypatch.setenv("LLM_CACHE_DIR", str(tmp_path / "cache"))
+    gateway = AsyncLLMGatewayImpl()
+    cache_threads = set()
+    get, put = gateway.cache.get, gateway.cache.put
+
+    def tracking_get(key):
+        cache_threads.add(threading.get_ident())
+        return get(key)
+
+    def tracking_put(key, response):
+        cache_threads.add(threading.get_ident())
+        put(key, response)
+
+    gateway.cache.get = tracking_get
+    gateway.cache.put = tracking_put
+
+    async def fake_provider(system_prompt, user_prompt, temperature):
+        return "answer"
+
+    gateway._call_provider = fake_provider
+
+    async def run():
+        first = await gateway.call_llm_text("p")
+        second = await gateway.call_llm_text("p")
+        return first, second
+
+    assert asyncio.run(run()) == ("answer", "answer")
+    assert cache_threads
+    assert threading.get_ident() not in cache_threads
+    assert gateway.cache.stats()["hits"] == 1
+
+
+def test_cassette_io_runs_off_the_event_loop(monkeypatch, tmp_path):
+    import threading
+
+    cassettes = str(tmp_path / "cassettes")
+    monkeypatch.setenv("LLM_PROVIDER", "openai")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("LLM_CACHE_ENABLED", "false")
+    monkeypatch.setenv("LLM_RECORD_DIR", cassettes)
+    recorder = AsyncLLMGatewayImpl()
+    io_threads = []
+    record = recorder.recorder.record
+
+    def tracking_record(*args, **kwargs):
+        io_threads.append(("record", threading.get_ident()))
+        record(*args, **kwargs)
+
+    recorder.recorder.record = tracking_record
+
+    async def fake_remote(system_prompt, user_prompt, temperature):
+        return f"answer to {user_prompt}"
+
+    recorder._call_remote = fake_remote
+    assert asyncio.run(recorder.call_llm_text("question")) == "answer to question"
+
+    monkeypatch.delenv("LLM_RECORD_DIR")
+    monkeypatch.setenv("LLM_PROVIDER", "replay")
+    monkeypatch.setenv("LLM_CASSETTE_DIR", cassettes)
+    replay = AsyncLLMGatewayImpl()
+    load = replay.cassettes.load
+
+    def tracking_load(*args):
+        io_threads.append(("load", threading.get_ident()))
+        return load(*args)
+
+    replay.cassettes.load = tracking_load
+    assert asyncio.run(replay.call_llm_text("question")) == "answer to question"
+
+    assert [call for call, _ in io_threads] == ["record", "load"]
+    assert threading.get_ident() not in {thread for _, thread in io_threads}
+    assert replay.cassettes.hits == 1
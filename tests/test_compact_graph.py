@@ -0,0 +1,123 @@
+import sys
+
+import pytest
+
+from src.domain.models import (
+    EdgeType,
+    NodeId,
+    NodeType,
+    RequirementEdge,
+    RequirementGraph,
+    RequirementNode,
+)
+from src.domain.services import GraphAnalysisService
+from src.infrastructure.compact_graph import CompactGraph
+from src.infrastructure.graph_loader import graph_from_dict, load_requirement_graph
+
+SAMPLES = [
+    "requirements/smart_lock_extracted.json",
+    "poc/intermediates/agv_structure.json",
+]
+
+
+def summarize(defects):
+    return [(d.type, d.severity, d.related_node_ids, d.description) for d in defects]
+
+
+@pytest.mark.parametrize("path", SAMPLES)
+def test_analysis_matches_requirement_graph(path):
+    service = GraphAnalysisService()
+    compact = CompactGraph.from_json_file(path)
+    graph = load_requirement_graph(path)
+    assert compact.node_count() == len(graph.nodes)
+    assert summarize(service.analyze(compact)) == summarize(service.analyze(graph))
+
+
+@pytest.mark.parametrize("path", SAMPLES)
+def test_mmap_save_load(tmp_path, path):
+    compact = CompactGraph.from_json_file(path)
+    target = tmp_path / "graph.rqcg"
+    compact.save(str(target))
+
+    with CompactGraph.load(str(target)) as loaded:
+        assert list(loaded.ids) == list(compact.ids)
+        assert [list(t) for t in loaded.succ] == [list(t) for t in compact.succ]
+        assert loaded.to_dict() == compact.to_dict()
+        service = GraphAnalysisService()
+        assert summarize(service.analyze(loaded)) == summarize(service.analyze(compact))
+
+
+def test_json_round_trip_keeps_structure():
+    compact = CompactGraph.from_json_file("poc/intermediates/agv_structure.json")
+    again = CompactGraph.from_dict(compact.to_dict())
+    assert again.to_dict() == compact.to_dict()
+    assert [compact.is_undefined(i) for i in range(compact.node_count())] == [
+        again.is_undefined(i) for i in range(again.node_count())
+    ]
+
+
+def test_json_round_trip_keeps_dependency_cycles():
+    graph = RequirementGraph()
+    for node_id in ("boot", "idle", "run", "a", "b"):
+        graph.add_node(
+            RequirementNode(id=NodeId(node_id), content=node_id, type=NodeType.STATE)
+        )
+    for source, target, edge_type in [
+        ("boot", "idle", EdgeType.TRANSITION),
+        ("idle", "run", EdgeType.TRANSITION),
+        ("run", "idle", EdgeType.TRANSITION),
+        ("idle", "a", EdgeType.DEPENDS_ON),
+        ("a", "b", EdgeType.DEPENDS_ON),
+        ("b", "a", EdgeType.DEPENDS_ON),
+    ]:
+        graph.add_edge(
+            RequirementEdge(
+                source_id=NodeId(source), target_id=NodeId(target), type=edge_type
+            )
+        )
+    graph.initial_node_ids = [NodeId("boot")]
+    service = GraphAnalysisService()
+    expected = summarize(service.analyze(graph))
+    assert [d[3] for d in expected] == ["Circular dependency: 'a' -> 'b'."]
+
+    data = CompactGraph.from_requirement_graph(graph).to_dict()
+
+    assert summarize(service.analyze(graph_from_dict(data))) == expected
+    assert summarize(service.analyze(CompactGraph.from_dict(data))) == expected
+
+
+def test_requirement_graph_conversion_and_predecessors():
+    graph = load_requirement_graph("requirements/smart_lock_extracted.json")
+    compact = CompactGraph.from_requirement_graph(graph)
+    back = compact.to_requirement_graph()
+    assert set(back.nodes) == set(graph.nodes)
+    assert back.initial_node_ids == graph.initial_node_ids
+    assert sorted((e.source_id, e.target_id, e.label) for e in back.edges) == sorted(
+        (e.source_id, e.target_id, e.label) for e in graph.edges
+    )
+
+    target = compact.node_index("state_unlocked")
+    expected = {e.source_id for e in graph.edges if e.target_id == "state_unlocked"}
+    assert {compact.ids[v] for v in compact.pred[target]} == expected
+    for position in range(compact.rev_offsets[target], compact.rev_offsets[target + 1]):
+        assert compact.fwd_targets[compact.rev_edges[position]] == target
+
+
+def test_load_rejects_other_files(tmp_path):
+    target = tmp_path / "graph.rqcg"
+    target.write_bytes(b"not a graph at all")
+    with pytest.raises(ValueError):
+        CompactGraph.load(str(target), use_mmap=False)
+
+
+def test_load_rejects_foreign_byteorder(tmp_path):
+    compact = CompactGraph.from_json_file("poc/intermediates/agv_structure.json")
+    target = tmp_path / "graph.rqcg"
+    compact.save(str(target))
+    other = "big" if sys.byteorder == "little" else "little"
+    data = target.read_bytes().replace(
+        f'"byteorder": "{sys.byteorder}"'.encode(), f'"byteorder": "{other}"'.encode()
+    )
+    target.write_bytes(data)
+    with pytest.raises(ValueError):
+        CompactGraph.load(str(target), use_mmap=False)
@@ -74,3 +74,124 @@ def test_detect_cycles():
     # Check if related nodes contain 1 and 2
     ids = set(defects[0].related_node_ids)
     assert "1" in ids and "2" in ids
+
+
+def make_graph(edges, initial=None, terminators=()):
+    graph = RequirementGraph()
+    for source, target in edges:
+        for node_id in (source, target):
+            graph.add_node(
+                RequirementNode(
+                    id=NodeId(node_id),
+                    content=node_id,
+                    type=(
+                        NodeType.TERMINATOR
+                        if node_id in terminators
+                        else NodeType.STATE
+                    ),
+                )
+            )
+    for source, target in edges:
+        graph.add_edge(
+            RequirementEdge(
+                source_id=NodeId(source),
+                target_id=NodeId(target),
+                type=EdgeType.TRANSITION,
+            )
+        )
+    graph.initial_node_ids = [NodeId(n) for n in (initial or [])]
+    return graph
+
+
+def test_terminators_are_not_dead_ends():
+    graph = make_graph([("start", "run"), ("run", "done")], terminators={"done"})
+    assert GraphAnalysisService().detect_dead_ends(graph) == []
+
+
+def test_detect_orphans_from_initial_state():
+    graph = make_graph(
+        [("idle", "run"), ("run", "idle"), ("lost", "run")], initial=["idle"]
+    )
+    defects = GraphAnalysisService().detect_orphans(graph)
+    assert [d.related_node_ids for d in defects] == [["lost"]]
+    assert defects[0].type == DefectType.ORPHAN
+
+
+def test_main_loop_is_not_a_trap_but_side_loop_is():
+    graph = make_graph(
+        [
+            ("boot", "idle"),
+            ("idle", "run"),
+            ("run", "idle"),
+            ("boot", "error"),
+            ("error", "retry"),
+            ("retry", "error"),
+        ],
+        initial=["boot"],
+    )
+    defects = GraphAnalysisService().detect_cycles(graph)
+    assert [sorted(d.related_node_ids) for d in defects] == [["error", "retry"]]
+    assert defects[0].severity.value == "Critical"
+
+
+def test_boot_retry_loop_is_not_mistaken_for_the_main_loop():
+    graph = make_graph(
+        [
+            ("start", "a"),
+            ("a", "b"),
+            ("b", "a"),
+            ("b", "idle"),
+            ("idle", "run"),
+            ("run", "idle"),
+        ],
+        initial=["start"],
+    )
+    assert GraphAnalysisService().detect_cycles(graph) == []
+
+
+def test_state_that_only_loops_to_itself_is_a_trap():
+    graph = make_graph(
+        [
+            ("idle", "run"),
+            ("run", "idle"),
+            ("run", "fault"),
+            ("fault", "fault"),
+        ],
+        initial=["idle"],
+    )
+    defects = GraphAnalysisService().analyze(graph)
+    assert [d.related_node_ids for d in defects] == [["fault"]]
+    assert defects[0].type == DefectType.CYCLE
+    assert defects[0].severity.value == "Critical"
+
+
+def test_closed_cycle_with_initial_node_is_a_trap_when_system_can_end():
+    graph = make_graph(
+        [
+            ("start", "run"),
+            ("run", "done"),
+            ("maintenance", "check"),
+            ("check", "maintenance"),
+        ],
+        initial=["start", "maintenance"],
+        terminators={"done"},
+    )
+    defects = GraphAnalysisService().detect_cycles(graph)
+    assert [sorted(d.related_node_ids) for d in defects] == [["check", "maintenance"]]
+    assert defects[0].severity.value == "Critical"
+
+
+def test_large_graph_is_analyzed_in_linear_time():
+    import time
+
+    n = 100_000
+    edges = [(str(i), str(i + 1)) for i in range(n - 1)]
+    edges += [(str(i), str(i // 2)) for i in range(1, n, 7)]
+    graph = make_graph(edges, initial=["0"])
+
+    started = time.perf_counter()
+    defects = GraphAnalysisService().analyze(graph)
+    elapsed = time.perf_counter() - started
+
+    assert [d.type for d in defects] == [DefectType.DEAD_END]
+    assert elapsed < 2.0
@@ -1,6 +1,12 @@
 import pytest
 import os
-from src.infrastructure.file_converter import FileConverter
+import json
+from src.domain.models import SourceUnit
+from src.infrastructure.file_converter import (
+    FileConverter,
+    iter_excel_rows,
+    iter_pdf_pages,
+)
 
 
 @pytest.fixture
@@ -18,3 +24,319 @@ def test_read_text_file(converter, tmp_path):
 def test_read_non_existent_file(converter):
     with pytest.raises(FileNotFoundError):
         converter.read_text("non_existent_file.xyz")
+
+
+@pytest.fixture
+def docx_file(tmp_path):
+    from docx import Document
+
+    def write(*paragraphs, name="spec.docx"):
+        path = tmp_path / name
+        doc = Document()
+        for text in paragraphs:
+            doc.add_paragraph(text)
+        doc.save(str(path))
+        return str(path)
+
+    return write
+
+
+def counting_converter(cache_dir, monkeypatch, **kwargs):
+    converter = FileConverter(cache_dir=str(cache_dir), **kwargs)
+    calls = []
+    original = converter._read_docx
+
+    def read_docx(path):
+        calls.append(path)
+        return original(path)
+
+    monkeypatch.setattr(converter, "_read_docx", read_docx)
+    return converter, calls
+
+
+def test_unchanged_file_skips_conversion(tmp_path, docx_file, monkeypatch):
+    path = docx_file("The door locks after 5 s.")
+    first, first_calls = counting_converter(tmp_path / "cache", monkeypatch)
+    assert first.read_text(path) == "The door locks after 5 s."
+    first.flush()
+
+    # A new instance reuses both the stat index and the converted text
+    second, second_calls = counting_converter(tmp_path / "cache", monkeypatch)
+    assert second.read_text(path) == "The door locks after 5 s."
+    assert len(first_calls) == 1
+    assert second_calls == []
+
+
+def test_stat_index_is_written_once_per_flush(tmp_path, docx_file, monkeypatch):
+    converter = FileConverter(cache_dir=str(tmp_path / "cache"))
+    index_path = tmp_path / "cache" / "stat_index.json"
+    paths = [docx_file(f"spec {i}", name=f"spec{i}.docx") for i in range(3)]
+    for path in paths:
+        converter.read_text(path)
+    assert not index_path.exists()
+
+    writes = []
+    original = os.replace
+    monkeypatch.setattr(
+        "src.infrastructure.file_converter.os.replace",
+        lambda src, dst: writes.append(dst) or original(src, dst),
+    )
+    converter.flush()
+    converter.flush()
+
+    assert writes == [str(index_path)]
+    assert sorted(json.loads(index_path.read_text(encoding="utf-8"))) == paths
+
+
+def test_stat_index_drops_deleted_files_on_load(tmp_path, docx_file):
+    kept = docx_file("kept", name="kept.docx")
+    removed = docx_file("removed", name="removed.docx")
+    first = FileConverter(cache_dir=str(tmp_path / "cache"))
+    first.read_text(kept)
+    first.read_text(removed)
+    first.flush()
+    os.remove(removed)
+
+    second = FileConverter(cache_dir=str(tmp_path / "cache"))
+    second.flush()
+
+    index_path = tmp_path / "cache" / "stat_index.json"
+    assert list(json.loads(index_path.read_text(encoding="utf-8"))) == [kept]
+
+
+def test_changed_content_is_converted_again(tmp_path, docx_file, monkeypatch):
+    converter, calls = counting_converter(tmp_path / "cache", monkeypatch)
+    path = docx_file("version 1")
+    assert converter.read_text(path) == "version 1"
+
+    path = docx_file("version 2")
+    assert converter.read_text(path) == "version 2"
+    assert len(calls) == 2
+
+    # Touching the file changes its mtime but not the content hash
+    os.utime(path, None)
+    assert converter.read_text(path) == "version 2"
+    assert len(calls) == 2
+
+
+def test_converter_version_invalidates_cache(tmp_path, docx_file, monkeypatch):
+    path = docx_file("text")
+    converter, calls = counting_converter(tmp_path / "cache", monkeypatch)
+    converter.read_text(path)
+    monkeypatch.setattr("src.infrastructure.file_converter.CONVERTER_VERSION", 10_000)
+    converter.read_text(path)
+    assert len(calls) == 2
+
+
+def test_cache_is_size_bounded(tmp_path, monkeypatch):
+    from docx import Document
+
+    converter, _ = counting_converter(
+        tmp_path / "cache", monkeypatch, max_cache_bytes=3000
+    )
+    for i in range(5):
+        path = tmp_path / f"doc{i}.docx"
+        doc = Document()
+        doc.add_paragraph(f"{i}" * 1000)
+        doc.save(str(path))
+        converter.read_text(str(path))
+
+    stats = converter.cache.stats()
+    assert stats["bytes"] <= 3000
+    assert stats["evictions"] > 0
+
+
+def make_pdf(path, pages):
+    from pypdf import PdfWriter
+    from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+    writer = PdfWriter()
+    font = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+            }
+        )
+    )
+    for text in pages:
+        page = writer.add_blank_page(612, 792)
+        stream = DecodedStreamObject()
+        stream.set_data(f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode())
+        page[NameObject("/Contents")] = writer._add_object(stream)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+    writer.write(str(path))
+    return str(path)
+
+
+def test_pdf_text_has_page_markers(converter, tmp_path):
+    path = make_pdf(tmp_path / "spec.pdf", ["Door locks", "Door unlocks"])
+    assert converter.read_text(path) == "[p. 1]\nDoor locks\n[p. 2]\nDoor unlocks\n"
+
+
+def test_pdf_pages_are_extracted_in_parallel_in_order(tmp_path):
+    path = make_pdf(tmp_path / "manual.pdf", [f"Page {i}" for i in range(1, 21)])
+    pages = list(iter_pdf_pages(path, max_workers=2, pages_per_task=3))
+    assert pages == [(i, f"Page {i}") for i in range(1, 21)]
+
+
+def test_concurrent_pdf_reads_share_one_spawned_pool(tmp_path, monkeypatch):
+    import concurrent.futures
+    import src.infrastructure.file_converter as file_converter
+
+    pools = []
+
+    class RecordingPool(concurrent.futures.ProcessPoolExecutor):
+        def __init__(self, max_workers, mp_context):
+            pools.append((max_workers, mp_context.get_start_method()))
+            super().__init__(max_workers=max_workers, mp_context=mp_context)
+
+    monkeypatch.setattr(file_converter, "ProcessPoolExecutor", RecordingPool)
+    paths = [
+        make_pdf(tmp_path / f"manual{n}.pdf", [f"Page {i}" for i in range(1, 21)])
+        for n in range(3)
+    ]
+    converter = FileConverter(max_workers=2)
+    with concurrent.futures.ThreadPoolExecutor(3) as threads:
+        texts = list(threads.map(converter.read_text, paths))
+    converter.close()
+
+    assert pools == [(2, "spawn")]
+    assert texts == [texts[0]] * 3
+    assert texts[0].startswith("[p. 1]\nPage 1\n[p. 2]\nPage 2\n")
+
+
+def test_pdf_page_range(tmp_path):
+    path = make_pdf(tmp_path / "manual.pdf", [f"Page {i}" for i in range(1, 11)])
+    converter = FileConverter(max_workers=1)
+    assert list(converter.iter_pages(path, first_page=4, last_page=6)) == [
+        (4, "Page 4"),
+        (5, "Page 5"),
+        (6, "Page 6"),
+    ]
+    assert [n for n, _ in converter.iter_pages(path, first_page=9, last_page=99)] == [
+        9,
+        10,
+    ]
+
+
+@pytest.fixture
+def workbook_file(tmp_path):
+    from datetime import datetime
+    from openpyxl import Workbook
+
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "Trace"
+    sheet.append([])
+    sheet.append(["ID", "Requirement", None, None, "Test"])
+    sheet.merge_cells("B2:C2")
+    sheet.append(["R-1", "Lock | unlock", "5.0", None, "TC-1"])
+    sheet.append([])
+    sheet.append(["R-2", "Line 1\nLine 2", None, None, datetime(2024, 1, 31)])
+    sheet.append(["R-3", 2.0, 2.5, None, None])
+    other = workbook.create_sheet("Notes")
+    other.append(["Note"])
+    other.append(["Draft"])
+    path = tmp_path / "trace.xlsx"
+    workbook.save(str(path))
+    return str(path)
+
+
+def test_excel_renders_compact_tables(converter, workbook_file):
+    assert converter.read_text(workbook_file) == (
+        "## Sheet: Trace\n\n"
+        "|ID|Requirement|Requirement|Test|\n"
+        "|---|---|---|---|\n"
+        "|R-1|Lock \\| unlock|5.0|TC-1|\n"
+        "|R-2|Line 1<br>Line 2||2024-01-31|\n"
+        "|R-3|2|2.5||\n"
+        "\n"
+        "## Sheet: Notes\n\n"
+        "|Note|\n"
+        "|---|\n"
+        "|Draft|\n"
+        "\n"
+    )
+
+
+def test_excel_sheet_and_row_ranges(workbook_file):
+    rows = list(iter_excel_rows(workbook_file, sheets=["Trace"], first_row=5))
+    assert [(sheet, number) for sheet, number, _ in rows] == [
+        ("Trace", 2),
+        ("Trace", 5),
+        ("Trace", 6),
+    ]
+    rows = list(iter_excel_rows(workbook_file, sheets=["Trace"], last_row=3))
+    assert rows[-1][2] == "|R-1|Lock \\| unlock|5.0|TC-1|\n\n"
+    assert len(rows) == 2
+
+
+def test_text_chunks_are_memory_mapped_slices(converter, tmp_path):
+    path = tmp_path / "spec.txt"
+    path.write_bytes(("状態遷移 line\r\n" * 50 + "x" * 300).encode("utf-8"))
+    chunks = list(converter.iter_chunks(str(path), chunk_chars=100))
+
+    assert "".join(c.text for c in chunks) == converter.read_text(str(path))
+    assert chunks[0].unit == SourceUnit.BYTE
+    assert chunks[0].start == 0
+    assert chunks[-1].end == path.stat().st_size
+    assert all(a.end == b.start for a, b in zip(chunks, chunks[1:]))
+    assert all(c.text.endswith("\n") for c in chunks[:-4])
+
+
+def test_empty_text_file_has_no_chunks(converter, tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_text("")
+    assert list(converter.iter_chunks(str(path))) == []
+
+
+def test_pdf_chunks_cover_page_ranges(tmp_path):
+    path = make_pdf(tmp_path / "manual.pdf", [f"Page {i}" for i in range(1, 8)])
+    converter = FileConverter(max_workers=1)
+    chunks = list(converter.iter_chunks(path, chunk_chars=30))
+
+    assert "".join(c.text for c in chunks) == converter.read_text(path)
+    assert [(c.unit, c.start, c.end) for c in chunks] == [
+        (SourceUnit.PAGE, 1, 3),
+        (SourceUnit.PAGE, 4, 6),
+        (SourceUnit.PAGE, 7, 7),
+    ]
+
+
+def test_excel_chunks_stay_within_a_sheet(converter, workbook_file):
+    chunks = list(converter.iter_chunks(workbook_file, chunk_chars=60))
+
+    assert "".join(c.text for c in chunks) == converter.read_text(workbook_file)
+    assert [(c.sheet, c.start, c.end) for c in chunks] == [
+        ("Trace", 2, 2),
+        ("Trace", 3, 5),
+        ("Trace", 6, 6),
+        ("Notes", 1, 2),
+    ]
+
+
+def test_docx_chunks_cover_paragraphs(converter, docx_file):
+    path = docx_file(*[f"Paragraph {i}" for i in range(1, 6)])
+    chunks = list(converter.iter_chunks(path, chunk_chars=20))
+
+    assert "".join(c.text for c in chunks) == converter.read_text(path)
+    assert [(c.unit, c.start, c.end) for c in chunks] == [
+        (SourceUnit.PARAGRAPH, 1, 2),
+        (SourceUnit.PARAGRAPH, 3, 4),
+        (SourceUnit.PARAGRAPH, 5, 5),
+    ]
+
+
+def test_default_iter_chunks_wraps_read_text():
+    from src.application.interfaces import FileContentProvider
+
+    class StaticProvider(FileContentProvider):
+        def read_text(self, file_path):
+            return "äb"
+
+    [chunk] = StaticProvider().iter_chunks("spec.md")
+    assert (chunk.text, chunk.start, chunk.end) == ("äb", 0, 3)
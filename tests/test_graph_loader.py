@@ -0,0 +1,37 @@
+from src.domain.models import DefectType, EdgeType
+from src.domain.services import GraphAnalysisService
+from src.infrastructure.graph_loader import graph_from_dict, load_requirement_graph
+
+
+def test_load_entities_format():
+    graph = load_requirement_graph("requirements/smart_lock_extracted.json")
+    assert graph.initial_node_ids == ["state_idle"]
+    assert "state_unlocked" in graph.nodes
+    assert all(e.type == EdgeType.TRANSITION for e in graph.edges)
+
+
+def test_load_state_transition_format_expands_wildcards():
+    graph = load_requirement_graph("poc/intermediates/agv_structure.json")
+    assert graph.initial_node_ids == ["Booting"]
+    assert "*" not in graph.nodes
+    sources = {e.source_id for e in graph.edges if e.target_id == "Error"}
+    assert {"Idle", "Moving", "Charging"} <= sources
+
+
+def test_undefined_targets_become_dead_ends():
+    graph = graph_from_dict(
+        {
+            "state_transition": {
+                "states": ["Idle", "Run"],
+                "transitions": [
+                    {"src": "Idle", "tgt": "Run", "event": "go"},
+                    {"src": "Run", "tgt": "Halt", "event": "stop"},
+                ],
+            }
+        }
+    )
+    defects = GraphAnalysisService().analyze(graph)
+    assert [(d.type, d.related_node_ids) for d in defects] == [
+        (DefectType.DEAD_END, ["Halt"])
+    ]
+    assert "never defined" in defects[0].description
@@ -0,0 +1,205 @@
+import random
+
+import pytest
+from src.domain.incremental_analysis import IncrementalGraphAnalyzer
+from src.domain.models import (
+    DefectType,
+    EdgeType,
+    GraphDelta,
+    NodeId,
+    NodeType,
+    RequirementEdge,
+    RequirementGraph,
+    RequirementNode,
+)
+from src.domain.services import GraphAnalysisService
+
+
+def node(node_id, node_type=NodeType.STATE, content=None):
+    return RequirementNode(
+        id=NodeId(node_id), content=content or node_id, type=node_type
+    )
+
+
+def edge(source, target, edge_type=EdgeType.TRANSITION):
+    return RequirementEdge(
+        source_id=NodeId(source), target_id=NodeId(target), type=edge_type
+    )
+
+
+def make_graph(edges, initial=None):
+    graph = RequirementGraph()
+    for source, target in edges:
+        graph.add_node(node(source))
+        graph.add_node(node(target))
+        graph.add_edge(edge(source, target))
+    graph.initial_node_ids = [NodeId(n) for n in (initial or [])]
+    return graph
+
+
+def signatures(defects):
+    return sorted(
+        (d.type.value, d.severity.value, tuple(d.related_node_ids), d.description)
+        for d in defects
+    )
+
+
+def assert_matches_full_analysis(analyzer):
+    expected = GraphAnalysisService().analyze(analyzer.graph)
+    assert signatures(analyzer.defects()) == signatures(expected)
+
+
+def test_added_edge_resolves_dead_end_and_reports_trap():
+    graph = make_graph(
+        [("boot", "idle"), ("idle", "run"), ("run", "idle"), ("boot", "error")],
+        initial=["boot"],
+    )
+    analyzer = IncrementalGraphAnalyzer(graph, max_delta_ratio=1.0)
+    assert [d.type for d in analyzer.defects()] == [DefectType.DEAD_END]
+
+    diff = analyzer.apply(
+        GraphDelta(
+            added_nodes=[node("retry")],
+            added_edges=[edge("error", "retry"), edge("retry", "error")],
+        )
+    )
+
+    assert not diff.recomputed
+    assert [d.related_node_ids for d in diff.resolved] == [["error"]]
+    assert [(d.type, sorted(d.related_node_ids)) for d in diff.added] == [
+        (DefectType.CYCLE, ["error", "retry"])
+    ]
+    assert_matches_full_analysis(analyzer)
+
+
+def test_removed_edge_reports_orphans_downstream():
+    graph = make_graph([("a", "b"), ("b", "c"), ("c", "a"), ("c", "d")], ["a"])
+    analyzer = IncrementalGraphAnalyzer(graph, max_delta_ratio=1.0)
+
+    diff = analyzer.apply(GraphDelta(removed_edges=[edge("b", "c")]))
+
+    assert sorted((d.type, tuple(d.related_node_ids)) for d in diff.added) == sorted(
+        [
+            (DefectType.DEAD_END, ("b",)),
+            (DefectType.ORPHAN, ("c",)),
+            (DefectType.ORPHAN, ("d",)),
+        ]
+    )
+    assert diff.resolved == []
+    assert_matches_full_analysis(analyzer)
+
+
+def test_main_loop_moves_to_the_first_closed_cycle():
+    graph = make_graph(
+        [("start", "a"), ("a", "b"), ("b", "a"), ("idle", "run"), ("run", "idle")],
+        initial=["start"],
+    )
+    analyzer = IncrementalGraphAnalyzer(graph, max_delta_ratio=1.0)
+    assert [d.type for d in analyzer.defects()] == [DefectType.ORPHAN] * 2
+
+    # The boot retry loop gains an exit, so {idle, run} becomes the main loop
+    diff = analyzer.apply(GraphDelta(added_edges=[edge("b", "idle")]))
+
+    assert not diff.recomputed
+    assert analyzer.defects() == []
+    assert_matches_full_analysis(analyzer)
+
+
+def test_replaced_node_updates_labels_and_terminators():
+    graph = make_graph([("start", "run"), ("run", "done")], ["start"])
+    analyzer = IncrementalGraphAnalyzer(graph, max_delta_ratio=1.0)
+
+    diff = analyzer.apply(
+        GraphDelta(added_nodes=[node("done", NodeType.TERMINATOR, "Finished")])
+    )
+
+    assert diff.added == []
+    assert [d.related_node_ids for d in diff.resolved] == [["done"]]
+    assert analyzer.defects() == []
+
+
+def test_large_delta_falls_back_to_full_analysis():
+    graph = make_graph([("a", "b"), ("b", "a")], ["a"])
+    analyzer = IncrementalGraphAnalyzer(graph)
+
+    diff = analyzer.apply(
+        GraphDelta(added_nodes=[node("c")], added_edges=[edge("b", "c")])
+    )
+
+    assert diff.recomputed
+    assert [d.related_node_ids for d in diff.added] == [["c"]]
+    assert_matches_full_analysis(analyzer)
+
+
+def test_invalid_delta_leaves_graph_untouched():
+    graph = make_graph([("a", "b")], ["a"])
+    analyzer = IncrementalGraphAnalyzer(graph, max_delta_ratio=1.0)
+
+    with pytest.raises(ValueError):
+        analyzer.apply(GraphDelta(removed_edges=[edge("b", "a")]))
+    with pytest.raises(ValueError):
+        analyzer.apply(GraphDelta(removed_node_ids=["a"], added_edges=[edge("a", "b")]))
+
+    assert list(graph.nodes) == ["a", "b"]
+    assert len(graph.edges) == 1
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_random_edits_match_full_analysis(seed):
+    rng = random.Random(seed)
+    names = [f"s{i}" for i in range(30)]
+    graph = make_graph(
+        [(rng.choice(names[:20]), rng.choice(names[:20])) for _ in range(35)],
+        initial=["s0"] if seed % 2 else None,
+    )
+    analyzer = IncrementalGraphAnalyzer(graph, max_delta_ratio=1.0)
+    assert_matches_full_analysis(analyzer)
+
+    for _ in range(25):
+        present = list(graph.nodes)
+        delta = GraphDelta()
+        for _ in range(rng.randint(0, 2)):
+            if graph.edges:
+                delta.removed_edges.append(rng.choice(graph.edges))
+        if rng.random() < 0.2 and len(present) > 2:
+            delta.removed_node_ids.append(rng.choice(present))
+        if rng.random() < 0.3:
+            node_type = rng.choice([NodeType.STATE, NodeType.TERMINATOR])
+            delta.added_nodes.append(node(rng.choice(names), node_type))
+        available = [n for n in present if n not in delta.removed_node_ids] + [
+            n.id for n in delta.added_nodes
+        ]
+        for _ in range(rng.randint(0, 3)):
+            edge_type = rng.choice([EdgeType.TRANSITION, EdgeType.DEPENDS_ON])
+            delta.added_edges.append(
+                edge(rng.choice(available), rng.choice(available), edge_type)
+            )
+        if rng.random() < 0.1:
+            delta.initial_node_ids = [rng.choice(available)]
+        # Each removed edge may only be listed once per copy in the graph
+        delta.removed_edges = list({id(e): e for e in delta.removed_edges}.values())
+
+        before = signatures(analyzer.defects())
+        diff = analyzer.apply(delta)
+        assert_matches_full_analysis(analyzer)
+        after = signatures(analyzer.defects())
+        assert sorted(set(after) - set(before)) == signatures(diff.added)
+        assert sorted(set(before) - set(after)) == signatures(diff.resolved)
+
+
+def test_small_edit_on_large_graph_is_fast():
+    import time
+
+    n = 100_000
+    edges = [(str(i), str(i + 1)) for i in range(n - 1)] + [(str(n - 1), "0")]
+    graph = make_graph(edges, initial=["0"])
+    analyzer = IncrementalGraphAnalyzer(graph)
+
+    started = time.perf_counter()
+    diff = analyzer.apply(
+        GraphDelta(added_nodes=[node("stuck")], added_edges=[edge("500", "stuck")])
+    )
+    elapsed = time.perf_counter() - started
+
+    assert [d.related_node_ids for d in diff.added] == [["stuck"]]
+    assert elapsed < 0.1
@@ -0,0 +1,147 @@
+import os
+import json
+import time
+import pytest
+from src.infrastructure.content_store import ContentStore
+from src.infrastructure.llm_cache import LLMResponseCache
+from src.infrastructure.llm_gateway import LLMGatewayImpl
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LLMResponseCache(str(tmp_path / "cache"))
+
+
+def test_key_depends_on_every_request_field():
+    base = ("openai", "gpt-4o", None, "sys", "user")
+    key = LLMResponseCache.make_key(*base)
+    assert key == LLMResponseCache.make_key(*base)
+    for i, changed in enumerate(["google", "gpt-4o-mini", 0.0, None, "user2"]):
+        args = list(base)
+        args[i] = changed
+        assert LLMResponseCache.make_key(*args) != key
+
+
+def test_llm_keys_are_content_store_keys():
+    # Keys of existing cache directories stay valid
+    assert LLMResponseCache.make_key(
+        "openai", "gpt-4o", None, "sys", "user"
+    ) == ContentStore.key_for("openai", "gpt-4o", None, "sys", "user")
+
+
+def test_entries_written_by_older_llm_cache_are_read(tmp_path):
+    key = LLMResponseCache.make_key("openai", "gpt-4o", None, None, "hello")
+    path = tmp_path / "cache" / key[:2] / f"{key}.json"
+    path.parent.mkdir(parents=True)
+    path.write_text(
+        json.dumps({"key": key, "created_at": time.time(), "response": "world"})
+    )
+    assert LLMResponseCache(str(tmp_path / "cache")).get(key) == "world"
+
+
+def test_content_store_keeps_entries_without_age_limit(tmp_path):
+    store = ContentStore(str(tmp_path / "store"))
+    key = ContentStore.key_for("model", 1)
+    store.put(key, "verdict")
+    assert ContentStore(str(tmp_path / "store")).get(key) == "verdict"
+    assert store.max_age_seconds is None
+
+
+def test_hit_and_miss_counters(cache):
+    key = LLMResponseCache.make_key("openai", "gpt-4o", None, None, "hello")
+    assert cache.get(key) is None
+    cache.put(key, "world")
+    assert cache.get(key) == "world"
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+
+
+def test_entries_survive_reopen(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    LLMResponseCache(cache_dir).put("abc123", "persisted")
+    assert LLMResponseCache(cache_dir).get("abc123") == "persisted"
+
+
+def test_expired_entries_are_dropped(tmp_path):
+    cache = LLMResponseCache(str(tmp_path / "cache"), max_age_seconds=0.01)
+    cache.put("abc123", "old")
+    time.sleep(0.05)
+    assert cache.get("abc123") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_lru_eviction_keeps_recently_used(tmp_path):
+    cache = LLMResponseCache(str(tmp_path / "cache"), max_bytes=400)
+    cache.put("aa01", "x" * 100)
+    cache.put("bb02", "y" * 100)
+    # Make the first entry the most recently used one
+    os.utime(cache._entry_path("bb02"), (0, 0))
+    cache._index["bb02"][1] = 0
+    assert cache.get("aa01") is not None
+
+    cache.put("cc03", "z" * 100)
+    assert cache.get("bb02") is None
+    assert cache.get("aa01") is not None
+    assert cache.stats()["evictions"] >= 1
+
+
+@pytest.fixture
+def gateway(monkeypatch, tmp_path):
+    monkeypatch.setenv("LLM_PROVIDER", "openai")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_MODEL", "gpt-4o-mini")
+    monkeypatch.setenv("LLM_CACHE_ENABLED", "true")
+    monkeypatch.setenv("LLM_CACHE_DIR", str(tmp_path / "gateway-cache"))
+    gateway = LLMGatewayImpl()
+    gateway.responses = []
+    gateway.calls = []
+
+    def fake_remote(system_prompt, user_prompt, temperature):
+        gateway.calls.append(user_prompt)
+        return gateway.responses.pop(0)
+
+    gateway._call_remote = fake_remote
+    return gateway
+
+
+def test_gateway_serves_repeated_requests_from_cache(gateway):
+    gateway.responses = ['{"summary": "ok", "defects": []}']
+
+    first = gateway._call_llm_generic("prompt")
+    second = gateway._call_llm_generic("prompt")
+
+    assert first == second
+    assert len(gateway.calls) == 1
+
+
+def test_gateway_does_not_cache_unparseable_json_responses(gateway):
+    gateway.responses = ["Sorry, I cannot help.", '{"summary": "ok"}']
+
+    assert gateway._call_llm_generic("prompt") == "Sorry, I cannot help."
+    assert gateway._call_llm_generic("prompt") == '{"summary": "ok"}'
+    assert gateway._call_llm_generic("prompt") == '{"summary": "ok"}'
+    assert len(gateway.calls) == 2
+
+
+def test_gateway_caches_plain_text_requests(gateway):
+    gateway.responses = ["plain answer"]
+
+    assert gateway.call_llm_with_system("sys", "question") == "plain answer"
+    assert gateway.call_llm_with_system("sys", "question") == "plain answer"
+    assert len(gateway.calls) == 1
+
+
+def test_use_cache_false_bypasses_reads_and_writes(gateway):
+    gateway.responses = ['{"n": 1}', '{"n": 2}', '{"n": 3}']
+
+    # Not written...
+    assert gateway._call_llm_generic("prompt", use_cache=False) == '{"n": 1}'
+    assert gateway.cache.stats()["entries"] == 0
+    assert gateway._call_llm_generic("prompt") == '{"n": 2}'
+    # ...and not read
+    assert gateway._call_llm_generic("prompt", use_cache=False) == '{"n": 3}'
+    assert gateway._call_llm_generic("prompt") == '{"n": 2}'
+    assert len(gateway.calls) == 3
@@ -0,0 +1,55 @@
+import pytest
+from src.infrastructure.llm_gateway import LLMGatewayImpl
+from src.infrastructure.llm_cassette import (
+    CassetteMissError,
+    LatencyProfile,
+    SimulatedRateLimitError,
+)
+from src.infrastructure.rate_limiter import classify_error
+
+
+@pytest.fixture(autouse=True)
+def no_cache(monkeypatch):
+    monkeypatch.setenv("LLM_CACHE_ENABLED", "false")
+
+
+def test_record_then_replay_offline(monkeypatch, tmp_path):
+    cassettes = str(tmp_path / "cassettes")
+
+    # Record against a (fake) real provider
+    monkeypatch.setenv("LLM_PROVIDER", "openai")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("LLM_RECORD_DIR", cassettes)
+    recorder = LLMGatewayImpl()
+    recorder._call_remote = lambda system, user, temperature: f"answer to {user}"
+    assert recorder.call_llm_with_system("sys", "question") == "answer to question"
+
+    # Replay without any provider client
+    monkeypatch.delenv("LLM_RECORD_DIR")
+    monkeypatch.setenv("LLM_PROVIDER", "replay")
+    monkeypatch.setenv("LLM_CASSETTE_DIR", cassettes)
+    replay = LLMGatewayImpl()
+    assert replay.client is None
+    assert replay.call_llm_with_system("sys", "question") == "answer to question"
+
+    chunks = []
+    replay._complete_stream("sys", "question", None, chunks.append, use_cache=False)
+    assert "".join(chunks) == "answer to question"
+
+    with pytest.raises(CassetteMissError):
+        replay.call_llm_with_system("sys", "never recorded")
+
+
+def test_latency_profile_matches_percentiles():
+    profile = LatencyProfile(p50_ms=100, p99_ms=1000, seed=1)
+    samples = sorted(profile.sample_latency() for _ in range(5000))
+    assert samples[2500] == pytest.approx(0.1, rel=0.15)
+    assert samples[4950] == pytest.approx(1.0, rel=0.35)
+
+
+def test_simulated_rate_limits_are_retryable():
+    profile = LatencyProfile(rate_limit_rate=1.0, retry_after=2.0)
+    with pytest.raises(SimulatedRateLimitError) as exc_info:
+        profile.maybe_fail()
+    assert classify_error(exc_info.value) == (True, 2.0)
+    assert classify_error(CassetteMissError("missing")) == (False, None)
@@ -0,0 +1,127 @@
+import json
+import pytest
+from poc_review.local_grounding import LocalGroundingIndex, normalize
+from poc_review.review_poc import RequirementReviewer
+
+DOCUMENT = """# AGV 仕様
+前文。
+
+## 3. 走行制御
+AGVは「走行中」に障害物を検知した場合、減速して停止する。
+停止後、障害物が除去されるまで待機する。
+
+## 4. 充電
+バッテリー残量が20%未満になった場合、充電ステーションへ移動する。
+"""
+
+
+@pytest.fixture
+def index():
+    return LocalGroundingIndex(DOCUMENT)
+
+
+def test_normalize_absorbs_width_space_and_quote_variants():
+    assert normalize("ＡＧＶは 「走行中」\nに") == "agvは走行中に"
+
+
+def test_exact_match_quotes_the_whole_line(index):
+    match = index.match("ＡＧＶは 走行中に障害物を検知した場合")
+    assert match == {
+        "score": 1.0,
+        "quote": "AGVは「走行中」に障害物を検知した場合、減速して停止する。",
+        "location": "3. 走行制御 (L5)",
+        "method": "exact",
+    }
+
+
+def test_near_miss_is_a_fuzzy_match(index):
+    match = index.match("AGVは走行中に障害物を検出した場合、減速して停止する")
+    assert match["method"] == "fuzzy"
+    assert 0.85 <= match["score"] < 1.0
+    assert match["location"] == "3. 走行制御 (L5)"
+
+
+def test_unrelated_text_scores_low(index):
+    match = index.match("ドアが開いた状態で発進してはならない")
+    assert match["score"] < 0.5
+
+
+def test_empty_query_does_not_match(index):
+    assert index.match("「」 ")["method"] == "none"
+
+
+def test_location_spans_lines_and_uses_first_heading(index):
+    match = index.match("停止後、障害物が除去されるまで待機する。\nバッテリー")
+    assert match["location"] == "3. 走行制御 (L6-9)"
+    assert match["quote"].startswith("停止後")
+    assert match["quote"].endswith("移動する。")
+
+
+def test_location_without_heading_is_line_only():
+    index = LocalGroundingIndex("前文。\n非常停止は常に有効とする。\n")
+    assert index.match("非常停止は常に有効")["location"] == "L2"
+
+
+@pytest.fixture
+def reviewer(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "openai")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_MODEL", "gpt-4o-mini")
+    monkeypatch.setenv("LLM_CACHE_ENABLED", "false")
+    return RequirementReviewer()
+
+
+def fake_batch(reviewer):
+    prompts = []
+
+    def fake_call(prompt, temperature=None, **kwargs):
+        prompts.append(prompt)
+        return json.dumps([{"key": "c1", "is_grounded": False, "quote": ""}])
+
+    reviewer.llm._call_llm_generic = fake_call
+    return prompts
+
+
+def test_only_low_scoring_candidates_go_to_the_llm(reviewer):
+    prompts = fake_batch(reviewer)
+    candidates = [
+        {"id": "C-1", "target_text": "障害物が除去されるまで待機する"},
+        {"id": "C-2", "target_text": "ドアが開いた状態で発進してはならない"},
+    ]
+
+    results = reviewer.step2_grounding_local(DOCUMENT, candidates)
+
+    assert [r["id"] for r in results] == ["C-1", "C-2"]
+    assert results[0]["source"] == "local"
+    assert results[0]["location"] == "3. 走行制御 (L6)"
+    assert results[1]["is_grounded"] is False
+    assert len(prompts) == 1
+    # Only the unmatched candidate is in the batch
+    assert "ドアが開いた状態" in prompts[0]
+    assert '"key": "c2"' not in prompts[0]
+
+
+def test_threshold_above_one_disables_local_grounding(reviewer):
+    prompts = fake_batch(reviewer)
+    reviewer.local_grounding_threshold = 1.01
+
+    results = reviewer.step2_grounding_local(
+        DOCUMENT, [{"id": "C-1", "target_text": "障害物が除去されるまで待機する"}]
+    )
+
+    assert len(prompts) == 1
+    assert "source" not in results[0]
+
+
+def test_near_miss_below_threshold_falls_through(reviewer):
+    prompts = fake_batch(reviewer)
+    reviewer.local_grounding_threshold = 0.99
+    candidate = {
+        "id": "C-1",
+        "target_text": "AGVは走行中に障害物を検出した場合、減速して停止する",
+    }
+
+    results = reviewer.step2_grounding_local(DOCUMENT, [candidate])
+
+    assert len(prompts) == 1
+    assert results[0]["is_grounded"] is False
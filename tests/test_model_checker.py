@@ -0,0 +1,145 @@
+import json
+
+import pytest
+from src.domain.models import DefectCategory, PropertyKind, Severity
+from src.infrastructure.model_checker import (
+    ModelChecker,
+    default_properties,
+    properties_from_viewpoints,
+)
+from src.infrastructure.state_machine_model import model_from_dict
+
+SAMPLES = "requirements/samples"
+
+
+def load(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def door(deadline="within 100ms", timeout="trigger_timeout_5s"):
+    return {
+        "entities": [
+            {
+                "id": "door",
+                "states": [
+                    {
+                        "id": "closed",
+                        "transitions": [
+                            {
+                                "trigger_id": "trigger_open",
+                                "target_state_id": "opening",
+                                "constraint_ids": ["c_open"],
+                            }
+                        ],
+                    },
+                    {
+                        "id": "opening",
+                        "transitions": [
+                            {"trigger_id": timeout, "target_state_id": "open"}
+                        ],
+                    },
+                    {"id": "open", "transitions": []},
+                ],
+            }
+        ],
+        "global_constraints": [{"id": "c_open", "description": deadline}],
+    }
+
+
+def test_conflicting_outputs_with_trace():
+    results = ModelChecker(max_workers=1).check(
+        load(f"{SAMPLES}/03_conflict_robot_extracted.json")
+    )
+    assert [(r.kind, r.holds) for r in results] == [
+        (PropertyKind.CONFLICTING_OUTPUTS, False)
+    ]
+    assert results[0].trace[-1] == (
+        "state_approaching --trigger_sensor_obstacle--> state_emergency"
+    )
+
+
+def test_missing_else_reports_witness_input():
+    results = ModelChecker(max_workers=1).check(
+        load(f"{SAMPLES}/02_missing_else_thermostat_extracted.json")
+    )
+    missing = {r.property_id: r for r in results if not r.holds}
+    cooling = missing["else:entity_thermostat:state_cooling:trigger_stop_cooling"]
+    assert cooling.assignment == {"temp": 24}
+    assert cooling.trace == ["state_fan_only --trigger_start_cooling--> state_cooling"]
+
+
+def test_timing_bound():
+    checker = ModelChecker(max_workers=1)
+    model = model_from_dict(door())
+    properties = default_properties(model)
+    assert [p.kind for p in properties] == [PropertyKind.TIMING_BOUND]
+
+    # closed -> opening has no delay
+    assert checker.check(door(), properties)[0].holds
+
+    timing = properties[0].model_copy(update={"target": "open"})
+    result = checker.check(door(), [timing])[0]
+    assert not result.holds
+    assert "5000 ms" in result.message
+    assert result.trace == [
+        "closed --trigger_open--> opening",
+        "opening --trigger_timeout_5s--> open",
+    ]
+
+
+def test_viewpoint_reachability():
+    data = load("poc/intermediates/agv_structure.json")
+    viewpoints = [
+        {"id": "VP_A", "category": "Liveness", "target_states": ["Idle"]},
+        {"id": "VP_B", "category": "Liveness", "target_states": ["Idle", "Charging"]},
+        {"id": "VP_C", "category": "Liveness", "target_states": ["Idle", "Nowhere"]},
+        {"id": "VP_D", "category": "Safety", "target_states": ["Idle"]},
+    ]
+    properties = properties_from_viewpoints(viewpoints, model_from_dict(data))
+    assert [p.id for p in properties] == ["VP_A", "VP_B", "VP_C"]
+
+    results = ModelChecker(max_workers=1).check(data, properties)
+    assert [r.holds for r in results] == [True, True, False]
+    assert results[1].trace == ["Idle --Event_Go_Charge--> Charging"]
+
+
+def test_results_are_cached_by_model_content(tmp_path):
+    data = load(f"{SAMPLES}/02_missing_else_thermostat_extracted.json")
+    first = ModelChecker(max_workers=1, cache_dir=str(tmp_path)).check(data)
+    assert not any(r.cached for r in first)
+
+    # A new checker reads the verdicts back from disk
+    second = ModelChecker(max_workers=1, cache_dir=str(tmp_path)).check(data)
+    assert all(r.cached for r in second)
+    assert [r.model_copy(update={"cached": False}) for r in second] == first
+
+    data["entities"][0]["name"] = "Renamed"
+    assert not any(
+        r.cached
+        for r in ModelChecker(max_workers=1, cache_dir=str(tmp_path)).check(data)
+    )
+
+
+def test_process_pool_matches_serial_results():
+    data = load("poc/intermediates/agv_structure.json")
+    serial = ModelChecker(max_workers=1).check(data)
+    parallel = ModelChecker(max_workers=3).check(data)
+    assert parallel == serial
+
+
+def test_to_defects():
+    checker = ModelChecker(max_workers=1)
+    results = checker.check(load(f"{SAMPLES}/03_conflict_robot_extracted.json"))
+    defects = checker.to_defects(results)
+    assert [(d.id, d.category, d.severity) for d in defects] == [
+        ("MC-001", DefectCategory.CONFLICTING_OUTPUTS, Severity.CRITICAL)
+    ]
+
+
+@pytest.mark.parametrize(
+    "name", ["01_dead_end_gate", "02_missing_else_thermostat", "03_conflict_robot"]
+)
+def test_samples_load(name):
+    data = load(f"{SAMPLES}/{name}_extracted.json")
+    assert all(r.property_id for r in ModelChecker(max_workers=1).check(data))
@@ -0,0 +1,62 @@
+import pytest
+from src.infrastructure.rate_limiter import RateLimiter, TokenBucket, classify_error
+
+
+class FakeResponse:
+    def __init__(self, headers):
+        self.headers = headers
+
+
+class FakeStatusError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = FakeResponse(headers or {})
+
+
+def test_bucket_allows_burst_then_paces():
+    bucket = TokenBucket(rate_per_minute=60)  # 1 per second, burst of 60
+    assert bucket.reserve(60, now=bucket.updated_at) == 0.0
+    assert bucket.reserve(1, now=bucket.updated_at) == pytest.approx(1.0)
+    assert bucket.reserve(1, now=bucket.updated_at) == pytest.approx(2.0)
+
+
+def test_token_budget_is_per_key():
+    limiter = RateLimiter(tokens_per_minute=600)
+    assert limiter.reserve("openai:gpt-4o", tokens=600) == 0.0
+    assert limiter.reserve("openai:gpt-4o", tokens=60) > 0.0
+    assert limiter.reserve("google:gemini", tokens=600) == 0.0
+    assert limiter.stats()["waits"] == 1
+
+
+def test_overrides_replace_defaults():
+    limiter = RateLimiter(
+        requests_per_minute=1, overrides={"fast:model": {"rpm": 1000}}
+    )
+    for _ in range(10):
+        assert limiter.reserve("fast:model") == 0.0
+
+
+def test_penalize_holds_all_callers():
+    limiter = RateLimiter()
+    limiter.penalize("openai:gpt-4o", 5.0)
+    assert limiter.reserve("openai:gpt-4o") == pytest.approx(5.0, abs=0.1)
+
+
+@pytest.mark.parametrize("status", [400, 401, 403, 404])
+def test_client_errors_are_fatal(status):
+    assert classify_error(FakeStatusError(status)) == (False, None)
+
+
+def test_rate_limit_reads_retry_after_header():
+    error = FakeStatusError(429, headers={"retry-after": "12"})
+    assert classify_error(error) == (True, 12.0)
+
+
+def test_gemini_retry_delay_is_parsed():
+    error = Exception("429 RESOURCE_EXHAUSTED {'retryDelay': '7s'}")
+    assert classify_error(error) == (True, 7.0)
+
+
+def test_unknown_errors_are_retryable():
+    assert classify_error(ConnectionError("reset")) == (True, None)
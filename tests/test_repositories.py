@@ -0,0 +1,191 @@
+import os
+import threading
+from datetime import datetime
+
+import pytest
+from src.application.interfaces import ConcurrentModificationError
+from src.application.use_cases import ManageProjectUseCase
+from src.domain.models import Project, ProjectConfig, ProjectId
+from src.infrastructure.repositories import (
+    CachedProjectRepository,
+    FileProjectRepository,
+)
+from src.infrastructure.sqlite_repository import SqliteProjectRepository
+
+
+def make_project(pid, files=()):
+    return Project(
+        id=ProjectId(pid),
+        name=f"Project {pid}",
+        created_at=datetime(2024, 1, 1),
+        config=ProjectConfig(description="spec"),
+        input_files=list(files),
+    )
+
+
+@pytest.fixture
+def files(tmp_path):
+    return FileProjectRepository(str(tmp_path))
+
+
+def test_file_repository_round_trip(files):
+    project = make_project("p1", ["a.pdf", "b.docx"])
+    files.save(project)
+
+    loaded = files.find_by_id(ProjectId("p1"))
+
+    assert project.version == 1
+    assert loaded == project
+    assert files.list_project_ids() == ["p1"]
+    assert files.stamp(ProjectId("p1")) is not None
+    assert files.stamp(ProjectId("missing")) is None
+
+
+def test_cached_repository_serves_repeated_reads_from_memory(files):
+    files.save(make_project("p1"))
+    repo = CachedProjectRepository(files)
+
+    first = repo.find_by_id(ProjectId("p1"))
+    second = repo.find_by_id(ProjectId("p1"))
+
+    assert first == second
+    assert first.name == "Project p1"
+    assert repo.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5, "entries": 1}
+
+
+def test_cached_repository_returns_copies(files):
+    files.save(make_project("p1"))
+    repo = CachedProjectRepository(files)
+
+    repo.find_by_id(ProjectId("p1")).add_file("x.pdf")
+
+    assert repo.find_by_id(ProjectId("p1")).input_files == []
+
+
+def test_cached_repository_invalidates_on_save_and_delete(files):
+    repo = CachedProjectRepository(files)
+    repo.save(make_project("p1"))
+    project = repo.find_by_id(ProjectId("p1"))
+
+    project.add_file("a.pdf")
+    repo.save(project)
+    assert repo.find_by_id(ProjectId("p1")).input_files == ["a.pdf"]
+
+    repo.delete(ProjectId("p1"))
+    assert repo.find_by_id(ProjectId("p1")) is None
+    assert repo.stats()["entries"] == 0
+
+
+def test_cached_repository_sees_changes_from_other_writers(tmp_path, files):
+    files.save(make_project("p1"))
+    repo = CachedProjectRepository(files)
+    repo.find_by_id(ProjectId("p1"))
+
+    # another process writes through its own repository
+    other = FileProjectRepository(str(tmp_path))
+    project = other.find_by_id(ProjectId("p1"))
+    project.add_file("new.pdf")
+    other.save(project)
+    config_file = os.path.join(files.projects_dir, "p1", "project.yaml")
+    st = os.stat(config_file)
+    os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert repo.find_by_id(ProjectId("p1")).input_files == ["new.pdf"]
+    assert repo.stats()["hits"] == 0
+
+
+def test_cached_repository_lists_projects(files):
+    repo = CachedProjectRepository(files)
+    repo.save(make_project("p1"))
+    repo.save(make_project("p2"))
+
+    assert sorted(p.id for p in repo.list_projects()) == ["p1", "p2"]
+    assert sorted(p.id for p in repo.list_projects()) == ["p1", "p2"]
+    assert repo.stats()["hits"] == 2
+
+
+def test_cached_repository_passes_through_without_stamps(tmp_path):
+    inner = SqliteProjectRepository(str(tmp_path / "projects.db"))
+    repo = CachedProjectRepository(inner)
+    project = make_project("p1")
+    repo.save(project)
+
+    assert repo.find_by_id(ProjectId("p1")) == project
+    assert [p.id for p in repo.list_projects()] == ["p1"]
+    assert repo.stats()["entries"] == 0
+    inner.close()
+
+
+def test_file_repository_rejects_stale_saves(files):
+    files.save(make_project("p1"))
+    first = files.find_by_id(ProjectId("p1"))
+    second = files.find_by_id(ProjectId("p1"))
+
+    first.add_file("a.pdf")
+    files.save(first)
+    second.add_file("b.pdf")
+
+    with pytest.raises(ConcurrentModificationError):
+        files.save(second)
+    assert files.find_by_id(ProjectId("p1")).input_files == ["a.pdf"]
+
+
+def test_file_repository_writes_atomically(files):
+    files.save(make_project("p1"))
+
+    project_path = os.path.join(files.projects_dir, "p1")
+    assert sorted(os.listdir(project_path)) == [".lock", "project.yaml"]
+
+
+def test_concurrent_add_file_loses_no_updates(tmp_path, files):
+    files.save(make_project("p1"))
+    errors = []
+
+    def add(i):
+        # one repository per thread, like separate worker processes
+        uc = ManageProjectUseCase(FileProjectRepository(str(tmp_path)))
+        try:
+            uc.add_file(ProjectId("p1"), f"file{i}.pdf")
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=add, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert sorted(files.find_by_id(ProjectId("p1")).input_files) == [
+        f"file{i}.pdf" for i in range(4)
+    ]
+
+
+def test_delete_then_save_recreates_project(files):
+    files.save(make_project("p1"))
+    files.delete(ProjectId("p1"))
+
+    files.save(make_project("p1"))
+
+    assert files.find_by_id(ProjectId("p1")).version == 1
+
+
+def test_stale_save_does_not_resurrect_deleted_project(files):
+    files.save(make_project("p1"))
+    stale = files.find_by_id(ProjectId("p1"))
+    files.delete(ProjectId("p1"))
+
+    stale.add_file("a.pdf")
+    with pytest.raises(ConcurrentModificationError):
+        files.save(stale)
+    assert files.find_by_id(ProjectId("p1")) is None
+
+
+def test_add_file_after_delete_reports_missing_project(tmp_path, files):
+    files.save(make_project("p1"))
+    uc = ManageProjectUseCase(files)
+    files.delete(ProjectId("p1"))
+
+    with pytest.raises(ValueError):
+        uc.add_file(ProjectId("p1"), "a.pdf")
+    assert files.find_by_id(ProjectId("p1")) is None
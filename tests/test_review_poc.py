@@ -0,0 +1,85 @@
+import json
+import pytest
+from poc_review.review_poc import RequirementReviewer
+from poc_review.run_store import RunStore
+
+
+@pytest.fixture
+def reviewer(monkeypatch, tmp_path):
+    monkeypatch.setenv("LLM_PROVIDER", "openai")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_MODEL", "gpt-4o-mini")
+    monkeypatch.setenv("LLM_CACHE_ENABLED", "false")
+    return RequirementReviewer(run_store=RunStore(tmp_path / "runs", "run-1"))
+
+
+def respond_with(reviewer, *responses):
+    calls = []
+
+    def fake_call(prompt, temperature=None, **kwargs):
+        calls.append(prompt)
+        response = responses[min(len(calls), len(responses)) - 1]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    reviewer.llm._call_llm_generic = fake_call
+    return calls
+
+
+def scan(reviewer):
+    return reviewer._checkpointed(
+        "scan",
+        ["section"],
+        lambda: reviewer.step1_scan("section", "1_dead_ends"),
+    )
+
+
+def ground(reviewer):
+    candidate = {"id": "C-1", "target_text": "text", "reason": "why"}
+    return reviewer._checkpointed(
+        "grounding",
+        ["candidate"],
+        lambda: reviewer.step2_grounding("document", candidate),
+    )
+
+
+def test_unparseable_scan_is_not_checkpointed(reviewer):
+    calls = respond_with(reviewer, "not json", json.dumps([{"id": "C-1"}]))
+
+    assert scan(reviewer) == []
+    assert reviewer.run_store.saved == 0
+    # The next run asks the LLM again instead of reusing the empty result
+    assert scan(reviewer) == [{"id": "C-1"}]
+    assert len(calls) == 2
+    assert reviewer.run_store.saved == 1
+
+
+def test_unparseable_grounding_is_not_checkpointed(reviewer):
+    respond_with(reviewer, "```json\n{broken\n```")
+
+    assert ground(reviewer)["is_grounded"] is False
+    assert reviewer.run_store.saved == 0
+
+
+def test_grounding_without_verdict_is_not_checkpointed(reviewer):
+    respond_with(reviewer, json.dumps({"id": "C-1", "quote": "text"}))
+
+    assert ground(reviewer)["is_grounded"] is False
+    assert reviewer.run_store.saved == 0
+
+
+def test_failed_call_is_not_checkpointed(reviewer):
+    respond_with(reviewer, RuntimeError("boom"))
+
+    assert scan(reviewer) == []
+    assert reviewer.run_store.saved == 0
+
+
+def test_valid_result_is_reused(reviewer):
+    calls = respond_with(reviewer, json.dumps({"is_grounded": True, "quote": "q"}))
+
+    assert ground(reviewer) == {"is_grounded": True, "quote": "q"}
+    assert ground(reviewer) == {"is_grounded": True, "quote": "q"}
+    assert len(calls) == 1
+    assert reviewer.run_store.hits == 1
@@ -0,0 +1,106 @@
+import json
+import pytest
+from poc_review.review_poc import RequirementReviewer
+from poc_review.run_store import RunStore, content_hash
+
+DOCUMENT = "# 仕様\n## 停止\n停止中に非常停止ボタンが押された場合の動作は定義しない。\n"
+
+
+@pytest.fixture
+def store(tmp_path):
+    return RunStore(tmp_path, "run-1")
+
+
+def test_save_and_load_round_trip(store):
+    key = content_hash("scan", "prompt", DOCUMENT)
+    store.save("scan", key, [{"id": "C-1", "status": "Suspected"}], viewpoint="vp")
+
+    assert store.load("scan", key) == [{"id": "C-1", "status": "Suspected"}]
+    assert (store.hits, store.saved) == (1, 1)
+    entry = json.loads((store.run_dir / "scan" / f"{key}.json").read_text("utf-8"))
+    assert entry["viewpoint"] == "vp"
+
+
+def test_changed_inputs_miss(store):
+    store.save("scan", content_hash("scan", "prompt", DOCUMENT), [])
+
+    edited = DOCUMENT + "追記\n"
+    assert store.load("scan", content_hash("scan", "prompt", edited)) is None
+    assert store.load("grounding", content_hash("scan", "prompt", DOCUMENT)) is None
+    assert store.hits == 0
+
+
+def test_falsy_results_are_reused(store):
+    store.save("scan", "k", [])
+    assert store.load("scan", "k") == []
+
+
+@pytest.mark.parametrize(
+    "content",
+    [b'{"step": "scan", "result": [', b"\xff\xfe\x00", b"[1, 2]", b'{"step": "scan"}'],
+)
+def test_corrupt_or_partial_files_are_ignored(store, content):
+    path = store.run_dir / "scan" / "k.json"
+    path.parent.mkdir(parents=True)
+    path.write_bytes(content)
+
+    assert store.load("scan", "k") is None
+    assert store.hits == 0
+
+
+def test_leftover_temp_files_are_not_loaded(store):
+    path = store.run_dir / "scan" / "k.json.123.456.tmp"
+    path.parent.mkdir(parents=True)
+    path.write_text(json.dumps({"result": ["stale"]}), encoding="utf-8")
+
+    assert store.load("scan", "k") is None
+
+
+def test_same_run_id_resumes(tmp_path, capsys):
+    first = RunStore(tmp_path, "run-1")
+    assert not first.resumed
+    first.start("spec.md", content_hash(DOCUMENT))
+
+    second = RunStore(tmp_path, "run-1")
+    assert second.resumed
+    second.start("spec.md", content_hash(DOCUMENT + "変更"))
+    assert "WARN" in capsys.readouterr().out
+
+
+def test_resume_skips_completed_steps(monkeypatch, tmp_path):
+    monkeypatch.setenv("LLM_PROVIDER", "openai")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_MODEL", "gpt-4o-mini")
+    monkeypatch.setenv("LLM_CACHE_ENABLED", "false")
+    section = {"title": "停止", "content": DOCUMENT}
+    candidate = {
+        "id": "C-1",
+        "status": "Suspected",
+        "target_text": "非常停止ボタンが押された場合の動作は定義しない",
+        "reason": "未定義の遷移",
+    }
+
+    def run():
+        calls = []
+
+        def fake_call(prompt, temperature=None, **kwargs):
+            calls.append(prompt)
+            if len(calls) == 1:
+                return json.dumps([candidate], ensure_ascii=False)
+            return json.dumps([{"key": "c1", "is_valid": True, "final_reason": "r"}])
+
+        reviewer = RequirementReviewer(run_store=RunStore(tmp_path, "run-1"))
+        reviewer.llm._call_llm_generic = fake_call
+        reviewer._grounding_index = None
+        defects = reviewer.review_section(DOCUMENT, section, "1_dead_ends")
+        return defects, calls, reviewer.run_store
+
+    defects, calls, store = run()
+    # Scan and falsification call the LLM; grounding matches locally
+    assert len(calls) == 2
+    assert store.saved == 3
+
+    resumed_defects, resumed_calls, resumed_store = run()
+    assert resumed_calls == []
+    assert resumed_store.hits == 3
+    assert resumed_defects == defects
@@ -0,0 +1,90 @@
+import pytest
+from src.infrastructure.section_chunker import SectionChunker
+from src.infrastructure.token_estimator import estimate_tokens
+
+BODY = "停止状態からの復帰条件を定義する。" * 20 + "\n"
+
+
+def large_document() -> str:
+    return "\n\n# Document: spec.md\n" + "".join(
+        f"## 状態 {i}\n" + BODY for i in range(40)
+    )
+
+
+def nested_document(extra: str = "") -> str:
+    return (
+        "# 仕様\n"
+        + "## 1. 概要\n"
+        + BODY
+        + "## 2. 状態遷移\n"
+        + "### 2.1 走行\n"
+        + BODY * 3
+        + "### 2.2 停止\n"
+        + extra
+        + BODY * 3
+        + "## 3. 付録\n"
+        + BODY
+    )
+
+
+def test_chunks_fit_budget_and_keep_document_header():
+    chunks = SectionChunker(1000).split(large_document())
+    assert len(chunks) > 1
+    assert all(c.tokens <= 1000 for c in chunks)
+    assert all("# Document: spec.md" in c.text for c in chunks)
+
+
+def test_document_header_survives_document_title():
+    # Real specs start with their own H1 right after the file header
+    text = "\n\n# Document: spec.md\n" + nested_document() * 2
+    chunks = SectionChunker(1000).split(text)
+    assert len(chunks) > 2
+    assert all(c.text.startswith("# Document: spec.md\n") for c in chunks)
+    assert all(c.path[0] == "Document: spec.md" for c in chunks)
+
+
+def test_each_document_keeps_its_own_header():
+    text = "".join(
+        f"\n\n# Document: {name}\n" + nested_document() for name in ("a.md", "b.md")
+    )
+    chunks = SectionChunker(1000).split(text)
+    headers = [c.text.split("\n", 1)[0] for c in chunks]
+    assert set(headers) == {"# Document: a.md", "# Document: b.md"}
+    assert headers == sorted(headers)
+
+
+def test_oversized_section_is_split_at_nested_headings():
+    text = nested_document()
+    chunks = SectionChunker(1200).split(text)
+    paths = [c.path for c in chunks]
+    assert ["仕様", "2. 状態遷移", "2.1 走行"] in paths
+    assert ["仕様", "2. 状態遷移", "2.2 停止"] in paths
+    # Chunks cut from inside a section carry the enclosing headings
+    stop = next(c for c in chunks if c.path[-1] == "2.2 停止")
+    assert stop.context == "# 仕様\n## 2. 状態遷移\n"
+    # Offsets point back into the original document
+    for c in chunks:
+        assert text[c.start : c.end] == c.content
+        assert estimate_tokens(c.text) <= 1200
+
+
+def test_chunk_ids_are_stable_across_unrelated_edits():
+    before = {c.title: c.id for c in SectionChunker(1200).split(nested_document())}
+    edited = nested_document(extra="追記された一文。\n")
+    after = {c.title: c.id for c in SectionChunker(1200).split(edited)}
+    assert before == after
+
+
+def test_overlap_repeats_tail_of_previous_chunk():
+    text = large_document()
+    chunks = SectionChunker(1000, overlap_tokens=200).split(text)
+    for previous, chunk in zip(chunks, chunks[1:]):
+        assert chunk.overlap_start < chunk.start
+        assert previous.start <= chunk.overlap_start
+        assert text[chunk.overlap_start : chunk.end] == chunk.content
+        assert chunk.tokens <= 1000
+
+
+def test_overlap_must_leave_room_for_content():
+    with pytest.raises(ValueError):
+        SectionChunker(1000, overlap_tokens=600)
@@ -0,0 +1,114 @@
+import asyncio
+import threading
+import time
+import pytest
+from src.infrastructure.single_flight import SingleFlight, AsyncSingleFlight
+
+
+def test_concurrent_callers_share_one_execution():
+    flight = SingleFlight()
+    executions = []
+    release = threading.Event()
+
+    def upstream():
+        executions.append(1)
+        release.wait(timeout=5)
+        return "result"
+
+    results = []
+
+    def caller():
+        results.append(flight.do("same-key", upstream))
+
+    threads = [threading.Thread(target=caller) for _ in range(5)]
+    for t in threads:
+        t.start()
+    # Let every follower attach before the leader finishes
+    while flight.stats()["coalesced"] < 4:
+        time.sleep(0.001)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert len(executions) == 1
+    assert sorted(results) == [("result", False)] + [("result", True)] * 4
+    assert flight.stats() == {"calls": 1, "coalesced": 4, "in_flight": 0}
+
+
+def test_errors_propagate_and_key_is_released():
+    flight = SingleFlight()
+
+    def failing():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        flight.do("k", failing)
+    assert flight.do("k", lambda: "ok") == ("ok", False)
+
+
+def test_async_callers_share_one_execution():
+    flight = AsyncSingleFlight()
+    executions = []
+
+    async def upstream():
+        executions.append(1)
+        await asyncio.sleep(0.01)
+        return "result"
+
+    async def run():
+        return await asyncio.gather(*[flight.do("k", upstream) for _ in range(3)])
+
+    results = asyncio.run(run())
+    assert len(executions) == 1
+    assert [r for r, _ in results] == ["result"] * 3
+    assert flight.stats()["coalesced"] == 2
+
+
+def test_cancelled_leader_hands_the_call_to_a_follower():
+    flight = AsyncSingleFlight()
+    executions = []
+
+    async def upstream():
+        executions.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def run():
+        leader = asyncio.create_task(flight.do("k", upstream))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(flight.do("k", upstream)) for _ in range(2)]
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await asyncio.gather(*followers)
+
+    results = asyncio.run(run())
+    assert sorted(results) == [("result", False), ("result", True)]
+    assert len(executions) == 2
+    assert flight.stats() == {"calls": 2, "coalesced": 1, "in_flight": 0}
+
+
+def test_async_instance_is_shared_across_event_loops():
+    flight = AsyncSingleFlight()
+    started = threading.Barrier(2)
+
+    async def upstream():
+        await asyncio.to_thread(started.wait, 5)
+        await asyncio.sleep(0.01)
+        return "result"
+
+    results = []
+
+    def caller():
+        results.append(asyncio.run(flight.do("k", upstream)))
+
+    threads = [threading.Thread(target=caller) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # Each loop runs its own call; neither waits on the other loop's future
+    assert results == [("result", False)] * 2
+    assert flight.stats() == {"calls": 2, "coalesced": 0, "in_flight": 0}
@@ -0,0 +1,216 @@
+import time
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+
+import pytest
+from src.application.interfaces import ConcurrentModificationError
+from src.domain.models import (
+    Defect,
+    DefectCategory,
+    Project,
+    ProjectConfig,
+    ProjectId,
+    Severity,
+    VerificationResult,
+)
+from src.infrastructure.repositories import FileProjectRepository
+from src.infrastructure.sqlite_repository import SqliteProjectRepository
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = SqliteProjectRepository(str(tmp_path / "projects.db"))
+    yield repo
+    repo.close()
+
+
+def make_project(pid, files=(), created_at=None):
+    return Project(
+        id=ProjectId(pid),
+        name=f"Project {pid}",
+        created_at=created_at or datetime(2024, 1, 1),
+        config=ProjectConfig(description="spec"),
+        input_files=list(files),
+    )
+
+
+def make_result(pid, timestamp, *defects):
+    return VerificationResult(
+        project_id=ProjectId(pid),
+        timestamp=timestamp,
+        summary=f"run at {timestamp}",
+        defects=[
+            Defect(
+                id=f"DEF-{i:03d}",
+                category=category,
+                severity=severity,
+                location="3.1",
+                description="",
+                recommendation="",
+            )
+            for i, (category, severity) in enumerate(defects, 1)
+        ],
+        raw_report="# Report",
+    )
+
+
+def test_project_round_trip(repo):
+    project = make_project("p1", ["b.md", "a.pdf"])
+    repo.save(project)
+    assert repo.find_by_id(ProjectId("p1")) == project
+
+    project.add_file("c.xlsx")
+    project.remove_file("b.md")
+    repo.save(project)
+    assert repo.find_by_id(ProjectId("p1")).input_files == ["a.pdf", "c.xlsx"]
+    assert repo.find_by_id(ProjectId("missing")) is None
+
+
+def test_list_and_delete(repo):
+    for i in range(3):
+        repo.save(make_project(f"p{i}", [f"{i}.md"], datetime(2024, 1, 3 - i)))
+    repo.save_result(ProjectId("p1"), make_result("p1", datetime(2024, 2, 1)))
+
+    assert [p.id for p in repo.list_projects()] == ["p2", "p1", "p0"]
+    repo.delete(ProjectId("p1"))
+    assert [p.id for p in repo.list_projects()] == ["p2", "p0"]
+    assert repo.list_results(ProjectId("p1")) == []
+    assert repo.find_defects(ProjectId("p1")) == []
+
+
+def test_result_history_and_defect_queries(repo):
+    repo.save(make_project("p1"))
+    first = make_result(
+        "p1",
+        datetime(2024, 3, 1),
+        (DefectCategory.DEAD_ENDS, Severity.CRITICAL),
+        (DefectCategory.CYCLES, Severity.MINOR),
+    )
+    second = make_result(
+        "p1", datetime(2024, 3, 2), (DefectCategory.DEAD_ENDS, Severity.MAJOR)
+    )
+    repo.save_result(ProjectId("p1"), first)
+    repo.save_result(ProjectId("p1"), second)
+
+    assert repo.list_results(ProjectId("p1")) == [second, first]
+    assert repo.list_results(ProjectId("p1"), limit=1) == [second]
+
+    dead_ends = repo.find_defects(ProjectId("p1"), category=DefectCategory.DEAD_ENDS)
+    assert [d.severity for d in dead_ends] == [Severity.MAJOR, Severity.CRITICAL]
+    critical = repo.find_defects(ProjectId("p1"), severity="Critical")
+    assert [d.id for d in critical] == ["DEF-001"]
+    assert repo.find_defects(ProjectId("p1"), latest_only=True) == second.defects
+
+
+def test_import_directory(tmp_path, repo):
+    source = FileProjectRepository(str(tmp_path / "old"))
+    source.save(make_project("p1", ["spec.md"]))
+    source.save_result(
+        ProjectId("p1"),
+        make_result(
+            "p1", datetime(2024, 4, 1), (DefectCategory.CYCLES, Severity.MINOR)
+        ),
+    )
+
+    assert repo.import_directory(str(tmp_path / "old")) == {
+        "projects": 1,
+        "results": 1,
+        "skipped": 0,
+    }
+    assert repo.find_by_id(ProjectId("p1")).input_files == ["spec.md"]
+    assert len(repo.find_defects(ProjectId("p1"))) == 1
+    assert repo.import_directory(str(tmp_path / "old"))["skipped"] == 1
+
+
+def test_concurrent_readers_and_writer(tmp_path, repo):
+    for i in range(50):
+        repo.save(make_project(f"p{i:02d}", ["a.md"]))
+    errors = []
+
+    def read():
+        reader = SqliteProjectRepository(repo.db_path)
+        try:
+            for _ in range(20):
+                assert len(reader.list_projects()) >= 50
+        except Exception as e:
+            errors.append(e)
+        finally:
+            reader.close()
+
+    def write():
+        try:
+            for i in range(20):
+                repo.save_result(
+                    ProjectId("p00"), make_result("p00", datetime(2024, 5, 1, 0, i))
+                )
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=read) for _ in range(4)]
+    threads.append(threading.Thread(target=write))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(repo.list_results(ProjectId("p00"))) == 20
+
+
+def test_listing_hundreds_of_projects_is_fast(repo):
+    base = datetime(2024, 1, 1)
+    for i in range(500):
+        repo.save(
+            make_project(f"p{i:03d}", ["a.md", "b.pdf"], base + timedelta(minutes=i))
+        )
+
+    started = time.perf_counter()
+    projects = repo.list_projects()
+    elapsed = time.perf_counter() - started
+
+    assert len(projects) == 500
+    assert elapsed < 0.1
+
+
+def test_stale_save_is_rejected(repo):
+    repo.save(make_project("p1"))
+    first = repo.find_by_id(ProjectId("p1"))
+    second = repo.find_by_id(ProjectId("p1"))
+
+    first.add_file("a.pdf")
+    repo.save(first)
+    second.add_file("b.pdf")
+
+    with pytest.raises(ConcurrentModificationError):
+        repo.save(second)
+    loaded = repo.find_by_id(ProjectId("p1"))
+    assert loaded.input_files == ["a.pdf"]
+    assert loaded.version == 2
+
+
+def test_stale_save_does_not_resurrect_deleted_project(repo):
+    repo.save(make_project("p1"))
+    stale = repo.find_by_id(ProjectId("p1"))
+    repo.delete(ProjectId("p1"))
+
+    stale.add_file("a.pdf")
+    with pytest.raises(ConcurrentModificationError):
+        repo.save(stale)
+    assert repo.find_by_id(ProjectId("p1")) is None
+
+
+def _open_and_save(db_path, pid):
+    repo = SqliteProjectRepository(db_path)
+    repo.save(make_project(pid))
+    repo.close()
+
+
+def test_processes_can_create_the_database_together(tmp_path):
+    db_path = str(tmp_path / "shared.db")
+    with ProcessPoolExecutor(4) as pool:
+        list(pool.map(_open_and_save, [db_path] * 4, [f"p{i}" for i in range(4)]))
+
+    repo = SqliteProjectRepository(db_path)
+    assert sorted(p.id for p in repo.list_projects()) == [f"p{i}" for i in range(4)]
+    repo.close()
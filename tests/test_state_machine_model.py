@@ -0,0 +1,119 @@
+from src.infrastructure.state_machine_model import (
+    TRUE,
+    conjoin,
+    model_from_dict,
+    negate,
+    parse_deadline_ms,
+    parse_duration_ms,
+    parse_guard,
+    solve,
+)
+
+
+def test_parse_guard_compound_conditions():
+    formula, delay = parse_guard("Battery SOC > 20% && Current position known")
+    assert formula == (
+        "and",
+        (
+            ("atom", ("num", "battery soc", ">", 20.0)),
+            ("atom", ("prop", "Current position known")),
+        ),
+    )
+    assert delay == 0.0
+
+    formula, delay = parse_guard("LDS distance < 1.0m for >= 300ms")
+    assert formula == ("atom", ("num", "lds distance", "<", 1.0))
+    assert delay == 300.0
+
+    formula, _ = parse_guard("NOT (Load sensor == ON) OR timeout >= 5s")
+    assert formula == (
+        "or",
+        (
+            ("not", ("atom", ("enum", "load sensor", "ON"))),
+            ("atom", ("num", "timeout", ">=", 5000.0)),
+        ),
+    )
+
+
+def test_parse_guard_fallbacks():
+    assert parse_guard(None) == (TRUE, 0.0)
+    assert parse_guard("always") == (TRUE, 0.0)
+    assert parse_guard("Charging station available (FMS confirmed)")[0] == (
+        "atom",
+        ("prop", "Charging station available (FMS confirmed)"),
+    )
+    # Unbalanced text is kept as a single proposition
+    assert parse_guard("a && (b")[0] == ("atom", ("prop", "a && (b"))
+
+
+def test_durations_and_deadlines():
+    assert parse_duration_ms("trigger_timeout_5min") == 300_000
+    assert parse_duration_ms("trigger_auth_success") == 0.0
+    assert parse_deadline_ms("Respond within 100ms") == 100
+    assert parse_deadline_ms("PIN入力から200ms以内に駆動") == 200
+    assert parse_deadline_ms("No timing requirement") is None
+
+
+def test_solver_numeric_and_symbolic_theories():
+    high, _ = parse_guard("Temp > 28.0")
+    low, _ = parse_guard("Temp < 24.0")
+    assert solve(conjoin([high, low])) is None
+    assert solve(conjoin([negate(high), negate(low)])) == {"temp": 26}
+
+    on, _ = parse_guard("sensor == ON")
+    off, _ = parse_guard("sensor == OFF")
+    assert solve(conjoin([on, off])) is None
+    assert solve(conjoin([negate(on), negate(off)])) == {"sensor": "not OFF/ON"}
+
+    assert solve(negate(TRUE)) is None
+    assert solve(TRUE) == {}
+
+
+def test_variables_are_keyed_on_the_whole_phrase():
+    door, _ = parse_guard("door sensor state == OPEN")
+    motor, _ = parse_guard("motor state == RUNNING")
+    assert solve(conjoin([door, motor])) == {
+        "door sensor state": "OPEN",
+        "motor state": "RUNNING",
+    }
+
+    same, _ = parse_guard("Door  Sensor-State == CLOSED")
+    assert solve(conjoin([door, same])) is None
+
+
+def test_solver_results_are_not_shared():
+    guard, _ = parse_guard("x > 1")
+    solve(guard)["x"] = -5
+    assert solve(guard) == {"x": 2}
+
+
+def test_solver_excludes_boundary_values():
+    guard, _ = parse_guard("x >= 1 && x <= 2 && x != 1 && x != 2")
+    witness = solve(guard)
+    assert 1 < witness["x"] < 2
+
+
+def test_model_from_state_transition_format():
+    model = model_from_dict(
+        {
+            "state_transition": {
+                "states": ["Idle", "Run", "Error"],
+                "transitions": [
+                    {"src": "Idle", "tgt": "Run", "event": "go", "condition": "x > 1"},
+                    {"src": "*", "tgt": "Error", "event": "fault"},
+                ],
+            },
+            "system_action": [
+                {"trigger": "State_Enter_Error", "action": "LED_RED_ON"},
+                {"trigger": "fault", "action": "BUZZER_ON"},
+            ],
+        }
+    )
+    assert model.machines == {"system": ["Idle", "Run", "Error"]}
+    assert model.initial == {"system": "Idle"}
+    assert [repr(t) for t in model.outgoing("system", "Run", "fault")] == [
+        "Run --fault--> Error"
+    ]
+    assert model.entry_outputs[("system", "Error")] == [("LED_RED_ON", TRUE)]
+    assert model.event_outputs["fault"] == [("BUZZER_ON", TRUE)]
+    assert model.group_of("LED_RED_ON") == model.group_of("LED_GREEN_BLINK")
@@ -0,0 +1,41 @@
+import json
+from src.infrastructure.streaming_json import IncrementalDefectParser
+
+RESPONSE = """<think>maybe {not json}</think>
+```json
+{
+  "summary": "2 defects, one mentions \\"defects\\": [ {braces} ]",
+  "defects": [
+    {"id": "DEF-001", "category": "Dead Ends", "description": "Error has no exit {}"},
+    {"id": "DEF-002", "category": "Cycles", "nested": {"a": [1, 2]}}
+  ]
+}
+```"""
+
+
+def test_defects_are_emitted_as_soon_as_they_close():
+    parser = IncrementalDefectParser()
+    emitted_at = []
+    for i, ch in enumerate(RESPONSE):
+        for defect in parser.feed(ch):
+            emitted_at.append((i, defect["id"]))
+
+    assert [d for _, d in emitted_at] == ["DEF-001", "DEF-002"]
+    # The first defect is available before the second one has even started
+    first_pos, _ = emitted_at[0]
+    assert first_pos < RESPONSE.index('"DEF-002"')
+
+
+def test_whole_response_in_one_chunk():
+    parser = IncrementalDefectParser()
+    defects = parser.feed(RESPONSE)
+    assert defects[1]["nested"] == {"a": [1, 2]}
+
+
+def test_truncated_stream_keeps_completed_items():
+    payload = json.dumps(
+        {"summary": "s", "defects": [{"id": "A"}, {"id": "B"}]}, ensure_ascii=False
+    )
+    parser = IncrementalDefectParser()
+    defects = parser.feed(payload[: payload.index('{"id": "B"') + 5])
+    assert [d["id"] for d in defects] == ["A"]
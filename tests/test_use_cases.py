@@ -0,0 +1,224 @@
+import time
+import threading
+from datetime import datetime
+
+import pytest
+from src.application.interfaces import (
+    AnalysisProgressCallback,
+    FileContentProvider,
+    ProjectRepository,
+)
+from src.application.use_cases import VerifyRequirementsUseCase
+from src.domain.interfaces import LLMGateway
+from src.domain.models import Project, ProjectConfig, ProjectId
+
+
+class InMemoryRepository(ProjectRepository):
+    def __init__(self, project):
+        self.project = project
+        self.results = []
+
+    def save(self, project):
+        self.project = project
+
+    def find_by_id(self, id):
+        return self.project if self.project.id == id else None
+
+    def save_result(self, project_id, result):
+        self.results.append(result)
+
+    def list_projects(self):
+        return [self.project]
+
+    def delete(self, project_id):
+        pass
+
+
+class EchoGateway(LLMGateway):
+    def __init__(self):
+        self.texts = []
+
+    def verify_requirements(self, text):
+        self.texts.append(text)
+        return {"summary": "ok", "defects": []}
+
+    def call_llm_with_system(self, system_prompt, user_prompt):
+        return ""
+
+
+class SlowProvider(FileContentProvider):
+    """Reads files after a per-file delay and records how many reads overlap."""
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.active = 0
+        self.peak = 0
+        self.flushes = 0
+        self.lock = threading.Lock()
+
+    def flush(self):
+        self.flushes += 1
+
+    def read_text(self, file_path):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delays.get(file_path, 0.0))
+            with open(file_path, "r", encoding="utf-8") as f:
+                return f.read()
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+class RecordingCallback(AnalysisProgressCallback):
+    def __init__(self):
+        self.logs = []
+        self.threads = set()
+
+    def on_progress(self, step, percentage):
+        pass
+
+    def on_log(self, message):
+        self.threads.add(threading.get_ident())
+        self.logs.append(message)
+
+
+def make_project(tmp_path, contents):
+    paths = []
+    for i, content in enumerate(contents):
+        path = tmp_path / f"doc{i}.md"
+        path.write_text(content, encoding="utf-8")
+        paths.append(str(path))
+    project = Project(
+        id=ProjectId("p1"),
+        name="test",
+        created_at=datetime.now(),
+        config=ProjectConfig(),
+        input_files=paths,
+    )
+    return project, paths
+
+
+def test_files_are_read_concurrently_in_input_order(tmp_path):
+    project, paths = make_project(tmp_path, [f"content {i}" for i in range(6)])
+    provider = SlowProvider({p: 0.05 * (6 - i) for i, p in enumerate(paths)})
+    gateway = EchoGateway()
+    use_case = VerifyRequirementsUseCase(
+        InMemoryRepository(project), gateway, provider, max_workers=6
+    )
+
+    use_case.execute(ProjectId("p1"))
+
+    assert gateway.texts == [
+        "".join(f"\n\n# Document: doc{i}.md\ncontent {i}" for i in range(6))
+    ]
+    assert provider.peak > 1
+    assert provider.flushes == 1
+
+
+def test_unreadable_files_are_logged_and_skipped(tmp_path):
+    project, paths = make_project(tmp_path, ["first", "second"])
+    project.input_files.insert(1, str(tmp_path / "missing.md"))
+    gateway = EchoGateway()
+    callback = RecordingCallback()
+    use_case = VerifyRequirementsUseCase(
+        InMemoryRepository(project), gateway, SlowProvider({})
+    )
+
+    result = use_case.execute(ProjectId("p1"), callback)
+
+    assert "missing.md" in result.raw_report
+    assert any(m.startswith("Error reading missing.md") for m in callback.logs)
+    assert callback.threads == {threading.get_ident()}
+
+
+def test_per_file_limit_fails_before_reading(tmp_path):
+    project, _ = make_project(tmp_path, ["small", "x" * 2000])
+    provider = SlowProvider({})
+    use_case = VerifyRequirementsUseCase(
+        InMemoryRepository(project), EchoGateway(), provider, max_file_bytes=1000
+    )
+
+    with pytest.raises(ValueError, match="doc1.md .* per-file limit"):
+        use_case.execute(ProjectId("p1"))
+    assert provider.peak == 0
+
+
+def test_total_limit(tmp_path):
+    project, _ = make_project(tmp_path, ["x" * 600, "y" * 600])
+    use_case = VerifyRequirementsUseCase(
+        InMemoryRepository(project),
+        EchoGateway(),
+        SlowProvider({}),
+        max_total_bytes=1000,
+    )
+
+    with pytest.raises(ValueError, match="total .* over the limit"):
+        use_case.execute(ProjectId("p1"))
+
+
+def test_total_limit_applies_to_converted_text(tmp_path):
+    class ExpandingProvider(FileContentProvider):
+        def read_text(self, file_path):
+            return "cell | " * 1000
+
+    project, _ = make_project(tmp_path, ["a", "b"])
+    use_case = VerifyRequirementsUseCase(
+        InMemoryRepository(project),
+        EchoGateway(),
+        ExpandingProvider(),
+        max_total_bytes=10_000,
+    )
+
+    with pytest.raises(ValueError, match="after reading doc1.md"):
+        use_case.execute(ProjectId("p1"))
+
+
+def test_total_limit_counts_utf8_bytes_of_converted_text(tmp_path):
+    class CjkProvider(FileContentProvider):
+        def read_text(self, file_path):
+            # 1,000 characters but 3,000 bytes
+            return "仕" * 1000
+
+    project, _ = make_project(tmp_path, ["a"])
+    use_case = VerifyRequirementsUseCase(
+        InMemoryRepository(project),
+        EchoGateway(),
+        CjkProvider(),
+        max_total_bytes=2000,
+    )
+
+    with pytest.raises(ValueError, match="after reading doc0.md"):
+        use_case.execute(ProjectId("p1"))
+
+
+def test_invalid_streamed_defect_is_skipped_not_fatal(tmp_path):
+    good = {"id": "DEF-002", "category": "Dead Ends", "severity": "Major"}
+
+    class StreamingGateway(EchoGateway):
+        def verify_requirements_stream(self, text, on_token=None, on_defect=None):
+            on_defect({"id": "DEF-001", "category": "Not a category"})
+            on_defect(good)
+            return {"summary": "ok", "defects": [good]}
+
+    class DefectCallback(RecordingCallback):
+        def __init__(self):
+            super().__init__()
+            self.defects = []
+
+        def on_defect(self, defect):
+            self.defects.append(defect)
+
+    project, _ = make_project(tmp_path, ["spec"])
+    callback = DefectCallback()
+    use_case = VerifyRequirementsUseCase(
+        InMemoryRepository(project), StreamingGateway(), SlowProvider({})
+    )
+
+    result = use_case.execute(ProjectId("p1"), callback)
+
+    assert [d.id for d in callback.defects] == ["DEF-002"]
+    assert [d.id for d in result.defects] == ["DEF-002"]
+    assert any("Skipping invalid defect DEF-001" in log for log in callback.logs)
@@ -0,0 +1,90 @@
+import json
+import pytest
+from src.infrastructure.llm_gateway import LLMGatewayImpl
+from src.infrastructure.token_estimator import context_window
+
+SECTION = "## 状態 {i}\n" + "停止状態からの復帰条件を定義する。" * 20 + "\n"
+
+
+@pytest.fixture
+def gateway(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "openai")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_MODEL", "gpt-4o-mini")
+    monkeypatch.setenv("LLM_CACHE_ENABLED", "false")
+    monkeypatch.setenv("LLM_MAX_INPUT_TOKENS", "4000")
+    return LLMGatewayImpl()
+
+
+def large_document() -> str:
+    return "\n\n# Document: spec.md\n" + "".join(SECTION.format(i=i) for i in range(40))
+
+
+def test_every_chunk_keeps_document_header(gateway):
+    text = "\n\n# Document: spec.md\n# 仕様\n" + "".join(
+        SECTION.format(i=i) for i in range(40)
+    )
+    chunks = gateway._plan_verification(text)
+    assert len(chunks) > 1
+    assert all(c.startswith("# Document: spec.md\n") for c in chunks)
+
+
+def test_context_window_matches_vendor_prefixed_names():
+    assert context_window("openai/gpt-oss-120b:free") == 131_072
+    assert context_window("gpt-4o-mini") == 128_000
+
+
+def test_small_document_is_a_single_call(gateway):
+    estimate = gateway.estimate_verification("short spec")
+    assert estimate["chunks"] == 1
+    assert estimate["calls"] == 1
+    assert estimate["estimated_cost_usd"] > 0
+
+
+def test_large_document_is_verified_map_reduce(gateway):
+    prompts = []
+
+    def fake_provider(system_prompt, user_prompt, temperature):
+        prompts.append(user_prompt)
+        if "統合タスク" in user_prompt:
+            return json.dumps(
+                {"summary": "merged", "defects": [{"id": "DEF-001"}]},
+                ensure_ascii=False,
+            )
+        return json.dumps(
+            {
+                "summary": "chunk",
+                "defects": [{"id": "DEF-001", "category": "Dead Ends"}],
+            }
+        )
+
+    gateway._call_remote = fake_provider
+    text = large_document()
+    chunks = gateway.estimate_verification(text)["chunks"]
+    assert chunks > 1
+
+    result = gateway.verify_requirements(text)
+    # One call per chunk plus the merge pass
+    assert len(prompts) == chunks + 1
+    assert result == {"summary": "merged", "defects": [{"id": "DEF-001"}]}
+
+
+def test_unparseable_merge_falls_back_to_local_merge(gateway):
+    calls = []
+
+    def fake_provider(system_prompt, user_prompt, temperature):
+        calls.append(user_prompt)
+        if "統合タスク" in user_prompt:
+            return "not json"
+        defects = [
+            {"id": "DEF-001", "description": "same everywhere"},
+            {"id": "DEF-002", "description": f"chunk {len(calls)}"},
+        ]
+        return json.dumps({"summary": "chunk", "defects": defects})
+
+    gateway._call_remote = fake_provider
+    result = gateway.verify_requirements(large_document())
+    ids = [d["id"] for d in result["defects"]]
+    # Exact duplicates across chunks collapse, chunk-specific defects stay
+    assert ids[:3] == ["C1-DEF-001", "C1-DEF-002", "C2-DEF-002"]
+    assert "C2-DEF-001" not in ids